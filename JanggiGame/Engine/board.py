@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+from array import array
 from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
-from piece import PieceCategory
-from utils import Point2D
+from helpers import AttackMap, Bitboard, Mailbox, PieceIndex, ZobristHash
+from piece import PieceColor
+from utils import MOVE_SQUARE_BITS, MOVE_SQUARE_MASK, Point2D
 from utils import Rectangle
 
+# Initial capacity of the undo arrays used by make/unmake; they grow if a line is ever deeper than this.
+UNDO_CAPACITY: int = 256
+
+# Bit offset of the captured piece id within an undo record (after the packed move).
+CAPTURE_SHIFT: int = 2 * MOVE_SQUARE_BITS
+
 if TYPE_CHECKING:
-    from piece import JanggiPiece, PieceColor
+    from piece import JanggiPiece, PieceCategory
 
 
 class JanggiBoard:
     """
     Represents a Janggi game board, where a coordinate map holds the position of each Piece, and updates can be made
     to the map to reflect moves. Also holds the coordinates of the palaces and game board for a given game.
+
+    The coordinate map is backed by a 90-square Mailbox; board operations index its squares directly, while the
+    coord_map property still supports lookups by (x, y) tuple. A Bitboard observes the mailbox to provide occupancy and
+    attack masks, a PieceIndex keeps piece lists by color and category, an AttackMap keeps the attackers of queried
+    squares up to date, and a ZobristHash keeps a 64-bit hash of the position, including the side to move.
     """
 
     def __init__(self,
@@ -30,13 +43,29 @@ class JanggiBoard:
         :param boundaries: Represents the board boundaries.
         """
 
-        self.__coord_map: Dict[Tuple[int, int], JanggiPiece] = coord_map
+        self.__coord_map: Mailbox = coord_map if isinstance(coord_map, Mailbox) else Mailbox(coord_map)
         self.__blue_palace: Rectangle = blue_palace
         self.__red_palace: Rectangle = red_palace
         self.__boundaries: Rectangle = boundaries
+        self.__bitboard: Bitboard = Bitboard(self.__coord_map, blue_palace, red_palace)
+        self.__piece_index: PieceIndex = PieceIndex(self.__coord_map)
+        self.__attack_map: AttackMap = AttackMap(self.__coord_map, self.__bitboard)
+        self.__zobrist: ZobristHash = ZobristHash(self.__coord_map)
+        self.__turn: PieceColor = PieceColor.BLUE
+
+        # Pieces are identified by a small integer in undo records; id 0 means no piece.
+        self.__pieces: List[Optional[JanggiPiece]] = [None]
+        self.__piece_ids: Dict[int, int] = dict()
+
+        for piece in self.__coord_map.occupants():
+            self.piece_id(piece)
+
+        self.__ply: int = 0
+        self.__undo_records: array = array("l", [0]) * UNDO_CAPACITY
+        self.__undo_hashes: array = array("Q", [0]) * UNDO_CAPACITY
 
     @property
-    def coord_map(self) -> Dict[Tuple[int, int], JanggiPiece]:
+    def coord_map(self) -> Mailbox:
         return self.__coord_map
 
     @property
@@ -51,6 +80,128 @@ class JanggiBoard:
     def boundaries(self) -> Rectangle:
         return self.__boundaries
 
+    @property
+    def bitboard(self) -> Bitboard:
+        return self.__bitboard
+
+    @property
+    def piece_index(self) -> PieceIndex:
+        return self.__piece_index
+
+    @property
+    def attack_map(self) -> AttackMap:
+        return self.__attack_map
+
+    @property
+    def zobrist(self) -> ZobristHash:
+        return self.__zobrist
+
+    @property
+    def position_hash(self) -> int:
+        """Return the 64-bit Zobrist hash of the position, covering piece placement and the side to move."""
+
+        return self.__zobrist.value
+
+    @property
+    def turn(self) -> PieceColor:
+        return self.__turn
+
+    @turn.setter
+    def turn(self, value: PieceColor) -> None:
+        if value is not self.__turn:
+            self.__zobrist.toggle_side()
+
+        self.__turn = value
+
+    @property
+    def ply(self) -> int:
+        """Return the number of moves made with make() that have not been unmade."""
+
+        return self.__ply
+
+    def piece_id(self, piece: JanggiPiece) -> int:
+        """
+        Return the small integer identifying a piece in undo records, registering the piece if needed.
+
+        :param piece: Piece object.
+        :return: Piece id (1 or greater).
+        """
+
+        piece_id: Optional[int] = self.__piece_ids.get(id(piece))
+
+        if piece_id is None:
+            piece_id = len(self.__pieces)
+            self.__pieces.append(piece)
+            self.__piece_ids[id(piece)] = piece_id
+
+        return piece_id
+
+    def hash_before(self, ply: int) -> int:
+        """
+        Return the hash of the position in which the move at a given ply was made.
+
+        :param ply: Ply in the range [0, self.ply).
+        :return: 64-bit Zobrist hash.
+        """
+
+        return self.__undo_hashes[ply]
+
+    def make(self, move: int) -> None:
+        """
+        Make a packed move and pass the turn, recording what is needed to unmake it.
+
+        Does not validate the move. A move whose source and destination are equal only passes the turn.
+
+        :param move: Packed move (see utils.encode_move).
+        """
+
+        source: int = move & MOVE_SQUARE_MASK
+        destination: int = move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
+        ply: int = self.__ply
+        captured: int = 0
+
+        if ply == len(self.__undo_records):
+            self.__undo_records.extend(array("l", [0]) * ply)
+            self.__undo_hashes.extend(array("Q", [0]) * ply)
+
+        self.__undo_hashes[ply] = self.__zobrist.value
+
+        if source != destination:
+            piece: Optional[JanggiPiece] = self.__coord_map.set_square(source, None)
+
+            if piece is None:
+                raise KeyError(source)
+
+            victim: Optional[JanggiPiece] = self.__coord_map.set_square(destination, piece)
+            piece.position = Point2D.from_square(destination)
+
+            if victim is not None:
+                captured = self.piece_id(victim)
+
+        self.__undo_records[ply] = move | captured << CAPTURE_SHIFT
+        self.__ply = ply + 1
+        self.turn = self.__turn.opponent
+
+    def unmake(self) -> None:
+        """Unmake the last move made with make(), restoring any captured piece and the turn."""
+
+        ply: int = self.__ply - 1
+
+        if ply < 0:
+            raise IndexError("no move to unmake")
+
+        record: int = self.__undo_records[ply]
+        source: int = record & MOVE_SQUARE_MASK
+        destination: int = record >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
+
+        if source != destination:
+            piece: JanggiPiece = self.__coord_map.set_square(destination, self.__pieces[record >> CAPTURE_SHIFT])
+            self.__coord_map.set_square(source, piece)
+            piece.position = Point2D.from_square(source)
+
+        self.__ply = ply
+        self.turn = self.__turn.opponent
+
     def move(self, source: Point2D, destination: Point2D) -> None:
         """
         Move a piece from source coordinate to destination coordinate.
@@ -71,23 +222,36 @@ class JanggiBoard:
         Used during initialization as players can transpose their horse and elephants before game start.
         """
 
-        piece_a: JanggiPiece = self.coord_map.get(position_a.to_tuple())
-        piece_b: JanggiPiece = self.coord_map.get(position_b.to_tuple())
-        self.coord_map[position_b.to_tuple()] = piece_a
-        self.coord_map[position_a.to_tuple()] = piece_b
+        square_a: int = position_a.square
+        square_b: int = position_b.square
+
+        piece_a: Optional[JanggiPiece] = self.coord_map.set_square(square_a, None)
+        piece_b: Optional[JanggiPiece] = self.coord_map.set_square(square_b, piece_a)
+        self.coord_map.set_square(square_a, piece_b)
+
+        # Keep the pieces' positions in step with the squares they now occupy.
+        if piece_a is not None:
+            piece_a.position = position_b
+
+        if piece_b is not None:
+            piece_b.position = position_a
 
     def update_coord_map(self, source: Point2D, destination: Point2D) -> None:
         """
         Updates the coordinate map to reflect a piece moving from a source to a destination coordinate.
 
-        Overwrites/adds new key-value pair with the destination as the key and Piece as the value.
-        Then deletes the source-key from map.
+        Empties the source square and places its Piece on the destination square, replacing any occupant.
 
         :param source: Source coordinate.
         :param destination: Destination coordinate.
         """
 
-        self.coord_map[destination.to_tuple()] = self.coord_map.pop(source.to_tuple())
+        piece: Optional[JanggiPiece] = self.coord_map.set_square(source.square, None)
+
+        if piece is None:
+            raise KeyError(source.to_tuple())
+
+        self.coord_map.set_square(destination.square, piece)
 
     def update_piece_position(self, position: Point2D) -> None:
         """
@@ -96,7 +260,7 @@ class JanggiBoard:
         :param position: New coordinate.
         """
 
-        self.coord_map[position.to_tuple()].position = position
+        self.coord_map.get_square(position.square).position = position
 
     def is_inside_palace(self, piece: JanggiPiece):
         """
@@ -110,28 +274,26 @@ class JanggiBoard:
 
     def search(self, color: PieceColor, category_filter: PieceCategory = None) -> List[Optional[JanggiPiece]]:
         """
-        Given a color and (optionally a category filter), searches coordinate map and returns all matches.
+        Given a color and (optionally a category filter), returns all matching pieces on the board.
+
+        Reads the piece index rather than scanning the coordinate map.
 
         :param color: Piece color attribute.
         :param category_filter: Piece category attribute to filter on.
         :return: A list of Piece objects or an empty list if no matches found.
         """
 
-        matches: List[Optional[JanggiPiece]] = list()
-
-        for piece in self.coord_map.values():
-            if piece.color == color:
+        return list(self.piece_index.pieces(color, category_filter).values())
 
-                # Filtering on category is disabled; so add any pieces that have the same color attribute.
-                if category_filter is None:
-                    matches.append(piece)
-                    continue
+    def general(self, color: PieceColor) -> Optional[JanggiPiece]:
+        """
+        Return a player's General.
 
-                # Filtering on category is enabled; so only add pieces that have the same color and category attributes.
-                if piece.category == category_filter:
-                    matches.append(piece)
+        :param color: Piece color attribute.
+        :return: The General, or None if it is not on the board.
+        """
 
-        return matches
+        return self.piece_index.general(color)
 
     def find_path(self, source: Point2D, destination: Point2D) -> Optional[List[Point2D]]:
         """
@@ -143,7 +305,7 @@ class JanggiBoard:
         :return: List of coordinates going from source to destination, or an empty list if no path exists.
         """
 
-        piece: JanggiPiece = self.coord_map[source.to_tuple()]
+        piece: JanggiPiece = self.coord_map.get_square(source.square)
         in_palace: bool = self.is_inside_palace(piece)
 
         path_generator: Iterator[List[Point2D]] = piece.generate_path(source=source, in_palace=in_palace)
@@ -166,19 +328,20 @@ class JanggiBoard:
         :return: True if the path is free of obstacles, False otherwise.
         """
 
-        piece: JanggiPiece = self.coord_map[path[0].to_tuple()]
+        squares: List[Optional[JanggiPiece]] = self.coord_map.squares
+        piece: JanggiPiece = squares[path[0].square]
         in_palace: bool = self.is_inside_palace(piece)
         path_objects: List[Optional[JanggiPiece]] = list()
 
         # Examine each point along the path for any pieces.
         for coord in path:
+            square: int = coord.square
 
             # Only consider coordinates within the board boundaries.
-            if coord not in self.boundaries:
+            if square < 0:
                 return True
 
-            obj = self.coord_map.get(coord.to_tuple())
-            path_objects.append(obj)
+            path_objects.append(squares[square])
 
         # Examine the objects on the path to determine if they can be traversed.
         # Note that the palace walls are considered as virtual obstacles.
@@ -200,11 +363,8 @@ class JanggiBoard:
         for piece in list(pieces):
             in_palace = self.is_inside_palace(piece)
 
-            # Generate all paths for single piece.
-            piece_paths = list(piece.generate_path(source=piece.position, in_palace=in_palace))
-
             # Keep the paths that can be traversed.
-            for path in piece_paths:
+            for path in piece.generate_path(source=piece.position, in_palace=in_palace):
                 if not self.find_obstacles(path):
                     paths.append(path)
 
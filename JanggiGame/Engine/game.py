@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import enum
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from board import JanggiBoard
 from piece import JanggiPiece, PieceCategory, PieceColor
-from helpers import CommandManager, MoveCommand, Stack, IllegalDestinationStrategy, IllegalPathStrategy, \
-    InsidePalaceStrategy, BranchPathStrategy, LinearDiagonalPathStrategy, LinearPathStrategy
-from utils import Point2D, Rectangle
+from helpers import CommandManager, MoveCommand, MoveGenerator, PieceFactory, Stack
+from helpers.notation import STARTING_POSITION, format_position, parse_position
+from utils import Point2D, Rectangle, encode_move, move_destination, to_coordinates
 
 if TYPE_CHECKING:
     from helpers.command import ICommand
@@ -27,10 +27,13 @@ class JanggiGame:
 
     # region Constructor
 
-    def __init__(self) -> None:
+    def __init__(self, position: Optional[str] = None) -> None:
         """
         Initializes an instance of the JanggiGame object. Symbolizes the creation of a new game.
 
+        The game starts from the standard setup, or from any position given in position notation (see
+        helpers.notation).
+
         The class constructor performs the following actions:
             1. Set _game_state to UNFINISHED.
             2. Create a JanggiBoard instance to store Piece objects by their coordinate positions, including palaces
@@ -40,32 +43,37 @@ class JanggiGame:
             4. Create Rectangle objects holding palace coordinates and board boundaries and assign them to the
                JanggiBoard instance.
             5. Create a CommandManger object to allow undoing/redoing moves.
-            6. Initialize the starting player's turn to BLUE.
+            6. Initialize the starting player's turn, BLUE unless the position says otherwise (the turn is held by
+               the board, as it is part of the position's hash).
+
+        Calls __setup() to perform tasks 3, 4 and 6.
 
-        Calls __setup() to perform tasks 3 and 4.
+        :param position: Optional position notation to start from instead of the standard setup.
         """
 
         self.__game_state: GameState = GameState.UNFINISHED
-        self.__player_turn: PieceColor = PieceColor.BLUE
         self.__command_manager: CommandManager = CommandManager(undo_stack=Stack(), redo_stack=Stack())
         self.__board: Optional[JanggiBoard] = None
-        self.__setup()
+        self.__setup(STARTING_POSITION if position is None else position)
+        self.__move_generator: MoveGenerator = MoveGenerator(self.__board)
 
-    def __setup(self) -> None:
+    def __setup(self, position: str) -> None:
         """
         Called by constructor to aid in game setup.
 
         Initializes board pieces, board boundaries, and both palaces. Then assigns them to a new JanggiBoard instance
         that can be accessed as a class attribute.
+
+        :param position: Position notation of the starting position.
         """
 
-        params = dict()
+        placements, turn = parse_position(position)
 
         # Create game palaces.
         blue_palace, red_palace = self.__create_palaces()
 
         # Create and configure game pieces.
-        pieces = self.__create_pieces()
+        pieces = self.__create_pieces(placements)
 
         # Place pieces on the game board.
         coord_map = self.__create_coord_map(pieces)
@@ -75,116 +83,23 @@ class JanggiGame:
 
         # Create new JanggiBoard instance using the parameters created above.
         self.__board = JanggiBoard(coord_map, blue_palace, red_palace, boundaries)
+        self.__board.turn = turn
 
-    def __create_pieces(self) -> List[JanggiPiece]:
+    def __create_pieces(self, placements: List[Tuple[PieceColor, PieceCategory, Point2D]]) -> List[JanggiPiece]:
         """
         Called during the constructor step.
 
-        Creates and configures Piece objects for all board pieces for both blue and red players and returns the Piece
+        Creates and configures Piece objects for every placement of the starting position and returns the Piece
         objects as a list to the caller.
 
-        Piece objects have their path and move strategies configured during this step. These strategies are later
-        used by the game to create paths and detect obstacles within them.
-
-        Each Piece is configured with a color, category, position, custom path strategy instance, and a custom move
-        strategy instance. The parameters for the strategy instances are configured for the different Piece categories
-        and occasionally Piece colors.
+        Piece objects have their path and move strategies configured by a PieceFactory during this step. These
+        strategies are later used by the game to create paths and detect obstacles within them.
 
+        :param placements: List of (color, category, position) tuples describing the starting position.
         :return: A list of Piece objects configured for a new game.
         """
 
-        # Configure path and move strategies for the different piece types/colors.
-        chariot_cannon_path_strategy = dict(
-            default=LinearPathStrategy(step_range=(1, 10), x_magnitudes={0, 1}, y_magnitudes={-1, 1}),
-            palace=LinearDiagonalPathStrategy(
-                step_range=(1, 10), x_magnitudes={-1, 0, 1}, y_magnitudes={-1, 0, 1}, diag_limit=2
-            )
-        )
-        horse_path_strategy = dict(
-            default=BranchPathStrategy(
-                step_range=(1, 2), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1}
-            ),
-            palace=BranchPathStrategy(step_range=(1, 2), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1})
-        )
-        elephant_path_strategy = dict(
-            default=BranchPathStrategy(
-                step_range=(2, 3), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1}
-            ),
-            palace=BranchPathStrategy(step_range=(2, 3), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1})
-        )
-        blue_soldier_path_strategy = dict(
-            default=LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={1}),
-            palace=LinearDiagonalPathStrategy(
-                step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={0, 1}, diag_limit=1
-            )
-        )
-        red_soldier_path_strategy = dict(
-            default=LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={-1}),
-            palace=LinearDiagonalPathStrategy(
-                step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={0, -1}, diag_limit=1
-            )
-        )
-        general_guard_path_strategy = dict(
-            default=None,
-            palace=LinearDiagonalPathStrategy(
-                step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={-1, 0, 1}, diag_limit=1
-            )
-        )
-        default_obstacle_strategy = dict(
-            destination=IllegalDestinationStrategy(),
-            path=IllegalPathStrategy(),
-            palace=InsidePalaceStrategy()
-        )
-        horse_elephant_obstacle_strategy = dict(
-            destination=IllegalDestinationStrategy(),
-            path=IllegalPathStrategy(),
-            palace=None
-        )
-
-        cc_strat = [chariot_cannon_path_strategy, default_obstacle_strategy]
-        elephant_strat = [elephant_path_strategy, horse_elephant_obstacle_strategy]
-        horse_strat = [horse_path_strategy, horse_elephant_obstacle_strategy]
-        gg_strat = [general_guard_path_strategy, default_obstacle_strategy]
-        b_soldier_strat = [blue_soldier_path_strategy, default_obstacle_strategy]
-        r_soldier_strat = [red_soldier_path_strategy, default_obstacle_strategy]
-
-        # Initialize the pieces.
-        pieces = [
-            JanggiPiece(PieceColor.BLUE, PieceCategory.CHARIOT, Point2D(0, 0), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.CHARIOT, Point2D(8, 0), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.CHARIOT, Point2D(0, 9), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.CHARIOT, Point2D(8, 9), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.ELEPHANT, Point2D(1, 0), elephant_strat[0], elephant_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.ELEPHANT, Point2D(6, 0), elephant_strat[0], elephant_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.ELEPHANT, Point2D(1, 9), elephant_strat[0], elephant_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.ELEPHANT, Point2D(6, 9), elephant_strat[0], elephant_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.HORSE, Point2D(2, 0), horse_strat[0], horse_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.HORSE, Point2D(7, 0), horse_strat[0], horse_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.HORSE, Point2D(2, 9), horse_strat[0], horse_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.HORSE, Point2D(7, 9), horse_strat[0], horse_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.CANNON, Point2D(1, 2), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.CANNON, Point2D(7, 2), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.CANNON, Point2D(1, 7), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.CANNON, Point2D(7, 7), cc_strat[0], cc_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.GUARD, Point2D(3, 0), gg_strat[0], gg_strat[1], True),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.GUARD, Point2D(5, 0), gg_strat[0], gg_strat[1], True),
-            JanggiPiece(PieceColor.RED, PieceCategory.GUARD, Point2D(3, 9), gg_strat[0], gg_strat[1], True),
-            JanggiPiece(PieceColor.RED, PieceCategory.GUARD, Point2D(5, 9), gg_strat[0], gg_strat[1], True),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.SOLDIER, Point2D(0, 3), b_soldier_strat[0], b_soldier_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.SOLDIER, Point2D(2, 3), b_soldier_strat[0], b_soldier_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.SOLDIER, Point2D(4, 3), b_soldier_strat[0], b_soldier_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.SOLDIER, Point2D(6, 3), b_soldier_strat[0], b_soldier_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.SOLDIER, Point2D(8, 3), b_soldier_strat[0], b_soldier_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.SOLDIER, Point2D(0, 6), r_soldier_strat[0], r_soldier_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.SOLDIER, Point2D(2, 6), r_soldier_strat[0], r_soldier_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.SOLDIER, Point2D(4, 6), r_soldier_strat[0], r_soldier_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.SOLDIER, Point2D(6, 6), r_soldier_strat[0], r_soldier_strat[1]),
-            JanggiPiece(PieceColor.RED, PieceCategory.SOLDIER, Point2D(8, 6), r_soldier_strat[0], r_soldier_strat[1]),
-            JanggiPiece(PieceColor.BLUE, PieceCategory.GENERAL, Point2D(4, 1), gg_strat[0], gg_strat[1], True),
-            JanggiPiece(PieceColor.RED, PieceCategory.GENERAL, Point2D(4, 8), gg_strat[0], gg_strat[1], True)
-        ]
-
-        return pieces
+        return PieceFactory().create_all(placements)
 
     def __create_coord_map(self, pieces: List[JanggiPiece]) -> Dict[Tuple[int, int], JanggiPiece]:
         """
@@ -230,6 +145,10 @@ class JanggiGame:
     def board(self):
         return self.__board
 
+    @property
+    def move_generator(self) -> MoveGenerator:
+        return self.__move_generator
+
     @property
     def command_manager(self):
         return self.__command_manager
@@ -244,11 +163,11 @@ class JanggiGame:
 
     @property
     def player_turn(self) -> PieceColor:
-        return self.__player_turn
+        return self.board.turn
 
     @player_turn.setter
     def player_turn(self, value: PieceColor) -> None:
-        self.__player_turn = value
+        self.board.turn = value
 
     # endregion
 
@@ -272,8 +191,8 @@ class JanggiGame:
         # If we reach this point, it means that the move is legal; so perform the move.
         self.move(src, dst)
 
-        # Check if opponent is in check and if so test for a checkmate.
-        if self.is_in_check(self.player_turn) and self.is_checkmate(self.player_turn):
+        # Test the opponent for a checkmate (which first tests whether they are in check).
+        if self.is_checkmate(self.player_turn):
 
             # Checkmate! Set game state to denote the winning player.
             self.game_state = GameState.BLUE_WON if self.player_turn is PieceColor.RED else GameState.RED_WON
@@ -322,16 +241,48 @@ class JanggiGame:
             return False
 
         # Move leave/puts player's General in check.
-        if self.move_results_in_check(source, destination):
+        if not self.move_generator.leaves_general_safe(encode_move(source.square, destination.square)):
             return False
 
         return True
 
-    def move_results_in_check(self, source, destination):
-        turn: PieceColor = self.player_turn
-        self.move(source, destination)
-        in_check: bool = self.is_in_check(turn)
-        self.undo_move()
+    def legal_moves(self, color: Optional[PieceColor] = None) -> List[int]:
+        """
+        Return every legal move of a player, as packed integers (see utils.encode_move).
+
+        :param color: Player to generate moves for; defaults to the player whose turn it is.
+        :return: List of packed moves.
+        """
+
+        return self.move_generator.legal_move_list(self.player_turn if color is None else color)
+
+    def iter_legal_moves(self, color: Optional[PieceColor] = None) -> Iterator[int]:
+        """
+        Lazily yield the legal moves of a player, so callers can stop at the first move they need.
+
+        The position must not change while iterating.
+
+        :param color: Player to generate moves for; defaults to the player whose turn it is.
+        :return: Generator of packed moves.
+        """
+
+        return self.move_generator.legal_moves(self.player_turn if color is None else color)
+
+    def move_results_in_check(self, source: Point2D, destination: Point2D) -> bool:
+        """
+        Determine if moving the piece on source to destination would leave its owner's General in check.
+
+        The move is probed with the board's make/unmake, so the command stacks are left untouched.
+
+        :param source: Source coordinate.
+        :param destination: Destination coordinate.
+        :return: True if the move results in check, False otherwise.
+        """
+
+        color: PieceColor = self.board.coord_map.get_square(source.square).color
+        self.board.make(encode_move(source.square, destination.square))
+        in_check: bool = self.is_in_check(color)
+        self.board.unmake()
 
         return in_check
 
@@ -347,85 +298,34 @@ class JanggiGame:
         :return: True if in check, False otherwise.
         """
 
-        # Generate all paths for opponent.
-        opponent = PieceColor.BLUE if color is PieceColor.RED else PieceColor.RED
-        opponent_pieces = self.board.search(opponent)
-        opponent_paths = self.board.generate_paths(*opponent_pieces)
+        # Look up the current player's General.
+        square = self.board.general(color).position.square
 
-        # Search for the current player's General.
-        general = self.board.search(color, PieceCategory.GENERAL)[0]
-
-        # For each opponent piece, check if any one of their paths will end on current player's General.
-        intersecting_paths = [path for path in opponent_paths if path[-1] == general.position]
-
-        # If one or more opponents can reach the General, then the player is in check.
-        return len(intersecting_paths) > 0
+        # If one or more opponent pieces attack the General's square, then the player is in check.
+        return self.board.attack_map.is_attacked(square, color.opponent)
 
     def is_checkmate(self, color: PieceColor) -> bool:
         """
         Given the player's color, determine if they are in checkmate.
 
-        A player is in checkmate if their General cannot make any move to escape a check; and neither of the player's
-        pieces can block the check or capture the attacking piece.
+        A player is in checkmate if their General is in check and they have no legal move: the General cannot escape,
+        and none of the player's pieces can block the check or capture the attacking piece.
 
         :param color: PieceColor of player we want to investigate to see if they are in a checkmate.
         :return: True if player is in a checkmate, False otherwise.
         """
 
-        opponent_color = PieceColor.BLUE if color == PieceColor.RED else PieceColor.RED
-
-        # ---------------------------------------STEP 1---------------------------------------------- #
-        # Generate all paths for player's General.
-        general: JanggiPiece = self.board.search(color, PieceCategory.GENERAL)[0]
-        general_paths: List[List[Point2D]] = self.board.generate_paths(general)
+        return self.is_in_check(color) and not self.has_legal_move(color)
 
-        # Check if the General can move to any of the paths available to it to escape a check.
-        for path in general_paths:
-            self.move(general.position, path[-1])
-            in_check = self.is_in_check(color)
-            self.undo_move()
-
-            # General can escape the check.
-            if not in_check:
-                return False
-
-        # ---------------------------------------STEP 2---------------------------------------------- #
-        # If we reach this point, it means the General can't escape the check. So now we look for which attack vectors
-        # can capture the General at its current position.
-        attack_vectors: List[List[Point2D]] = list()
-        opponent_pieces: List[JanggiPiece] = self.board.search(opponent_color)
-        opponent_paths: List[List[Point2D]] = self.board.generate_paths(*opponent_pieces)
-
-        # Save all paths that lead to the player's General.
-        for path in opponent_paths:
-            if path[-1] == general.position:
-                attack_vectors.append(path)
-
-        # If there is more than one attack vector, then it's a double-check and it can't be stopped, so return True.
-        if len(attack_vectors) > 1:
-            return True
-
-        # ---------------------------------------STEP 3---------------------------------------------- #
-        # If we reach this point, it means that there is only one attack vector, so we will try to block it.
-        pieces: List[JanggiPiece] = self.board.search(color)
-        paths: List[List[Point2D]] = self.board.generate_paths(*pieces)
-
-        # Find a path that can block the attack.
-        for path in paths:
-            if path[-1] in attack_vectors[0][:-1]:
-
-                # Check if attempt by opponent to intercept attack does not put their general in check.
-                self.move(path[0], path[-1])
-                in_check = self.is_in_check(color)
-                self.undo_move()
+    def has_legal_move(self, color: Optional[PieceColor] = None) -> bool:
+        """
+        Determine if a player has at least one legal move (other than passing), stopping at the first one found.
 
-                # The attack can be blocked so that the player's General is no longer in check.
-                if not in_check:
-                    return False
+        :param color: Player to examine; defaults to the player whose turn it is.
+        :return: True if the player has a legal move, False otherwise.
+        """
 
-        # ---------------------------------------STEP 4---------------------------------------------- #
-        # If we reach this point, it means that there is no way to block attack vector, so it's a checkmate.
-        return True
+        return self.move_generator.has_legal_move(self.player_turn if color is None else color)
 
     def move(self, source: Point2D, destination: Point2D) -> None:
         """
@@ -508,6 +408,11 @@ class JanggiGame:
 
         return column_map[position[0]] + str(10 + position[1])
 
+    def to_notation(self) -> str:
+        """Return the current position, including the side to move, in position notation."""
+
+        return format_position(self.board)
+
     def transpose_pieces(self, transpositions: Dict[str, bool]) -> None:
         """
         Transposes the horse and elephant for each player if requested to do so.
@@ -548,10 +453,9 @@ class JanggiGame:
     def return_piece_destinations(self, source):
         piece = self.board.coord_map[tuple(source)]
         destinations = [
-            list(path[-1].to_tuple())
-            for path
-            in self.board.generate_paths(piece)
-            if not self.move_results_in_check(piece.position, path[-1])
+            list(to_coordinates(move_destination(move)))
+            for move
+            in self.move_generator.legal_moves(piece.color, piece.position.square)
         ]
 
         return destinations
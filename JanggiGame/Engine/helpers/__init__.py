@@ -1,7 +1,16 @@
+from .attack_map import AttackMap
+from .bitboard import AttackTables, Bitboard
+from .board_observer import IBoardObserver
 from .command import MoveCommand
 from .command_manager import CommandManager
+from .mailbox import Mailbox
+from .move_generator import MoveGenerator
 from .obstacle_detection_strategy import IObstacleDetectionStrategy, IllegalDestinationStrategy, \
     IllegalPathStrategy, InsidePalaceStrategy
 from .path_generation_strategy import IPathGenerationStrategy, BranchPathStrategy, LinearDiagonalPathStrategy, \
     LinearPathStrategy
+from .path_table import PathTable
+from .piece_factory import PieceFactory
+from .piece_index import PieceIndex
 from .stack import Stack
+from .zobrist import ZobristHash, ZobristKeys
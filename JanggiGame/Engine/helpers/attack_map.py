@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import List, Optional, TYPE_CHECKING
+
+from piece import PieceColor
+from utils import SQUARE_COUNT
+from .bitboard import ASCENDING, DIRECTIONS, iterate_bits, nearest
+from .board_observer import IBoardObserver
+
+if TYPE_CHECKING:
+    from piece import JanggiPiece
+    from .bitboard import Bitboard
+    from .mailbox import Mailbox
+
+
+class AttackMap(IBoardObserver):
+    """
+    Incrementally maintained record of which pieces attack which squares.
+
+    For every (square, color) pair that has been queried, the map keeps the mask of color's pieces attacking the square
+    together with the region of the board that answer depends on: each ray out of the square up to its second piece
+    (a Chariot's attack ends at the first, a Cannon's at the second), and the squares from which a Horse, Elephant,
+    Soldier, Guard or General could attack it, including their legs.
+
+    The occupant of a square outside that region cannot change the answer, so when the board changes only the entries
+    whose region contains a changed square are rescanned. Repeated questions about the same square, such as whether a
+    General is in check after each candidate move, are answered with a lookup unless the move touched the General's
+    lines.
+
+    Must be attached to the Mailbox after the Bitboard it reads occupancy from.
+    """
+
+    def __init__(self, mailbox: Mailbox, bitboard: Bitboard) -> None:
+        """
+        Create an empty map and start observing the mailbox.
+
+        :param mailbox: Mailbox to observe.
+        :param bitboard: Bitboard observing the same mailbox, used to find attackers.
+        """
+
+        self.__bitboard: Bitboard = bitboard
+        self.__attackers: List[List[int]] = [[0] * SQUARE_COUNT, [0] * SQUARE_COUNT]
+        self.__regions: List[List[int]] = [[0] * SQUARE_COUNT, [0] * SQUARE_COUNT]
+        self.__valid: List[int] = [0, 0]
+        self.__pending: int = 0
+
+        # The part of each region that does not depend on occupancy: Horse and Elephant sources with their legs, and
+        # the squares Soldiers, Guards and Generals attack from.
+        self.__fixed_regions: List[List[int]] = [
+            [self.__fixed_region(square, color) for square in range(SQUARE_COUNT)] for color in PieceColor
+        ]
+
+        mailbox.attach(self)
+
+    def attackers_of(self, square: int, color: PieceColor) -> int:
+        """
+        Return the mask of color's pieces that attack square.
+
+        :param square: Target square.
+        :param color: Color of the attacking side.
+        :return: Mask of attacking pieces.
+        """
+
+        index = color.index
+
+        if self.__pending:
+            self.__invalidate()
+
+        if not self.__valid[index] >> square & 1:
+            self.__attackers[index][square] = self.__bitboard.attackers_of(square, color)
+            self.__regions[index][square] = self.__fixed_regions[index][square] | self.__line_region(square)
+            self.__valid[index] |= 1 << square
+
+        return self.__attackers[index][square]
+
+    def attack_count(self, square: int, color: PieceColor) -> int:
+        """
+        Return the number of color's pieces attacking square.
+
+        :param square: Target square.
+        :param color: Color of the attacking side.
+        :return: Number of attackers.
+        """
+
+        return bin(self.attackers_of(square, color)).count("1")
+
+    def is_attacked(self, square: int, color: PieceColor) -> bool:
+        """
+        Determine if any of color's pieces attack square.
+
+        :param square: Target square.
+        :param color: Color of the attacking side.
+        :return: True if the square is attacked, False otherwise.
+        """
+
+        return self.attackers_of(square, color) != 0
+
+    def region_of(self, square: int, color: PieceColor) -> int:
+        """
+        Return the squares whose occupants determine which of color's pieces attack square.
+
+        :param square: Target square.
+        :param color: Color of the attacking side.
+        :return: Region mask.
+        """
+
+        self.attackers_of(square, color)
+
+        return self.__regions[color.index][square]
+
+    def square_changed(self, square: int, previous: Optional[JanggiPiece], piece: Optional[JanggiPiece]) -> None:
+        self.__pending |= 1 << square
+
+    def __invalidate(self) -> None:
+        """Drop the entries whose region contains a square that changed since the map was last read."""
+
+        pending = self.__pending
+        self.__pending = 0
+
+        for index in (0, 1):
+            regions = self.__regions[index]
+            valid = self.__valid[index]
+
+            for square in iterate_bits(valid):
+                if regions[square] & pending:
+                    valid ^= 1 << square
+
+            self.__valid[index] = valid
+
+    def __line_region(self, square: int) -> int:
+        """Return the rays out of square up to and including their second piece, and the square itself."""
+
+        rays = self.__bitboard.tables.rays
+        occupancy = self.__bitboard.occupancy
+        region = 1 << square
+
+        for direction in range(len(DIRECTIONS)):
+            ray = rays[direction][square]
+            blockers = ray & occupancy
+
+            if not blockers:
+                region |= ray
+                continue
+
+            ascending = ASCENDING[direction]
+            beyond = rays[direction][nearest(blockers, ascending)] & occupancy
+
+            region |= ray ^ rays[direction][nearest(beyond, ascending)] if beyond else ray
+
+        return region
+
+    def __fixed_region(self, square: int, color: PieceColor) -> int:
+        """Return the occupancy-independent part of the region of (square, color)."""
+
+        tables = self.__bitboard.tables
+        region = tables.soldier_sources[color.index][square] | tables.palace_sources[color.index][square]
+
+        for source, legs in tables.horse_sources[square] + tables.elephant_sources[square]:
+            region |= 1 << source | legs
+
+        return region
@@ -0,0 +1,501 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from piece import PieceCategory, PieceColor
+from utils import SQUARE_COUNT, is_on_board, to_coordinates, to_square
+from .board_observer import IBoardObserver
+
+if TYPE_CHECKING:
+    from piece import JanggiPiece
+    from utils import Rectangle
+    from .mailbox import Mailbox
+
+# Unit vectors for the four orthogonal directions followed by the four diagonal directions.
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, 1), (1, -1), (-1, -1))
+
+# Directions in which square numbers increase; the nearest square on such a ray is its lowest set bit.
+ASCENDING: Tuple[bool, ...] = tuple(dy > 0 or (dy == 0 and dx > 0) for dx, dy in DIRECTIONS)
+
+GENERAL: int = PieceCategory.GENERAL.index
+GUARD: int = PieceCategory.GUARD.index
+HORSE: int = PieceCategory.HORSE.index
+ELEPHANT: int = PieceCategory.ELEPHANT.index
+CHARIOT: int = PieceCategory.CHARIOT.index
+CANNON: int = PieceCategory.CANNON.index
+SOLDIER: int = PieceCategory.SOLDIER.index
+
+
+def iterate_bits(mask: int) -> Iterator[int]:
+    """
+    Yield the square number of every bit set in a mask, lowest first.
+
+    :param mask: Bitboard mask.
+    :return: Generator of square numbers.
+    """
+
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def nearest(mask: int, ascending: bool) -> int:
+    """
+    Return the square nearest to a ray's origin from the set of squares on that ray.
+
+    :param mask: Non-empty mask of squares lying on a single ray.
+    :param ascending: Whether square numbers increase along the ray.
+    :return: Square number.
+    """
+
+    if ascending:
+        return (mask & -mask).bit_length() - 1
+
+    return mask.bit_length() - 1
+
+
+class AttackTables:
+    """
+    Precomputed attack geometry for every square of the board, derived from the palace layout.
+
+    Rays are stored per direction so that slider attacks can be resolved with a handful of mask operations: the
+    squares a chariot attacks along a ray are the ray minus the ray that continues past its first blocker.
+    """
+
+    __cache: Dict[Tuple, AttackTables] = dict()
+
+    def __init__(self, blue_palace: Rectangle, red_palace: Rectangle) -> None:
+        """
+        Build the attack tables for a board with the given palaces.
+
+        :param blue_palace: Represents the blue palace.
+        :param red_palace: Represents the red palace.
+        """
+
+        self.__palaces: Tuple[Set[int], Set[int]] = (self.__palace_squares(blue_palace),
+                                                     self.__palace_squares(red_palace))
+        self.__corners: Tuple[Set[int], Set[int]] = (self.__corner_squares(blue_palace),
+                                                     self.__corner_squares(red_palace))
+        self.__diagonal_points: Tuple[Set[int], Set[int]] = tuple(
+            corners | {self.__centre(palace)} for corners, palace in zip(self.__corners, (blue_palace, red_palace))
+        )
+
+        self.rays: List[List[int]] = [[self.__ray(square, d) for square in range(SQUARE_COUNT)]
+                                      for d in range(len(DIRECTIONS))]
+        self.palace_mask: int = sum(1 << square for palace in self.__palaces for square in palace)
+
+        self.horse_moves: List[List[Tuple[int, int]]] = [self.__branch_moves(square, 1) for square in
+                                                         range(SQUARE_COUNT)]
+        self.elephant_moves: List[List[Tuple[int, int]]] = [self.__branch_moves(square, 2) for square in
+                                                            range(SQUARE_COUNT)]
+        self.soldier_attacks: List[List[int]] = [[self.__soldier_attacks(square, color) for square in
+                                                  range(SQUARE_COUNT)] for color in PieceColor]
+        self.palace_attacks: List[List[int]] = [[self.__palace_bound_attacks(square, color) for square in
+                                                 range(SQUARE_COUNT)] for color in PieceColor]
+
+        # Reverse lookups answer "which squares attack this square" without scanning the attacker's pieces.
+        self.horse_sources: List[List[Tuple[int, int]]] = self.__invert_branches(self.horse_moves)
+        self.elephant_sources: List[List[Tuple[int, int]]] = self.__invert_branches(self.elephant_moves)
+        self.soldier_sources: List[List[int]] = [self.__invert_masks(masks) for masks in self.soldier_attacks]
+        self.palace_sources: List[List[int]] = [self.__invert_masks(masks) for masks in self.palace_attacks]
+
+    @classmethod
+    def for_palaces(cls, blue_palace: Rectangle, red_palace: Rectangle) -> AttackTables:
+        """
+        Return the attack tables for the given palace layout, building them on first use.
+
+        :param blue_palace: Represents the blue palace.
+        :param red_palace: Represents the red palace.
+        :return: AttackTables instance.
+        """
+
+        key = tuple((corner.x, corner.y) for palace in (blue_palace, red_palace)
+                    for corner in (palace.bottom_left, palace.top_left, palace.top_right, palace.bottom_right))
+
+        if key not in cls.__cache:
+            cls.__cache[key] = cls(blue_palace, red_palace)
+
+        return cls.__cache[key]
+
+    def palace_of(self, square: int) -> int:
+        """
+        Return the index of the palace containing a square.
+
+        :param square: Square number.
+        :return: PieceColor index of the palace's owner, or -1 if the square is outside both palaces.
+        """
+
+        for index, palace in enumerate(self.__palaces):
+            if square in palace:
+                return index
+
+        return -1
+
+    # region Table construction
+
+    @staticmethod
+    def __palace_squares(palace: Rectangle) -> Set[int]:
+        return {to_square(x, y)
+                for x in range(palace.bottom_left.x, palace.bottom_right.x + 1)
+                for y in range(palace.bottom_left.y, palace.top_left.y + 1)}
+
+    @staticmethod
+    def __corner_squares(palace: Rectangle) -> Set[int]:
+        return {to_square(corner.x, corner.y)
+                for corner in (palace.bottom_left, palace.top_left, palace.top_right, palace.bottom_right)}
+
+    @staticmethod
+    def __centre(palace: Rectangle) -> int:
+        return to_square((palace.bottom_left.x + palace.top_right.x) // 2,
+                         (palace.bottom_left.y + palace.top_right.y) // 2)
+
+    def __is_palace_diagonal_step(self, source: int, destination: int) -> bool:
+        """A diagonal step is only possible along the lines joining a palace's corners through its centre."""
+
+        for points, corners in zip(self.__diagonal_points, self.__corners):
+            if source in points and destination in points and (source in corners or destination in corners):
+                return True
+
+        return False
+
+    def __ray(self, square: int, direction: int) -> int:
+        """Return the mask of squares reachable from square along a direction, ignoring occupancy."""
+
+        dx, dy = DIRECTIONS[direction]
+        x, y = to_coordinates(square)
+        mask = 0
+
+        while is_on_board(x + dx, y + dy):
+            target = to_square(x + dx, y + dy)
+
+            # Diagonal rays only exist along the palace diagonals.
+            if dx != 0 and dy != 0 and not self.__is_palace_diagonal_step(to_square(x, y), target):
+                break
+
+            mask |= 1 << target
+            x, y = x + dx, y + dy
+
+        return mask
+
+    @staticmethod
+    def __branch_moves(square: int, diagonal_steps: int) -> List[Tuple[int, int]]:
+        """
+        Return (leg mask, destination) pairs for a piece that moves one step orthogonally followed by one or more
+        diagonal steps, such as the Horse (one step) and Elephant (two steps).
+        """
+
+        x, y = to_coordinates(square)
+        moves = list()
+
+        for dx in (-1, 1):
+            for dy in (-1, 1):
+                for first in ((0, dy), (dx, 0)):
+                    path = [(x + first[0] + step * dx, y + first[1] + step * dy) for step in range(diagonal_steps + 1)]
+
+                    if all(is_on_board(px, py) for px, py in path):
+                        legs = sum(1 << to_square(px, py) for px, py in path[:-1])
+                        moves.append((legs, to_square(*path[-1])))
+
+        return moves
+
+    def __soldier_attacks(self, square: int, color: PieceColor) -> int:
+        forward = 1 if color is PieceColor.BLUE else -1
+        x, y = to_coordinates(square)
+        mask = 0
+
+        for dx, dy in ((-1, 0), (1, 0), (0, forward)):
+            if is_on_board(x + dx, y + dy):
+                mask |= 1 << to_square(x + dx, y + dy)
+
+        # Inside either palace, soldiers may also advance along the palace diagonals.
+        for dx in (-1, 1):
+            if is_on_board(x + dx, y + forward):
+                target = to_square(x + dx, y + forward)
+                if self.__is_palace_diagonal_step(square, target):
+                    mask |= 1 << target
+
+        return mask
+
+    def __palace_bound_attacks(self, square: int, color: PieceColor) -> int:
+        """Attacks for the General and Guards, who may only move one step and never leave their own palace."""
+
+        own_palace = self.__palaces[color.index]
+
+        if self.palace_of(square) < 0:
+            return 0
+
+        x, y = to_coordinates(square)
+        mask = 0
+
+        for dx, dy in DIRECTIONS:
+            if not is_on_board(x + dx, y + dy):
+                continue
+
+            target = to_square(x + dx, y + dy)
+
+            if target not in own_palace:
+                continue
+
+            if dx != 0 and dy != 0 and not self.__is_palace_diagonal_step(square, target):
+                continue
+
+            mask |= 1 << target
+
+        return mask
+
+    @staticmethod
+    def __invert_branches(moves: List[List[Tuple[int, int]]]) -> List[List[Tuple[int, int]]]:
+        sources: List[List[Tuple[int, int]]] = [list() for _ in range(SQUARE_COUNT)]
+
+        for source, square_moves in enumerate(moves):
+            for legs, destination in square_moves:
+                sources[destination].append((source, legs))
+
+        return sources
+
+    @staticmethod
+    def __invert_masks(masks: List[int]) -> List[int]:
+        sources = [0] * SQUARE_COUNT
+
+        for source, mask in enumerate(masks):
+            for destination in iterate_bits(mask):
+                sources[destination] |= 1 << source
+
+        return sources
+
+    # endregion
+
+
+class Bitboard(IBoardObserver):
+    """
+    Bitboard representation of a Janggi board: one 90-bit integer per color and per (color, category) pair, where
+    bit n is set when square n is occupied.
+
+    Kept in sync with the board by observing its Mailbox, and used to generate attacks with mask operations.
+    """
+
+    def __init__(self, mailbox: Mailbox, blue_palace: Rectangle, red_palace: Rectangle) -> None:
+        """
+        Build the masks from the mailbox's current contents and start observing it.
+
+        :param mailbox: Mailbox to mirror.
+        :param blue_palace: Represents the blue palace.
+        :param red_palace: Represents the red palace.
+        """
+
+        self.__tables: AttackTables = AttackTables.for_palaces(blue_palace, red_palace)
+        self.__mailbox: Mailbox = mailbox
+        self.__colors: List[int] = [0, 0]
+        self.__pieces: List[List[int]] = [[0] * len(PieceCategory), [0] * len(PieceCategory)]
+
+        for square, piece in enumerate(mailbox.squares):
+            if piece is not None:
+                self.square_changed(square, None, piece)
+
+        mailbox.attach(self)
+
+    @property
+    def tables(self) -> AttackTables:
+        return self.__tables
+
+    @property
+    def occupancy(self) -> int:
+        return self.__colors[0] | self.__colors[1]
+
+    def color_mask(self, color: PieceColor) -> int:
+        """Return the mask of squares occupied by a color."""
+
+        return self.__colors[color.index]
+
+    def piece_mask(self, color: PieceColor, category: PieceCategory) -> int:
+        """Return the mask of squares occupied by a color's pieces of a category."""
+
+        return self.__pieces[color.index][category.index]
+
+    def category_mask(self, category: PieceCategory) -> int:
+        """Return the mask of squares occupied by pieces of a category, regardless of color."""
+
+        return self.__pieces[0][category.index] | self.__pieces[1][category.index]
+
+    def square_changed(self, square: int, previous: Optional[JanggiPiece], piece: Optional[JanggiPiece]) -> None:
+        bit = 1 << square
+
+        if previous is not None:
+            color = previous.color.index
+            self.__colors[color] &= ~bit
+            self.__pieces[color][previous.category.index] &= ~bit
+
+        if piece is not None:
+            color = piece.color.index
+            self.__colors[color] |= bit
+            self.__pieces[color][piece.category.index] |= bit
+
+    def slider_attacks(self, square: int, is_cannon: bool, occupancy: int, cannons: int) -> int:
+        """
+        Return the squares attacked by a Chariot or Cannon on square.
+
+        Chariots attack every square up to and including the first blocker on each ray. Cannons must jump exactly
+        one piece that is not a Cannon, and attack every square past it up to and including the next piece, unless
+        that piece is a Cannon.
+
+        :param square: Square occupied by the slider.
+        :param is_cannon: Whether the slider is a Cannon.
+        :param occupancy: Mask of occupied squares.
+        :param cannons: Mask of squares occupied by Cannons of either color.
+        :return: Attack mask.
+        """
+
+        rays = self.__tables.rays
+        attacks = 0
+
+        for direction in range(len(DIRECTIONS)):
+            ray = rays[direction][square]
+            if not ray:
+                continue
+
+            ascending = ASCENDING[direction]
+            blockers = ray & occupancy
+
+            if not is_cannon:
+                attacks |= ray ^ rays[direction][nearest(blockers, ascending)] if blockers else ray
+                continue
+
+            if not blockers:
+                continue
+
+            screen = nearest(blockers, ascending)
+            if cannons >> screen & 1:
+                continue
+
+            beyond = rays[direction][screen]
+            targets = beyond & occupancy
+
+            if not targets:
+                attacks |= beyond
+                continue
+
+            target = nearest(targets, ascending)
+            attacks |= (beyond ^ rays[direction][target]) & ~(cannons & (1 << target))
+
+        return attacks
+
+    def attacks(self, square: int, color: PieceColor, category: PieceCategory, occupancy: Optional[int] = None) -> int:
+        """
+        Return the squares a piece standing on square attacks, i.e. could capture on if occupied by an enemy piece.
+
+        Friendly pieces on attacked squares are included (the square is defended).
+
+        :param square: Square occupied by the piece.
+        :param color: The piece's color.
+        :param category: The piece's category.
+        :param occupancy: Optional occupancy mask to use instead of the current one.
+        :return: Attack mask.
+        """
+
+        tables = self.__tables
+        occupancy = self.occupancy if occupancy is None else occupancy
+        kind = category.index
+
+        if kind == CHARIOT or kind == CANNON:
+            return self.slider_attacks(square, kind == CANNON, occupancy, self.category_mask(PieceCategory.CANNON))
+
+        if kind == HORSE or kind == ELEPHANT:
+            moves = tables.horse_moves[square] if kind == HORSE else tables.elephant_moves[square]
+            return sum(1 << destination for legs, destination in moves if not legs & occupancy)
+
+        if kind == SOLDIER:
+            return tables.soldier_attacks[color.index][square]
+
+        return tables.palace_attacks[color.index][square]
+
+    def attacks_from(self, square: int) -> int:
+        """
+        Return the squares attacked by the piece on square.
+
+        :param square: Square number.
+        :return: Attack mask, or 0 if the square is empty.
+        """
+
+        piece: Optional[JanggiPiece] = self.__mailbox.get_square(square)
+
+        if piece is None:
+            return 0
+
+        return self.attacks(square, piece.color, piece.category)
+
+    def attackers_of(self,
+                     square: int,
+                     color: PieceColor,
+                     occupancy: Optional[int] = None,
+                     cannons: Optional[int] = None,
+                     exclude: int = 0) -> int:
+        """
+        Return the mask of color's pieces that attack square.
+
+        The optional arguments describe a hypothetical position, which lets callers test the effect of a move without
+        making it.
+
+        :param square: Target square.
+        :param color: Color of the attacking side.
+        :param occupancy: Occupancy mask to use instead of the current one.
+        :param cannons: Mask of Cannons (of either color) to use instead of the current one.
+        :param exclude: Mask of squares whose pieces should not be considered as attackers (e.g. captured pieces).
+        :return: Mask of attacking pieces.
+        """
+
+        tables = self.__tables
+        rays = tables.rays
+        pieces = self.__pieces[color.index]
+        occupancy = self.occupancy if occupancy is None else occupancy
+        cannons = self.category_mask(PieceCategory.CANNON) if cannons is None else cannons
+        keep = ~exclude
+
+        chariots = pieces[CHARIOT] & keep
+        enemy_cannons = pieces[CANNON] & keep & cannons
+        target_is_cannon = cannons >> square & 1
+        attackers = 0
+
+        # Sliders: look outward from the target for the first and second piece along each ray.
+        for direction in range(len(DIRECTIONS)):
+            ray = rays[direction][square]
+            blockers = ray & occupancy
+            if not blockers:
+                continue
+
+            ascending = ASCENDING[direction]
+            first = nearest(blockers, ascending)
+            attackers |= chariots & (1 << first)
+
+            if target_is_cannon or cannons >> first & 1:
+                continue
+
+            beyond = rays[direction][first] & occupancy
+            if beyond:
+                attackers |= enemy_cannons & (1 << nearest(beyond, ascending))
+
+        horses = pieces[HORSE] & keep
+        for source, legs in tables.horse_sources[square]:
+            if horses >> source & 1 and not legs & occupancy:
+                attackers |= 1 << source
+
+        elephants = pieces[ELEPHANT] & keep
+        for source, legs in tables.elephant_sources[square]:
+            if elephants >> source & 1 and not legs & occupancy:
+                attackers |= 1 << source
+
+        attackers |= tables.soldier_sources[color.index][square] & pieces[SOLDIER] & keep
+        attackers |= tables.palace_sources[color.index][square] & (pieces[GENERAL] | pieces[GUARD]) & keep
+
+        return attackers
+
+    def is_attacked(self, square: int, color: PieceColor) -> bool:
+        """
+        Determine if any of color's pieces attack square.
+
+        :param square: Target square.
+        :param color: Color of the attacking side.
+        :return: True if the square is attacked, False otherwise.
+        """
+
+        return self.attackers_of(square, color) != 0
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import abc
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from piece import JanggiPiece
+
+
+class IBoardObserver(metaclass=abc.ABCMeta):
+    """
+    Interface for implementing the Observer Pattern on a Mailbox.
+
+    Observers mirror some aspect of the board (occupancy masks, hashes, piece lists, ...) and are notified every time
+    the occupant of a square changes, so they can update themselves incrementally.
+    """
+
+    @classmethod
+    def __subclasshook__(cls, subclass) -> bool:
+        return (hasattr(subclass, "square_changed") and callable(subclass.square_changed) or
+                NotImplemented)
+
+    @abc.abstractmethod
+    def square_changed(self, square: int, previous: Optional[JanggiPiece], piece: Optional[JanggiPiece]) -> None:
+        """
+        Called after the occupant of a square has been replaced.
+
+        :param square: Square number that changed.
+        :param previous: Piece that occupied the square before the change (or None).
+        :param piece: Piece that occupies the square after the change (or None).
+        """
+        raise NotImplementedError
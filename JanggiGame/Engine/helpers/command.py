@@ -81,7 +81,7 @@ class MoveCommand(ICommand):
     def execute(self) -> None:
         """Move object from source to destination."""
 
-        self.removed_piece = self.board.coord_map.get(self.destination.to_tuple())
+        self.removed_piece = self.board.coord_map.get_square(self.destination.square)
         self.board.move(self.source, self.destination)
 
     def un_execute(self) -> None:
@@ -91,5 +91,5 @@ class MoveCommand(ICommand):
 
         # Return removed piece back to its original location (if one existed).
         if self.removed_piece is not None:
-            self.board.coord_map[self.destination.to_tuple()] = self.removed_piece
+            self.board.coord_map.set_square(self.destination.square, self.removed_piece)
             self.removed_piece = None
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from utils import SQUARE_COUNT, to_coordinates, to_square
+
+if TYPE_CHECKING:
+    from piece import JanggiPiece
+    from .board_observer import IBoardObserver
+
+
+class Mailbox(MutableMapping):
+    """
+    Array-backed board representation holding one slot per square, indexed by square number.
+
+    Also implements the mapping protocol over (x, y) tuples, so it can be used anywhere the dictionary based coordinate
+    map was used. Iteration yields the coordinates of occupied squares in square order.
+
+    Observers attached to the mailbox are notified of every change, whichever API was used to make it.
+    """
+
+    def __init__(self, pieces: Optional[Dict[Tuple[int, int], JanggiPiece]] = None) -> None:
+        """
+        Create an empty mailbox and place any pieces provided.
+
+        :param pieces: Optional mapping of tuple coordinates to Piece objects used to populate the mailbox.
+        """
+
+        self.__squares: List[Optional[JanggiPiece]] = [None] * SQUARE_COUNT
+        self.__count: int = 0
+        self.__observers: List[IBoardObserver] = list()
+
+        if pieces is not None:
+            for position, piece in pieces.items():
+                self[position] = piece
+
+    @property
+    def squares(self) -> List[Optional[JanggiPiece]]:
+        """Return the underlying array of squares; callers must not modify it directly."""
+
+        return self.__squares
+
+    def attach(self, observer: IBoardObserver) -> None:
+        """
+        Register an observer to be notified whenever a square changes.
+
+        :param observer: Observer to register.
+        """
+
+        self.__observers.append(observer)
+
+    def detach(self, observer: IBoardObserver) -> None:
+        """
+        Stop notifying an observer of square changes.
+
+        :param observer: Observer to remove.
+        """
+
+        self.__observers.remove(observer)
+
+    def get_square(self, square: int) -> Optional[JanggiPiece]:
+        """
+        Return the occupant of a square.
+
+        :param square: Square number.
+        :return: Piece object or None if the square is empty.
+        """
+
+        return self.__squares[square]
+
+    def set_square(self, square: int, piece: Optional[JanggiPiece]) -> Optional[JanggiPiece]:
+        """
+        Replace the occupant of a square.
+
+        :param square: Square number.
+        :param piece: Piece object to place, or None to empty the square.
+        :return: The previous occupant of the square (if any).
+        """
+
+        previous: Optional[JanggiPiece] = self.__squares[square]
+
+        if previous is piece:
+            return previous
+
+        self.__squares[square] = piece
+        self.__count += (piece is not None) - (previous is not None)
+
+        for observer in self.__observers:
+            observer.square_changed(square, previous, piece)
+
+        return previous
+
+    def get(self, position: Tuple[int, int], default: Optional[JanggiPiece] = None) -> Optional[JanggiPiece]:
+        square: int = to_square(*position)
+
+        if square < 0:
+            return default
+
+        piece: Optional[JanggiPiece] = self.__squares[square]
+        return default if piece is None else piece
+
+    def __getitem__(self, position: Tuple[int, int]) -> JanggiPiece:
+        piece: Optional[JanggiPiece] = self.get(position)
+
+        if piece is None:
+            raise KeyError(position)
+
+        return piece
+
+    def __setitem__(self, position: Tuple[int, int], piece: JanggiPiece) -> None:
+        square: int = to_square(*position)
+
+        if square < 0:
+            raise KeyError(position)
+
+        self.set_square(square, piece)
+
+    def __delitem__(self, position: Tuple[int, int]) -> None:
+        square: int = to_square(*position)
+
+        if square < 0 or self.__squares[square] is None:
+            raise KeyError(position)
+
+        self.set_square(square, None)
+
+    def __contains__(self, position: object) -> bool:
+        return isinstance(position, tuple) and self.get(position) is not None
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for square, piece in enumerate(self.__squares):
+            if piece is not None:
+                yield to_coordinates(square)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def occupants(self) -> Iterator[JanggiPiece]:
+        """Yield every piece on the board in square order."""
+
+        for piece in self.__squares:
+            if piece is not None:
+                yield piece
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, TYPE_CHECKING
+
+from piece import PieceCategory
+from utils import MOVE_SQUARE_BITS, MOVE_SQUARE_MASK
+from .bitboard import iterate_bits
+
+if TYPE_CHECKING:
+    from board import JanggiBoard
+    from piece import JanggiPiece, PieceColor
+
+
+class MoveGenerator:
+    """
+    Generates the legal moves of a position as packed integers (see utils.encode_move), without making any of them.
+
+    Pseudo-legal moves come from the Bitboard's attack masks. To decide whether a move leaves its own General in check,
+    the generator reads, once per position, the region of the board that determines which enemy pieces attack the
+    General (see AttackMap.region_of): the General's lines up to the second piece (which holds every pinned piece and
+    every Cannon screen), and the squares enemy Horses, Elephants, Soldiers, Guards and Generals attack it from.
+
+    A move that neither leaves nor enters that region cannot change whether the General is attacked, so it is legal
+    exactly when the General is not in check now. The remaining moves (General moves, moves of pinned pieces or
+    screens, blocks and captures of checking pieces) are tested by asking the Bitboard for the General's attackers in
+    the hypothetical position after the move.
+
+    Passing the turn is not generated.
+    """
+
+    def __init__(self, board: JanggiBoard) -> None:
+        """
+        Create a move generator for a board.
+
+        :param board: Board to generate moves for.
+        """
+
+        self.__board: JanggiBoard = board
+
+    def pseudo_legal_moves(self,
+                           color: PieceColor,
+                           source: Optional[int] = None,
+                           captures_only: bool = False) -> Iterator[int]:
+        """
+        Yield the moves of color's pieces that follow the movement rules, ignoring the safety of the General.
+
+        :param color: Color of the side to generate moves for.
+        :param source: Optional square to restrict generation to the piece standing on it.
+        :param captures_only: Whether to restrict generation to captures.
+        :return: Generator of packed moves.
+        """
+
+        pieces = self.__board.piece_index.pieces(color)
+        destinations = self.__board.bitboard.color_mask(color.opponent) if captures_only else -1
+
+        if source is not None:
+            piece: Optional[JanggiPiece] = pieces.get(source)
+            squares = [(source, piece)] if piece is not None else []
+        else:
+            squares = list(pieces.items())
+
+        for square, piece in squares:
+            for destination in iterate_bits(self.__targets(square, piece) & destinations):
+                yield square | destination << MOVE_SQUARE_BITS
+
+    def legal_moves(self,
+                    color: PieceColor,
+                    source: Optional[int] = None,
+                    captures_only: bool = False) -> Iterator[int]:
+        """
+        Lazily yield the legal moves of color's pieces, so callers can stop at the first one they need.
+
+        The position must not change between iterations (moves made while iterating must be unmade first).
+
+        :param color: Color of the side to generate moves for.
+        :param source: Optional square to restrict generation to the piece standing on it.
+        :param captures_only: Whether to restrict generation to captures.
+        :return: Generator of packed moves.
+        """
+
+        board = self.__board
+        general: Optional[JanggiPiece] = board.general(color)
+
+        if general is None:
+            yield from self.pseudo_legal_moves(color, source, captures_only)
+            return
+
+        king = general.position.square
+        enemy = color.opponent
+        in_check = board.attack_map.is_attacked(king, enemy)
+        region = board.attack_map.region_of(king, enemy)
+
+        for move in self.pseudo_legal_moves(color, source, captures_only):
+            origin = move & MOVE_SQUARE_MASK
+            destination = move >> MOVE_SQUARE_BITS
+
+            if origin != king and not (region >> origin & 1 or region >> destination & 1):
+                if not in_check:
+                    yield move
+                continue
+
+            if self.__is_safe(origin, destination, king, enemy):
+                yield move
+
+    def legal_move_list(self,
+                        color: PieceColor,
+                        source: Optional[int] = None,
+                        captures_only: bool = False) -> List[int]:
+        """
+        Return the legal moves of color's pieces.
+
+        :param color: Color of the side to generate moves for.
+        :param source: Optional square to restrict generation to the piece standing on it.
+        :param captures_only: Whether to restrict generation to captures.
+        :return: List of packed moves.
+        """
+
+        return list(self.legal_moves(color, source, captures_only))
+
+    def is_legal(self, move: int) -> bool:
+        """
+        Determine if a move is legal for the owner of the piece on its source square.
+
+        :param move: Packed move.
+        :return: True if the move is legal, False otherwise.
+        """
+
+        origin = move & MOVE_SQUARE_MASK
+        destination = move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
+        piece: Optional[JanggiPiece] = self.__board.coord_map.get_square(origin)
+
+        if piece is None or origin == destination or not self.__targets(origin, piece) >> destination & 1:
+            return False
+
+        return self.leaves_general_safe(move)
+
+    def leaves_general_safe(self, move: int) -> bool:
+        """
+        Determine if a move would leave its owner's General out of check, assuming the move is pseudo-legal.
+
+        :param move: Packed move.
+        :return: True if the General would not be attacked after the move, False otherwise.
+        """
+
+        origin = move & MOVE_SQUARE_MASK
+        destination = move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
+        color = self.__board.coord_map.get_square(origin).color
+        general: Optional[JanggiPiece] = self.__board.general(color)
+
+        if general is None:
+            return True
+
+        return self.__is_safe(origin, destination, general.position.square, color.opponent)
+
+    def has_legal_move(self, color: PieceColor) -> bool:
+        """
+        Determine if color has at least one legal move, stopping at the first one found.
+
+        Candidates are tried cheapest first: when the General is not in check, any move that stays outside the General's
+        region (see AttackMap.region_of), which needs no safety test; then General moves, captures of checking pieces,
+        interpositions on empty squares of the region, other moves into the region, and finally moves of pieces inside
+        it, such as a Cannon's screen stepping aside. Every move that can change whether the General is attacked lands
+        in or leaves the region, so the search is complete.
+
+        Passing the turn is not considered.
+
+        :param color: Color of the side to examine.
+        :return: True if color has a legal move, False otherwise.
+        """
+
+        board = self.__board
+        general: Optional[JanggiPiece] = board.general(color)
+
+        if general is None:
+            return next(self.pseudo_legal_moves(color), None) is not None
+
+        king = general.position.square
+        enemy = color.opponent
+        checkers = board.attack_map.attackers_of(king, enemy)
+        region = board.attack_map.region_of(king, enemy)
+
+        pieces = [(square, piece) for square, piece in board.piece_index.pieces(color).items() if square != king]
+
+        # Without check, any move that neither leaves nor enters the region is legal.
+        if not checkers:
+            for square, piece in pieces:
+                if not region >> square & 1 and self.__targets(square, piece) & ~region:
+                    return True
+
+        # General escapes.
+        for destination in iterate_bits(self.__targets(king, general)):
+            if self.__is_safe(king, destination, king, enemy):
+                return True
+
+        candidates = [(square, self.__targets(square, piece)) for square, piece in pieces]
+
+        # Captures of the checking pieces, interpositions, then the rest of the moves into the region.
+        occupancy = board.bitboard.occupancy
+        for mask in (checkers, region & ~occupancy, region & occupancy & ~checkers):
+            for square, targets in candidates:
+                for destination in iterate_bits(targets & mask):
+                    if self.__is_safe(square, destination, king, enemy):
+                        return True
+
+        # Pieces inside the region (Cannon screens, pinned pieces) moving out of it.
+        for square, targets in candidates:
+            if region >> square & 1:
+                for destination in iterate_bits(targets & ~region):
+                    if self.__is_safe(square, destination, king, enemy):
+                        return True
+
+        return False
+
+    def __targets(self, square: int, piece: JanggiPiece) -> int:
+        """Return the squares the piece on square can move to: its attacks, minus its own pieces (and Cannons)."""
+
+        bitboard = self.__board.bitboard
+        targets = bitboard.attacks(square, piece.color, piece.category) & ~bitboard.color_mask(piece.color)
+
+        if piece.category is PieceCategory.CANNON:
+            targets &= ~bitboard.category_mask(PieceCategory.CANNON)
+
+        return targets
+
+    def __is_safe(self, origin: int, destination: int, king: int, enemy: PieceColor) -> bool:
+        """Determine if the General on king is not attacked by enemy after moving origin to destination."""
+
+        bitboard = self.__board.bitboard
+        origin_bit = 1 << origin
+        destination_bit = 1 << destination
+        cannons = bitboard.category_mask(PieceCategory.CANNON)
+
+        occupancy = bitboard.occupancy & ~origin_bit | destination_bit
+        moved_cannons = cannons & ~(origin_bit | destination_bit) | (destination_bit if cannons & origin_bit else 0)
+        target = destination if origin == king else king
+
+        # A piece captured on the destination can no longer attack.
+        return not bitboard.attackers_of(target, enemy, occupancy, moved_cannons, destination_bit)
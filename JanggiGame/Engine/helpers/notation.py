@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+from piece import PieceCategory, PieceColor
+from utils import BOARD_HEIGHT, BOARD_WIDTH, Point2D, encode_move, move_destination, move_source, to_coordinates, \
+    to_square
+
+if TYPE_CHECKING:
+    from board import JanggiBoard
+
+# Position notation, modelled on FEN: the ranks from y = 9 down to y = 0 separated by "/", each listing its squares
+# from x = 0 to x = 8, with a letter per piece (upper case for BLUE, lower case for RED) and a digit per run of empty
+# squares; then a space and the side to move, "b" for BLUE or "r" for RED.
+STARTING_POSITION: str = "reha1aehr/4g4/1c5c1/s1s1s1s1s/9/9/S1S1S1S1S/1C5C1/4G4/REHA1AEHR b"
+
+PIECE_LETTERS: Dict[PieceCategory, str] = {
+    PieceCategory.GENERAL: "g",
+    PieceCategory.GUARD: "a",
+    PieceCategory.HORSE: "h",
+    PieceCategory.ELEPHANT: "e",
+    PieceCategory.CHARIOT: "r",
+    PieceCategory.CANNON: "c",
+    PieceCategory.SOLDIER: "s",
+}
+LETTER_PIECES: Dict[str, PieceCategory] = {letter: category for category, letter in PIECE_LETTERS.items()}
+TURN_LETTERS: Dict[PieceColor, str] = {PieceColor.BLUE: "b", PieceColor.RED: "r"}
+LETTER_TURNS: Dict[str, PieceColor] = {letter: color for color, letter in TURN_LETTERS.items()}
+FILES: str = "abcdefghi"
+
+Placement = Tuple[PieceColor, PieceCategory, Point2D]
+
+
+def parse_position(notation: str) -> Tuple[List[Placement], PieceColor]:
+    """
+    Parse position notation.
+
+    :param notation: Position notation string.
+    :return: Tuple of the piece placements, as (color, category, position) tuples, and the side to move.
+    :raises ValueError: If the notation is malformed.
+    """
+
+    fields = notation.split()
+
+    if len(fields) not in (1, 2):
+        raise ValueError(f"Invalid position notation: {notation!r}")
+
+    ranks = fields[0].split("/")
+    turn = LETTER_TURNS.get(fields[1] if len(fields) == 2 else "b")
+
+    if len(ranks) != BOARD_HEIGHT or turn is None:
+        raise ValueError(f"Invalid position notation: {notation!r}")
+
+    placements: List[Placement] = list()
+
+    for rank, row in enumerate(ranks):
+        y = BOARD_HEIGHT - 1 - rank
+        x = 0
+
+        for token in re.findall(r"\d+|\D", row):
+            if token.isdigit():
+                x += int(token)
+                continue
+
+            category = LETTER_PIECES.get(token.lower())
+
+            if category is None or x >= BOARD_WIDTH:
+                raise ValueError(f"Invalid rank {row!r} in position notation: {notation!r}")
+
+            color = PieceColor.BLUE if token.isupper() else PieceColor.RED
+            placements.append((color, category, Point2D(x, y)))
+            x += 1
+
+        if x != BOARD_WIDTH:
+            raise ValueError(f"Invalid rank {row!r} in position notation: {notation!r}")
+
+    return placements, turn
+
+
+def format_position(board: JanggiBoard) -> str:
+    """
+    Write the position on a board, including the side to move, in position notation.
+
+    :param board: Board to describe.
+    :return: Position notation string.
+    """
+
+    squares = board.coord_map.squares
+    ranks: List[str] = list()
+
+    for y in range(BOARD_HEIGHT - 1, -1, -1):
+        row = ""
+        empty = 0
+
+        for x in range(BOARD_WIDTH):
+            piece = squares[to_square(x, y)]
+
+            if piece is None:
+                empty += 1
+                continue
+
+            if empty:
+                row += str(empty)
+                empty = 0
+
+            letter = PIECE_LETTERS[piece.category]
+            row += letter.upper() if piece.color is PieceColor.BLUE else letter
+
+        ranks.append(row + (str(empty) if empty else ""))
+
+    return "/".join(ranks) + " " + TURN_LETTERS[board.turn]
+
+
+def square_to_algebraic(square: int) -> str:
+    """
+    Convert a square number to algebraic notation, as used by JanggiGame.make_move.
+
+    :param square: Square number.
+    :return: Algebraic position string, e.g. "a10" for square 0.
+    """
+
+    x, y = to_coordinates(square)
+
+    return FILES[x] + str(BOARD_HEIGHT - y)
+
+
+def algebraic_to_square(position: str) -> int:
+    """
+    Convert algebraic notation to a square number.
+
+    :param position: Algebraic position string.
+    :return: Square number.
+    :raises ValueError: If the position is not on the board.
+    """
+
+    if len(position) < 2 or position[0] not in FILES or not position[1:].isdigit():
+        raise ValueError(f"Invalid algebraic position: {position!r}")
+
+    square = to_square(FILES.index(position[0]), BOARD_HEIGHT - int(position[1:]))
+
+    if square < 0:
+        raise ValueError(f"Invalid algebraic position: {position!r}")
+
+    return square
+
+
+def move_to_algebraic(move: int) -> str:
+    """
+    Convert a packed move to algebraic notation, the source followed by the destination (e.g. "a7a6").
+
+    :param move: Packed move.
+    :return: Algebraic move string.
+    """
+
+    return square_to_algebraic(move_source(move)) + square_to_algebraic(move_destination(move))
+
+
+def algebraic_to_move(text: str) -> int:
+    """
+    Convert an algebraic move such as "a7a6" or "b10c8" to a packed move.
+
+    :param text: Algebraic move string.
+    :return: Packed move.
+    :raises ValueError: If the move is malformed.
+    """
+
+    match = re.fullmatch(r"([a-i]\d+)([a-i]\d+)", text)
+
+    if match is None:
+        raise ValueError(f"Invalid algebraic move: {text!r}")
+
+    return encode_move(algebraic_to_square(match.group(1)), algebraic_to_square(match.group(2)))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import abc
-from typing import Iterator, List, Set, Tuple
+from typing import Hashable, Iterator, List, Optional, Set, Tuple
 
 from utils import Point2D
+from .path_table import PathTable
 
 
 class IPathGenerationStrategy(metaclass=abc.ABCMeta):
@@ -30,6 +31,7 @@ class IPathGenerationStrategy(metaclass=abc.ABCMeta):
         self.__x_magnitudes: Set[int, ...] = kwargs.get("x_magnitudes")
         self.__y_magnitudes: Set[int, ...] = kwargs.get("y_magnitudes")
         self.__diag_limit: int = kwargs.get("diag_limit", self.__step_range[1])
+        self.__path_table: Optional[PathTable] = None
 
     @property
     def step_range(self) -> Tuple[int, int]:
@@ -51,6 +53,40 @@ class IPathGenerationStrategy(metaclass=abc.ABCMeta):
     def diag_limit(self) -> int:
         return self.__diag_limit
 
+    @property
+    def configuration(self) -> Hashable:
+        """Return a hashable key identifying the paths this strategy generates."""
+
+        return (
+            type(self).__name__,
+            self.step_range,
+            frozenset(self.scalars or ()),
+            frozenset(self.x_magnitudes or ()),
+            frozenset(self.y_magnitudes or ()),
+            self.diag_limit
+        )
+
+    def precomputed_paths(self, source: Point2D) -> List[List[Point2D]]:
+        """
+        Return every on-board path starting from source, looked up from the strategy's PathTable.
+
+        Falls back to running the path generator if source is not on the board.
+
+        :param source: The origin point to move from.
+        :return: List of paths; the paths are shared and must not be modified.
+        """
+
+        # Resolve the shared table once, then reuse it for every lookup made through this instance.
+        if self.__path_table is None:
+            self.__path_table = PathTable.for_strategy(self)
+
+        paths = self.__path_table.lookup(source)
+
+        if paths is None:
+            return list(self.path_generator(source))
+
+        return paths
+
     @abc.abstractmethod
     def path_generator(self, source: Point2D) -> Iterator[List[Point2D]]:
         """
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Tuple, TYPE_CHECKING
+
+from utils import Point2D
+
+if TYPE_CHECKING:
+    from .path_generation_strategy import IPathGenerationStrategy
+
+
+class PathTable:
+    """
+    Lookup table holding every path a path generation strategy can produce from each square of the board.
+
+    Tables are built once per strategy configuration and shared between all strategy instances (and games) that use
+    the same configuration, so generating paths for a piece becomes a dictionary lookup.
+
+    Paths that leave the board are discarded while the table is built, as they can never be traversed. The paths
+    returned by a table are shared; callers must treat them as read-only.
+    """
+
+    __tables: Dict[Hashable, PathTable] = dict()
+
+    def __init__(self, strategy: IPathGenerationStrategy, width: int = 9, height: int = 10) -> None:
+        """
+        Build the table by running the strategy's path generator from every square of a width x height board.
+
+        :param strategy: The path generation strategy to precompute.
+        :param width: Number of columns on the board.
+        :param height: Number of rows on the board.
+        """
+
+        self.__width: int = width
+        self.__height: int = height
+        self.__paths: Dict[Tuple[int, int], List[List[Point2D]]] = dict()
+
+        for x in range(width):
+            for y in range(height):
+                source: Point2D = Point2D(x, y)
+                self.__paths[(x, y)] = [
+                    path for path in strategy.path_generator(source) if all(self.__on_board(p) for p in path)
+                ]
+
+    @classmethod
+    def for_strategy(cls, strategy: IPathGenerationStrategy) -> PathTable:
+        """
+        Return the table matching the strategy's configuration, building it on first use.
+
+        :param strategy: The path generation strategy to look up.
+        :return: PathTable for the strategy.
+        """
+
+        table = cls.__tables.get(strategy.configuration)
+
+        if table is None:
+            table = cls(strategy)
+            cls.__tables[strategy.configuration] = table
+
+        return table
+
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    def lookup(self, source: Point2D) -> Optional[List[List[Point2D]]]:
+        """
+        Return all on-board paths originating from source.
+
+        :param source: The origin point to move from.
+        :return: List of precomputed paths, or None if source is not on the board.
+        """
+
+        return self.__paths.get((source.x, source.y))
+
+    def __on_board(self, point: Point2D) -> bool:
+        return 0 <= point.x < self.__width and 0 <= point.y < self.__height
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from piece import JanggiPiece, PieceCategory, PieceColor
+from .obstacle_detection_strategy import IllegalDestinationStrategy, IllegalPathStrategy, InsidePalaceStrategy
+from .path_generation_strategy import BranchPathStrategy, LinearDiagonalPathStrategy, LinearPathStrategy
+
+if TYPE_CHECKING:
+    from utils import Point2D
+    from .obstacle_detection_strategy import IObstacleDetectionStrategy
+    from .path_generation_strategy import IPathGenerationStrategy
+
+
+class PieceFactory:
+    """
+    Creates JanggiPiece objects configured with the path and obstacle strategies of their category and color.
+
+    Strategy instances are created once per factory and shared by every piece it creates.
+    """
+
+    def __init__(self) -> None:
+        """Configure path and move strategies for the different piece types/colors."""
+
+        chariot_cannon_path_strategy = dict(
+            default=LinearPathStrategy(step_range=(1, 10), x_magnitudes={0, 1}, y_magnitudes={-1, 1}),
+            palace=LinearDiagonalPathStrategy(
+                step_range=(1, 10), x_magnitudes={-1, 0, 1}, y_magnitudes={-1, 0, 1}, diag_limit=2
+            )
+        )
+        horse_path_strategy = dict(
+            default=BranchPathStrategy(
+                step_range=(1, 2), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1}
+            ),
+            palace=BranchPathStrategy(step_range=(1, 2), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1})
+        )
+        elephant_path_strategy = dict(
+            default=BranchPathStrategy(
+                step_range=(2, 3), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1}
+            ),
+            palace=BranchPathStrategy(step_range=(2, 3), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1})
+        )
+        blue_soldier_path_strategy = dict(
+            default=LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={1}),
+            palace=LinearDiagonalPathStrategy(
+                step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={0, 1}, diag_limit=1
+            )
+        )
+        red_soldier_path_strategy = dict(
+            default=LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={-1}),
+            palace=LinearDiagonalPathStrategy(
+                step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={0, -1}, diag_limit=1
+            )
+        )
+        general_guard_path_strategy = dict(
+            default=None,
+            palace=LinearDiagonalPathStrategy(
+                step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={-1, 0, 1}, diag_limit=1
+            )
+        )
+        default_obstacle_strategy = dict(
+            destination=IllegalDestinationStrategy(),
+            path=IllegalPathStrategy(),
+            palace=InsidePalaceStrategy()
+        )
+        horse_elephant_obstacle_strategy = dict(
+            destination=IllegalDestinationStrategy(),
+            path=IllegalPathStrategy(),
+            palace=None
+        )
+
+        self.__path_strategies: Dict[PieceCategory, Dict[str, Optional[IPathGenerationStrategy]]] = {
+            PieceCategory.GENERAL: general_guard_path_strategy,
+            PieceCategory.GUARD: general_guard_path_strategy,
+            PieceCategory.HORSE: horse_path_strategy,
+            PieceCategory.ELEPHANT: elephant_path_strategy,
+            PieceCategory.CHARIOT: chariot_cannon_path_strategy,
+            PieceCategory.CANNON: chariot_cannon_path_strategy,
+        }
+        self.__soldier_path_strategies: Dict[PieceColor, Dict[str, IPathGenerationStrategy]] = {
+            PieceColor.BLUE: blue_soldier_path_strategy,
+            PieceColor.RED: red_soldier_path_strategy,
+        }
+        self.__obstacle_strategies: Dict[PieceCategory, Dict[str, Optional[IObstacleDetectionStrategy]]] = {
+            category: default_obstacle_strategy for category in PieceCategory
+        }
+        self.__obstacle_strategies[PieceCategory.HORSE] = horse_elephant_obstacle_strategy
+        self.__obstacle_strategies[PieceCategory.ELEPHANT] = horse_elephant_obstacle_strategy
+
+    def create(self, color: PieceColor, category: PieceCategory, position: Point2D) -> JanggiPiece:
+        """
+        Create a piece.
+
+        :param color: The piece's color.
+        :param category: The piece's category.
+        :param position: The piece's starting position.
+        :return: Configured Piece object.
+        """
+
+        if category is PieceCategory.SOLDIER:
+            path_strategies = self.__soldier_path_strategies[color]
+        else:
+            path_strategies = self.__path_strategies[category]
+
+        palace_bound = category is PieceCategory.GENERAL or category is PieceCategory.GUARD
+
+        return JanggiPiece(color, category, position, path_strategies, self.__obstacle_strategies[category],
+                           palace_bound)
+
+    def create_all(self, placements: List[Tuple[PieceColor, PieceCategory, Point2D]]) -> List[JanggiPiece]:
+        """
+        Create a piece for each (color, category, position) placement.
+
+        :param placements: List of (color, category, position) tuples.
+        :return: List of configured Piece objects.
+        """
+
+        return [self.create(color, category, position) for color, category, position in placements]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from piece import PieceCategory, PieceColor
+from .board_observer import IBoardObserver
+
+if TYPE_CHECKING:
+    from piece import JanggiPiece
+    from .mailbox import Mailbox
+
+
+class PieceIndex(IBoardObserver):
+    """
+    Piece lists of a board, by color and by (color, category), each keyed by the square the piece stands on.
+
+    Kept in sync with the board by observing its Mailbox, so moves, captures, undos and setup transpositions update the
+    lists in O(1), and a General can be found without scanning the board.
+    """
+
+    def __init__(self, mailbox: Mailbox) -> None:
+        """
+        Index the mailbox's current contents and start observing it.
+
+        :param mailbox: Mailbox to mirror.
+        """
+
+        self.__colors: List[Dict[int, JanggiPiece]] = [dict(), dict()]
+        self.__categories: List[List[Dict[int, JanggiPiece]]] = [
+            [dict() for _ in PieceCategory] for _ in PieceColor
+        ]
+
+        for square, piece in enumerate(mailbox.squares):
+            if piece is not None:
+                self.square_changed(square, None, piece)
+
+        mailbox.attach(self)
+
+    def pieces(self, color: PieceColor, category: Optional[PieceCategory] = None) -> Dict[int, JanggiPiece]:
+        """
+        Return the pieces of a color (and optionally a category), keyed by square.
+
+        The dictionary is live; callers must not modify it, nor move pieces while iterating over it.
+
+        :param color: Piece color.
+        :param category: Optional piece category.
+        :return: Dictionary of square numbers to Piece objects.
+        """
+
+        if category is None:
+            return self.__colors[color.index]
+
+        return self.__categories[color.index][category.index]
+
+    def general(self, color: PieceColor) -> Optional[JanggiPiece]:
+        """
+        Return a color's General.
+
+        :param color: Piece color.
+        :return: The General, or None if it is not on the board.
+        """
+
+        generals = self.__categories[color.index][PieceCategory.GENERAL.index]
+
+        for piece in generals.values():
+            return piece
+
+        return None
+
+    def square_changed(self, square: int, previous: Optional[JanggiPiece], piece: Optional[JanggiPiece]) -> None:
+        if previous is not None:
+            color = previous.color.index
+            del self.__colors[color][square]
+            del self.__categories[color][previous.category.index][square]
+
+        if piece is not None:
+            color = piece.color.index
+            self.__colors[color][square] = piece
+            self.__categories[color][piece.category.index][square] = piece
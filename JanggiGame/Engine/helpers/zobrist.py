@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import random
+from typing import List, Optional, TYPE_CHECKING
+
+from piece import PieceCategory, PieceColor
+from utils import SQUARE_COUNT
+from .board_observer import IBoardObserver
+
+if TYPE_CHECKING:
+    from piece import JanggiPiece
+    from .mailbox import Mailbox
+
+# Fixed seed so that hashes are stable between processes (required for opening books and shared tables).
+ZOBRIST_SEED: int = 0x4A616E676769
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys for every (color, category, square) triple plus a key for the side to move.
+
+    Keys are generated from a fixed seed, so every process computes the same hash for the same position.
+    """
+
+    __instance: Optional[ZobristKeys] = None
+
+    def __init__(self, seed: int = ZOBRIST_SEED) -> None:
+        """
+        Generate the keys.
+
+        :param seed: Seed for the random number generator.
+        """
+
+        rng = random.Random(seed)
+
+        self.__pieces: List[List[List[int]]] = [
+            [[rng.getrandbits(64) for _ in range(SQUARE_COUNT)] for _ in PieceCategory]
+            for _ in PieceColor
+        ]
+        self.__side: int = rng.getrandbits(64)
+
+    @classmethod
+    def default(cls) -> ZobristKeys:
+        """Return the shared set of keys generated from the default seed."""
+
+        if cls.__instance is None:
+            cls.__instance = ZobristKeys()
+
+        return cls.__instance
+
+    @property
+    def side(self) -> int:
+        """Key toggled in when RED is to move."""
+
+        return self.__side
+
+    def piece(self, color: PieceColor, category: PieceCategory, square: int) -> int:
+        """
+        Return the key for a piece standing on a square.
+
+        :param color: Piece color.
+        :param category: Piece category.
+        :param square: Square number.
+        :return: 64-bit key.
+        """
+
+        return self.__pieces[color.index][category.index][square]
+
+
+class ZobristHash(IBoardObserver):
+    """
+    Incrementally maintained 64-bit Zobrist hash of a board position.
+
+    Observes the board's Mailbox, so every change of a square's occupant (moves, captures, undos and the horse/elephant
+    transpositions made during setup) is folded into the hash with one or two XORs. The side to move is folded in
+    through toggle_side().
+    """
+
+    def __init__(self, mailbox: Mailbox, keys: Optional[ZobristKeys] = None) -> None:
+        """
+        Compute the hash of the mailbox's current contents and start observing it.
+
+        :param mailbox: Mailbox to mirror.
+        :param keys: Keys to hash with; defaults to the shared keys.
+        """
+
+        self.__keys: ZobristKeys = keys if keys is not None else ZobristKeys.default()
+        self.__value: int = self.compute(mailbox)
+
+        mailbox.attach(self)
+
+    @property
+    def keys(self) -> ZobristKeys:
+        return self.__keys
+
+    @property
+    def value(self) -> int:
+        return self.__value
+
+    def compute(self, mailbox: Mailbox, red_to_move: bool = False) -> int:
+        """
+        Compute the hash of a position from scratch.
+
+        :param mailbox: Mailbox holding the position.
+        :param red_to_move: Whether RED is the side to move.
+        :return: 64-bit hash.
+        """
+
+        value: int = self.__keys.side if red_to_move else 0
+
+        for square, piece in enumerate(mailbox.squares):
+            if piece is not None:
+                value ^= self.__keys.piece(piece.color, piece.category, square)
+
+        return value
+
+    def toggle_side(self) -> None:
+        """Fold a change of the side to move into the hash."""
+
+        self.__value ^= self.__keys.side
+
+    def square_changed(self, square: int, previous: Optional[JanggiPiece], piece: Optional[JanggiPiece]) -> None:
+        if previous is not None:
+            self.__value ^= self.__keys.piece(previous.color, previous.category, square)
+
+        if piece is not None:
+            self.__value ^= self.__keys.piece(piece.color, piece.category, square)
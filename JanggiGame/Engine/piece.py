@@ -73,10 +73,11 @@ class JanggiPiece:
         """
 
         # Determine which strategy to use based on the location of the piece relative to a palace.
+        # Paths are looked up from the strategy's precomputed table rather than generated on every call.
         if in_palace:
-            return self.__path_strategies["palace"].path_generator(source)
+            return iter(self.__path_strategies["palace"].precomputed_paths(source))
 
-        return self.__path_strategies["default"].path_generator(source)
+        return iter(self.__path_strategies["default"].precomputed_paths(source))
 
     def is_obstacle_in_path(self,
                             in_palace: bool,
@@ -125,6 +126,18 @@ class PieceColor(enum.Enum):
     BLUE = enum.auto()
     RED = enum.auto()
 
+    @property
+    def index(self) -> int:
+        """Return a zero-based index for the color, for use with array-backed tables."""
+
+        return self._value_ - 1
+
+    @property
+    def opponent(self) -> PieceColor:
+        """Return the opposing color."""
+
+        return PieceColor.RED if self is PieceColor.BLUE else PieceColor.BLUE
+
 
 class PieceCategory(enum.Enum):
     """Enum class representing the various categories a janggi piece can belong to."""
@@ -136,3 +149,9 @@ class PieceCategory(enum.Enum):
     CHARIOT = 49
     CANNON = 59
     SOLDIER = 69
+
+    @property
+    def index(self) -> int:
+        """Return a zero-based index for the category (0 for GENERAL through 6 for SOLDIER)."""
+
+        return self._value_ // 10
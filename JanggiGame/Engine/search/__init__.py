@@ -0,0 +1,11 @@
+from .anytime import search_async
+from .batch import BatchEvaluator
+from .book import BookBuilder, OpeningBook
+from .evaluation import COUNTING_BONUS, PIECE_VALUES, IEvaluator, MaterialEvaluator, PieceSquareEvaluator
+from .ordering import MoveOrderer
+from .parallel import ParallelSearcher
+from .ponder import Ponderer
+from .searcher import MATE_SCORE, MAX_PLY, SearchResult, Searcher
+from .see import static_exchange
+from .tablebase import Material, Tablebase
+from .transposition import BOUND_EXACT, BOUND_LOWER, BOUND_UPPER, TranspositionTable
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from typing import Optional, TYPE_CHECKING
+
+from game import JanggiGame
+from .searcher import SearchResult, Searcher
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .transposition import TranspositionTable
+
+
+async def search_async(game: JanggiGame,
+                       time_limit: float,
+                       max_depth: Optional[int] = None,
+                       executor: Optional[Executor] = None,
+                       table: Optional[TranspositionTable] = None) -> SearchResult:
+    """
+    Search the current position of a game without blocking the event loop, returning the best move found when the
+    time runs out.
+
+    The search runs on a copy of the position in an executor thread, so the game may keep being used by the event loop
+    meanwhile. The result is that of the deepest iteration completed before the deadline (see Searcher). If the
+    awaiting task is cancelled, the search is stopped and waited for before the cancellation propagates, so the
+    transposition table is free for the next search by the time the task finishes.
+
+    :param game: Game holding the position; it is not modified.
+    :param time_limit: Seconds to search for.
+    :param max_depth: Optional depth limit in plies, which may end the search before the time runs out.
+    :param executor: Executor to run the search in; defaults to the event loop's default executor. It must run the
+                     search in a thread of this process, so that it can be stopped.
+    :param table: Transposition table, which may be kept between searches; defaults to a new table.
+    :return: Result of the deepest completed iteration.
+    :raises asyncio.CancelledError: If the awaiting task is cancelled.
+    """
+
+    loop = asyncio.get_running_loop()
+    deadline = time.monotonic() + time_limit
+    searcher = Searcher(JanggiGame(game.to_notation()), table=table)
+    future = loop.run_in_executor(executor, functools.partial(searcher.search, max_depth=max_depth, deadline=deadline))
+
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        searcher.stop()
+        await asyncio.wait([future])
+        raise
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from typing import Iterable, TYPE_CHECKING
+
+from piece import PieceCategory, PieceColor
+from utils import BOARD_HEIGHT, BOARD_WIDTH, SQUARE_COUNT
+from .evaluation import COUNTING_BONUS, PIECE_VALUES, square_values
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, only needed for batch evaluation.
+    np = None
+
+if TYPE_CHECKING:
+    from board import JanggiBoard
+
+# Square codes of the encoding: 0 for an empty square, the category index plus 1 for a BLUE piece and its negation
+# for a RED piece. Adding CODE_OFFSET turns a code into a row of the lookup tables.
+CODE_OFFSET: int = len(PieceCategory)
+
+# Value of each square a Chariot can slide to, in hundredths of a point.
+MOBILITY_WEIGHT: int = 2
+
+# Rays a Chariot slides along, as (axis, step) over an array of boards shaped (positions, ranks, files).
+LINE_DIRECTIONS = ((1, 1), (1, -1), (2, 1), (2, -1))
+
+
+def _require_numpy() -> None:
+    """Raise ImportError if numpy is not installed."""
+
+    if np is None:
+        raise ImportError("Batch evaluation requires numpy (pip install numpy).")
+
+
+def encode(boards: Iterable[JanggiBoard]) -> np.ndarray:
+    """
+    Encode the current positions of boards as one array.
+
+    :param boards: Boards to encode.
+    :return: Array of shape (positions, SQUARE_COUNT) and type int8 holding the code of each square (see CODE_OFFSET),
+             by square number.
+    :raises ImportError: If numpy is not installed.
+    """
+
+    _require_numpy()
+
+    codes = {(color, category): (category.index + 1) * (1 if color is PieceColor.BLUE else -1)
+             for color in PieceColor for category in PieceCategory}
+    rows = [[0 if piece is None else codes[piece.color, piece.category] for piece in board.coord_map.squares]
+            for board in boards]
+
+    return np.array(rows, dtype=np.int8).reshape(-1, SQUARE_COUNT)
+
+
+def _shift(mask: np.ndarray, axis: int, step: int) -> np.ndarray:
+    """Shift a stack of board masks one square along an axis, filling with False."""
+
+    shifted = np.zeros_like(mask)
+    source = [slice(None)] * 3
+    target = [slice(None)] * 3
+    source[axis] = slice(None, -1) if step > 0 else slice(1, None)
+    target[axis] = slice(1, None) if step > 0 else slice(None, -1)
+    shifted[tuple(target)] = mask[tuple(source)]
+
+    return shifted
+
+
+class BatchEvaluator:
+    """
+    Evaluates many positions at once with numpy.
+
+    Positions are encoded by encode() into one row of square codes each, and every score is computed for the whole
+    batch with array operations: material and piece-square scores are table lookups summed over the squares, and the
+    mobility proxy counts the empty squares along the ranks and files of each Chariot, one ray step at a time (palace
+    diagonals are ignored). Material plus piece-square scores match PieceSquareEvaluator position for position.
+
+    Scores are for BLUE; negate them for RED. numpy is an optional dependency: creating an evaluator without it raises
+    ImportError.
+    """
+
+    def __init__(self, mobility_weight: int = MOBILITY_WEIGHT) -> None:
+        """
+        Build the lookup tables.
+
+        :param mobility_weight: Value of each square of Chariot mobility, in hundredths of a point.
+        :raises ImportError: If numpy is not installed.
+        """
+
+        _require_numpy()
+
+        rows = 2 * CODE_OFFSET + 1
+        self.__square_scores: np.ndarray = np.zeros((rows, SQUARE_COUNT), dtype=np.int32)
+        self.__material: np.ndarray = np.zeros((len(PieceColor), rows), dtype=np.int32)
+
+        for category in PieceCategory:
+            code = category.index + 1
+            self.__square_scores[CODE_OFFSET + code] = square_values(PieceColor.BLUE, category)
+            self.__square_scores[CODE_OFFSET - code] = [-value for value in square_values(PieceColor.RED, category)]
+            self.__material[PieceColor.BLUE.index, CODE_OFFSET + code] = PIECE_VALUES[category]
+            self.__material[PieceColor.RED.index, CODE_OFFSET - code] = PIECE_VALUES[category]
+
+        self.__mobility_weight: int = mobility_weight
+
+    def material(self, squares: np.ndarray) -> np.ndarray:
+        """
+        Return BLUE's material minus RED's.
+
+        :param squares: Encoded positions (see encode).
+        :return: Array of scores in hundredths of a point, one per position.
+        """
+
+        rows = squares.astype(np.intp) + CODE_OFFSET
+
+        return self.__material[PieceColor.BLUE.index][rows].sum(axis=1) - \
+            self.__material[PieceColor.RED.index][rows].sum(axis=1)
+
+    def piece_square(self, squares: np.ndarray) -> np.ndarray:
+        """
+        Return BLUE's material and piece-square score minus RED's, as PieceSquareEvaluator.evaluate does.
+
+        :param squares: Encoded positions (see encode).
+        :return: Array of scores in hundredths of a point, one per position.
+        """
+
+        rows = squares.astype(np.intp) + CODE_OFFSET
+
+        return self.__square_scores[rows, np.arange(SQUARE_COUNT)].sum(axis=1)
+
+    def mobility(self, squares: np.ndarray) -> np.ndarray:
+        """
+        Return the number of empty squares BLUE's Chariots can slide to minus RED's.
+
+        :param squares: Encoded positions (see encode).
+        :return: Array of square counts, one per position.
+        """
+
+        boards = squares.reshape(-1, BOARD_HEIGHT, BOARD_WIDTH)
+        empty = boards == 0
+        chariot = PieceCategory.CHARIOT.index + 1
+        result = np.zeros(len(boards), dtype=np.int32)
+
+        for sign in (1, -1):
+            chariots = boards == sign * chariot
+
+            for axis, step in LINE_DIRECTIONS:
+                frontier = chariots
+
+                for _ in range(max(BOARD_HEIGHT, BOARD_WIDTH) - 1):
+                    frontier = _shift(frontier, axis, step) & empty
+
+                    if not frontier.any():
+                        break
+
+                    result += sign * frontier.sum(axis=(1, 2), dtype=np.int32)
+
+        return result
+
+    def evaluate(self, squares: np.ndarray) -> np.ndarray:
+        """
+        Score positions by material, piece placement and Chariot mobility.
+
+        :param squares: Encoded positions (see encode).
+        :return: Array of BLUE's scores in hundredths of a point, one per position.
+        """
+
+        return self.piece_square(squares) + self.__mobility_weight * self.mobility(squares)
+
+    def points(self, squares: np.ndarray) -> np.ndarray:
+        """
+        Return the point count of each side under the counting rule (see PieceSquareEvaluator.points).
+
+        :param squares: Encoded positions (see encode).
+        :return: Array of shape (positions, 2) holding the points of each color, by color index.
+        """
+
+        rows = squares.astype(np.intp) + CODE_OFFSET
+
+        return np.stack([self.__material[color.index][rows].sum(axis=1) / 100 + COUNTING_BONUS[color]
+                         for color in PieceColor], axis=1)
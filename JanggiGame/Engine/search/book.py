@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import mmap
+import random
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from game import JanggiGame
+from helpers.notation import algebraic_to_move
+from utils import move_destination, move_source
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from piece import PieceColor
+
+# File layout: a header (magic, format version, record size, record count) followed by the records sorted by
+# position hash, then by move. All fields are little-endian.
+BOOK_MAGIC: bytes = b"JGBK"
+BOOK_VERSION: int = 1
+BOOK_HEADER: struct.Struct = struct.Struct("<4sHHQ")
+
+# A record: position hash, packed move, weight and number of games.
+BOOK_RECORD: struct.Struct = struct.Struct("<QHHI")
+
+# Plies of each game entered into a book when no limit is given.
+DEFAULT_BOOK_PLY: int = 24
+
+# Points a move earns for the side that played it: a win scores 2, a draw 1 and a loss 0.
+WIN_POINTS: int = 2
+DRAW_POINTS: int = 1
+
+MAX_WEIGHT: int = (1 << 16) - 1
+MAX_GAMES: int = (1 << 32) - 1
+
+# A book hit: (packed move, weight, games).
+BookEntry = Tuple[int, int, int]
+
+
+class OpeningBook:
+    """
+    Read-only opening book: the moves played from each position of a corpus of games, with how often and how well.
+
+    The book is a flat binary file of fixed-size records sorted by the 64-bit Zobrist hash of the position the move
+    was played from (see BookBuilder). It is opened with mmap and searched in place by binary search, so opening a
+    book costs nothing however large it is, and every process that opens the same file shares one copy of it in the
+    page cache.
+
+    Positions are looked up by hash only, so a book covers every horse and elephant setup (see
+    JanggiGame.transpose_pieces) that appears in its games, and positions reached by transposition share their moves.
+
+    The file is released by close(), or by using the book as a context manager.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a book file.
+
+        :param path: Path of a file written by BookBuilder.write.
+        :raises ValueError: If the file is not a book, or its size does not match its header.
+        """
+
+        with open(path, "rb") as file:
+            size = file.seek(0, 2)
+
+            if size < BOOK_HEADER.size:
+                raise ValueError(f"Not an opening book: {path!r}")
+
+            self.__map: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, record_size, count = BOOK_HEADER.unpack_from(self.__map, 0)
+
+        if magic != BOOK_MAGIC or version != BOOK_VERSION or record_size != BOOK_RECORD.size or \
+                size != BOOK_HEADER.size + count * BOOK_RECORD.size:
+            self.__map.close()
+            raise ValueError(f"Not an opening book, or an unsupported version: {path!r}")
+
+        self.__count: int = count
+
+    def __len__(self) -> int:
+        """Number of records (position and move pairs) in the book."""
+
+        return self.__count
+
+    def probe(self, key: int) -> List[BookEntry]:
+        """
+        Look up the moves played from a position.
+
+        :param key: Zobrist hash of the position.
+        :return: List of (packed move, weight, games) tuples, by move; empty if the position is not in the book.
+        """
+
+        index = self.__lower_bound(key)
+        entries = list()
+
+        while index < self.__count:
+            record_key, move, weight, games = BOOK_RECORD.unpack_from(self.__map, self.__offset(index))
+
+            if record_key != key:
+                break
+
+            entries.append((move, weight, games))
+            index += 1
+
+        return entries
+
+    def choose(self, game: JanggiGame, rng: Optional[random.Random] = None) -> Optional[int]:
+        """
+        Choose a book move for the side to move, at random in proportion to the weights of the moves.
+
+        Moves that are not legal in the position (a hash collision) and moves with no weight are never chosen.
+
+        :param game: Game holding the position.
+        :param rng: Random number generator; defaults to the random module's.
+        :return: Packed move, or None if the position is out of book.
+        """
+
+        legal_moves = game.legal_moves()
+        entries = [(move, weight) for move, weight, _ in self.probe(game.board.position_hash)
+                   if weight > 0 and move in legal_moves]
+
+        if not entries:
+            return None
+
+        moves, weights = zip(*entries)
+
+        return (rng or random).choices(moves, weights)[0]
+
+    def close(self) -> None:
+        """Unmap the book file."""
+
+        self.__map.close()
+
+    def __lower_bound(self, key: int) -> int:
+        """Return the index of the first record whose hash is not less than key."""
+
+        low, high = 0, self.__count
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if BOOK_RECORD.unpack_from(self.__map, self.__offset(middle))[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    @staticmethod
+    def __offset(index: int) -> int:
+        return BOOK_HEADER.size + index * BOOK_RECORD.size
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[type],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+
+class BookBuilder:
+    """
+    Compiles an opening book from recorded games.
+
+    Each game is replayed from the starting position after its horse and elephant setup, and the first plies of it
+    are counted: for every (position, move) pair, the number of games it was played in and the points it earned for
+    the side that played it (WIN_POINTS for a win, DRAW_POINTS for a draw). The points are the weight with which
+    OpeningBook.choose plays the move.
+    """
+
+    def __init__(self, max_ply: int = DEFAULT_BOOK_PLY) -> None:
+        """
+        Create an empty builder.
+
+        :param max_ply: Number of plies of each game to enter into the book.
+        """
+
+        self.__max_ply: int = max_ply
+        self.__moves: Dict[Tuple[int, int], List[int]] = dict()
+        self.__games: int = 0
+
+    @property
+    def games(self) -> int:
+        """Number of games added."""
+
+        return self.__games
+
+    def add_game(self,
+                 moves: Iterable[str],
+                 winner: Optional[PieceColor],
+                 setup: Optional[Dict[str, bool]] = None) -> None:
+        """
+        Add the opening of a game.
+
+        :param moves: Moves of the game in algebraic notation (see algebraic_to_move), from the starting position.
+        :param winner: Color of the winning side, or None for a draw.
+        :param setup: Horse and elephant transpositions made before the first move, as passed to
+                      JanggiGame.transpose_pieces.
+        :raises ValueError: If a move is malformed or illegal; passing the turn is only legal without another move.
+        """
+
+        game = JanggiGame()
+        board = game.board
+        game.transpose_pieces(setup or dict())
+
+        for ply, text in enumerate(moves):
+            if ply >= self.__max_ply:
+                break
+
+            move = algebraic_to_move(text)
+            legal_moves = game.legal_moves()
+
+            # A forced pass is replayed but not recorded, as the book has nothing to choose there.
+            if not legal_moves and move_source(move) == move_destination(move):
+                board.make(move)
+                continue
+
+            if move not in legal_moves:
+                raise ValueError(f"Illegal move {text!r} at ply {ply + 1}.")
+
+            if winner is None:
+                points = DRAW_POINTS
+            else:
+                points = WIN_POINTS if winner is board.turn else 0
+
+            counts = self.__moves.setdefault((board.position_hash, move), [0, 0])
+            counts[0] += points
+            counts[1] += 1
+
+            board.make(move)
+
+        self.__games += 1
+
+    def write(self, path: str, min_games: int = 1) -> int:
+        """
+        Write the book file.
+
+        :param path: Path of the file to create or overwrite.
+        :param min_games: Fewest games a move must have been played in to be written.
+        :return: Number of records written.
+        """
+
+        records = sorted((key, move, min(weight, MAX_WEIGHT), min(games, MAX_GAMES))
+                         for (key, move), (weight, games) in self.__moves.items() if games >= min_games)
+
+        with open(path, "wb") as file:
+            file.write(BOOK_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, BOOK_RECORD.size, len(records)))
+
+            for record in records:
+                file.write(BOOK_RECORD.pack(*record))
+
+        return len(records)
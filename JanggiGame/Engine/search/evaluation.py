@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import abc
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from helpers.board_observer import IBoardObserver
+from piece import PieceCategory, PieceColor
+from utils import BOARD_HEIGHT, SQUARE_COUNT, to_coordinates
+
+if TYPE_CHECKING:
+    from board import JanggiBoard
+    from piece import JanggiPiece
+
+# Material values in hundredths of a point. The General cannot be captured, so it carries no material value.
+PIECE_VALUES: Dict[PieceCategory, int] = {
+    PieceCategory.GENERAL: 0,
+    PieceCategory.GUARD: 300,
+    PieceCategory.HORSE: 500,
+    PieceCategory.ELEPHANT: 300,
+    PieceCategory.CHARIOT: 1300,
+    PieceCategory.CANNON: 700,
+    PieceCategory.SOLDIER: 200,
+}
+
+# Points added to RED's material under the counting rule, as BLUE moves first.
+COUNTING_BONUS: Dict[PieceColor, float] = {
+    PieceColor.BLUE: 0.0,
+    PieceColor.RED: 1.5,
+}
+
+# Piece-square tables in hundredths of a point, from BLUE's side of the board: row y = 0 is BLUE's back rank and row
+# y = 9 is RED's. RED's pieces read the table with the rows reversed. Squares a piece can never reach are 0.
+PIECE_SQUARE_TABLES: Dict[PieceCategory, List[List[int]]] = {
+    PieceCategory.GENERAL: [
+        [0, 0, 0, -5, -10, -5, 0, 0, 0],
+        [0, 0, 0, 0, 10, 0, 0, 0, 0],
+        [0, 0, 0, -10, -5, -10, 0, 0, 0],
+    ] + [[0] * 9 for _ in range(7)],
+    PieceCategory.GUARD: [
+        [0, 0, 0, 5, 0, 5, 0, 0, 0],
+        [0, 0, 0, 0, 10, 0, 0, 0, 0],
+        [0, 0, 0, -5, 0, -5, 0, 0, 0],
+    ] + [[0] * 9 for _ in range(7)],
+    PieceCategory.HORSE: [
+        [-20, -10, -5, -5, -5, -5, -5, -10, -20],
+        [-15, 0, 5, 5, 0, 5, 5, 0, -15],
+        [-10, 5, 10, 10, 10, 10, 10, 5, -10],
+        [-10, 5, 10, 15, 15, 15, 10, 5, -10],
+        [-5, 10, 15, 20, 20, 20, 15, 10, -5],
+        [-5, 10, 15, 20, 20, 20, 15, 10, -5],
+        [-5, 10, 20, 25, 25, 25, 20, 10, -5],
+        [-5, 10, 20, 25, 20, 25, 20, 10, -5],
+        [-10, 0, 10, 15, 15, 15, 10, 0, -10],
+        [-20, -10, -5, 0, 0, 0, -5, -10, -20],
+    ],
+    PieceCategory.ELEPHANT: [
+        [-5, 0, 0, 0, 0, 0, 0, 0, -5],
+        [0, 0, 5, 5, 0, 5, 5, 0, 0],
+        [0, 5, 5, 5, 10, 5, 5, 5, 0],
+        [0, 5, 10, 10, 10, 10, 10, 5, 0],
+        [0, 5, 10, 10, 15, 10, 10, 5, 0],
+        [0, 5, 10, 10, 15, 10, 10, 5, 0],
+        [0, 5, 10, 15, 15, 15, 10, 5, 0],
+        [0, 5, 10, 15, 15, 15, 10, 5, 0],
+        [0, 0, 5, 10, 10, 10, 5, 0, 0],
+        [-5, 0, 0, 0, 0, 0, 0, 0, -5],
+    ],
+    PieceCategory.CHARIOT: [
+        [0, 5, 5, 10, 5, 10, 5, 5, 0],
+        [0, 5, 5, 10, 10, 10, 5, 5, 0],
+        [0, 5, 5, 10, 10, 10, 5, 5, 0],
+        [5, 10, 10, 15, 15, 15, 10, 10, 5],
+        [5, 10, 10, 15, 15, 15, 10, 10, 5],
+        [5, 10, 10, 15, 15, 15, 10, 10, 5],
+        [5, 10, 10, 15, 15, 15, 10, 10, 5],
+        [10, 15, 15, 25, 25, 25, 15, 15, 10],
+        [10, 15, 15, 30, 30, 30, 15, 15, 10],
+        [5, 10, 10, 25, 20, 25, 10, 10, 5],
+    ],
+    PieceCategory.CANNON: [
+        [0, 0, 5, 10, 10, 10, 5, 0, 0],
+        [0, 5, 5, 10, 15, 10, 5, 5, 0],
+        [0, 10, 5, 10, 20, 10, 5, 10, 0],
+        [0, 5, 5, 5, 10, 5, 5, 5, 0],
+        [0, 0, 0, 5, 5, 5, 0, 0, 0],
+        [0, 0, 0, 5, 5, 5, 0, 0, 0],
+        [0, 0, 0, 5, 5, 5, 0, 0, 0],
+        [0, 0, 5, 10, 10, 10, 5, 0, 0],
+        [0, 0, 5, 10, 15, 10, 5, 0, 0],
+        [0, 0, 0, 5, 10, 5, 0, 0, 0],
+    ],
+    PieceCategory.SOLDIER: [
+        [0] * 9,
+        [0] * 9,
+        [0] * 9,
+        [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        [5, 0, 5, 5, 10, 5, 5, 0, 5],
+        [10, 10, 15, 20, 25, 20, 15, 10, 10],
+        [15, 20, 25, 30, 35, 30, 25, 20, 15],
+        [20, 30, 40, 50, 55, 50, 40, 30, 20],
+        [20, 30, 45, 60, 70, 60, 45, 30, 20],
+        [10, 20, 30, 40, 40, 40, 30, 20, 10],
+    ],
+}
+
+
+def square_values(color: PieceColor, category: PieceCategory) -> List[int]:
+    """
+    Return the material plus piece-square bonus of a piece on every square.
+
+    :param color: Color of the piece.
+    :param category: Category of the piece.
+    :return: Value in hundredths of a point, by square number.
+    """
+
+    table = PIECE_SQUARE_TABLES[category]
+    values = list()
+
+    for square in range(SQUARE_COUNT):
+        x, y = to_coordinates(square)
+        values.append(PIECE_VALUES[category] + table[y if color is PieceColor.BLUE else BOARD_HEIGHT - 1 - y][x])
+
+    return values
+
+
+class IEvaluator(metaclass=abc.ABCMeta):
+    """Interface for static evaluation of a position, used at the leaves of a search."""
+
+    @classmethod
+    def __subclasshook__(cls, subclass) -> bool:
+        return (hasattr(subclass, "evaluate") and callable(subclass.evaluate) or
+                NotImplemented)
+
+    @abc.abstractmethod
+    def evaluate(self, color: PieceColor) -> int:
+        """
+        Score the current position.
+
+        :param color: Side to score the position for.
+        :return: Score in hundredths of a point; positive values favour color.
+        """
+        raise NotImplementedError
+
+
+class MaterialEvaluator(IEvaluator):
+    """Scores a position by the difference in material, read from the board's PieceIndex."""
+
+    def __init__(self, board: JanggiBoard) -> None:
+        """
+        Create an evaluator for a board.
+
+        :param board: Board to evaluate.
+        """
+
+        self.__board: JanggiBoard = board
+
+    def evaluate(self, color: PieceColor) -> int:
+        """
+        Score the current position by material.
+
+        :param color: Side to score the position for.
+        :return: Material of color minus material of its opponent, in hundredths of a point.
+        """
+
+        index = self.__board.piece_index
+        score = 0
+
+        for category, value in PIECE_VALUES.items():
+            if value:
+                score += value * (len(index.pieces(color, category)) - len(index.pieces(color.opponent, category)))
+
+        return score
+
+
+class PieceSquareEvaluator(IEvaluator, IBoardObserver):
+    """
+    Scores a position by material plus piece-square tables, kept up to date incrementally.
+
+    Observes the board's Mailbox like the board's own indexes (see ZobristHash), so each change of a square's occupant
+    adds or subtracts one piece's value and square bonus, and evaluate() costs the same however the position was
+    reached. Material is kept separately, which gives the point count of the counting rule (see points).
+    """
+
+    def __init__(self, board: JanggiBoard) -> None:
+        """
+        Score the board's current contents and start observing its Mailbox.
+
+        :param board: Board to evaluate.
+        """
+
+        # Material plus square bonus of each piece on each square, indexed [color][category][square].
+        self.__square_values: List[List[List[int]]] = [
+            [square_values(color, category) for category in PieceCategory] for color in PieceColor
+        ]
+        self.__material_values: List[int] = [PIECE_VALUES[category] for category in PieceCategory]
+        self.__scores: List[int] = [0, 0]
+        self.__material: List[int] = [0, 0]
+        self.__mailbox = board.coord_map
+
+        for square, piece in enumerate(self.__mailbox.squares):
+            if piece is not None:
+                self.square_changed(square, None, piece)
+
+        self.__mailbox.attach(self)
+
+    def evaluate(self, color: PieceColor) -> int:
+        """
+        Score the current position by material and piece placement.
+
+        :param color: Side to score the position for.
+        :return: Score of color minus score of its opponent, in hundredths of a point.
+        """
+
+        scores = self.__scores
+
+        return scores[color.index] - scores[1 - color.index]
+
+    def material(self, color: PieceColor) -> int:
+        """Return the material of a side in hundredths of a point (see PIECE_VALUES)."""
+
+        return self.__material[color.index]
+
+    def points(self, color: PieceColor) -> float:
+        """
+        Return the point count of a side under the counting rule: Chariot 13, Cannon 7, Horse 5, Elephant 3, Guard 3
+        and Soldier 2, plus COUNTING_BONUS.
+
+        :param color: Side to count.
+        :return: Points.
+        """
+
+        return self.__material[color.index] / 100 + COUNTING_BONUS[color]
+
+    def detach(self) -> None:
+        """Stop following the board."""
+
+        self.__mailbox.detach(self)
+
+    def square_changed(self, square: int, previous: Optional[JanggiPiece], piece: Optional[JanggiPiece]) -> None:
+        if previous is not None:
+            color = previous.color.index
+            category = previous.category.index
+            self.__scores[color] -= self.__square_values[color][category][square]
+            self.__material[color] -= self.__material_values[category]
+
+        if piece is not None:
+            color = piece.color.index
+            category = piece.category.index
+            self.__scores[color] += self.__square_values[color][category][square]
+            self.__material[color] += self.__material_values[category]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from array import array
+from typing import List, Optional, TYPE_CHECKING
+
+from piece import PieceCategory
+from utils import MOVE_SQUARE_BITS, MOVE_SQUARE_MASK
+from .evaluation import PIECE_VALUES
+
+if TYPE_CHECKING:
+    from board import JanggiBoard
+    from piece import JanggiPiece
+
+# Ordering scores: the hash (or principal variation) move first, then captures, then killers, then quiet moves by
+# history. History scores are kept below KILLER_SCORE by aging.
+HASH_MOVE_SCORE: int = 1 << 30
+CAPTURE_SCORE: int = 1 << 28
+KILLER_SCORE: int = 1 << 24
+
+# Killer moves kept per ply.
+KILLERS_PER_PLY: int = 2
+
+# Size of the history table, indexed by packed move (source and destination squares).
+HISTORY_SIZE: int = 1 << 2 * MOVE_SQUARE_BITS
+
+# Most valuable victim, least valuable attacker: the victim's value dominates, the attacker's breaks ties.
+MVV_LVA: List[List[int]] = [
+    [CAPTURE_SCORE + PIECE_VALUES[victim] * 16 - PIECE_VALUES[attacker] // 100 for attacker in PieceCategory]
+    for victim in PieceCategory
+]
+
+
+class MoveOrderer:
+    """
+    Orders the moves of a position so that the ones most likely to cause a cutoff are searched first.
+
+    Captures are ordered by MVV-LVA (most valuable victim, least valuable attacker) using PIECE_VALUES. Quiet moves
+    that caused a beta cutoff are remembered as killer moves of their ply, which are tried right after the captures at
+    the same ply in sibling positions; every quiet cutoff also adds depth squared to a history score indexed by the
+    move's source and destination squares, which orders the remaining quiet moves.
+    """
+
+    def __init__(self, board: JanggiBoard, max_ply: int) -> None:
+        """
+        Create empty killer and history tables.
+
+        :param board: Board the moves are made on.
+        :param max_ply: Deepest ply killers are kept for.
+        """
+
+        self.__board: JanggiBoard = board
+        self.__killers: List[List[int]] = [[0] * KILLERS_PER_PLY for _ in range(max_ply + 1)]
+        self.__history: array = array("l", [0]) * HISTORY_SIZE
+
+    def order(self, moves: List[int], ply: int, hash_move: int = 0) -> List[int]:
+        """
+        Sort moves, best first.
+
+        :param moves: Legal packed moves of the current position; sorted in place.
+        :param ply: Distance from the root.
+        :param hash_move: Move to search first (from the transposition table or principal variation), or 0.
+        :return: The sorted list.
+        """
+
+        squares = self.__board.coord_map.squares
+        killers = self.__killers[ply]
+        history = self.__history
+        scores = dict()
+
+        for move in moves:
+            victim: Optional[JanggiPiece] = squares[move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK]
+
+            if move == hash_move:
+                scores[move] = HASH_MOVE_SCORE
+            elif victim is not None:
+                attacker: JanggiPiece = squares[move & MOVE_SQUARE_MASK]
+                scores[move] = MVV_LVA[victim.category.index][attacker.category.index]
+            elif move in killers:
+                scores[move] = KILLER_SCORE - killers.index(move)
+            else:
+                scores[move] = history[move]
+
+        moves.sort(key=scores.__getitem__, reverse=True)
+
+        return moves
+
+    def is_capture(self, move: int) -> bool:
+        """Determine if a move, not yet made, captures a piece."""
+
+        return self.__board.coord_map.squares[move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK] is not None
+
+    def record_cutoff(self, move: int, depth: int, ply: int) -> None:
+        """
+        Remember a quiet move that caused a beta cutoff.
+
+        :param move: Packed move.
+        :param depth: Remaining depth of the node the cutoff happened at.
+        :param ply: Distance from the root.
+        """
+
+        killers = self.__killers[ply]
+
+        if killers[0] != move:
+            killers[1:] = killers[:-1]
+            killers[0] = move
+
+        history = self.__history
+        history[move] += depth * depth
+
+        # Keep history scores below the killer scores.
+        if history[move] >= KILLER_SCORE:
+            self.age()
+
+    def age(self) -> None:
+        """Halve every history score, so that recent cutoffs weigh more than old ones."""
+
+        history = self.__history
+
+        for index in range(HISTORY_SIZE):
+            history[index] >>= 1
+
+    def new_search(self) -> None:
+        """Forget the killers of the last search and age its history."""
+
+        for killers in self.__killers:
+            killers[:] = [0] * KILLERS_PER_PLY
+
+        self.age()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from game import JanggiGame
+from .ordering import MoveOrderer
+from .searcher import MAX_PLY, SearchResult, Searcher
+from .transposition import DEFAULT_MEGABYTES, TranspositionTable
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+# State of a worker process: the shared transposition table and the shared memory block holding it.
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+_worker_table: Optional[TranspositionTable] = None
+
+
+def _attach_table(name: str, megabytes: float) -> None:
+    """Worker initializer: attach to the shared transposition table."""
+
+    global _worker_memory, _worker_table
+
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_table = TranspositionTable(megabytes, buffer=_worker_memory.buf)
+
+
+def _search_root_moves(position: str,
+                       moves: List[int],
+                       age: int,
+                       max_depth: int,
+                       max_nodes: Optional[int]) -> Tuple[List[SearchResult], int]:
+    """
+    Worker task: search a position with its root restricted to some of its moves.
+
+    :return: Tuple of the result of every completed iteration, shallowest first, and the number of nodes searched.
+    """
+
+    _worker_table.age = age
+    iterations: List[SearchResult] = list()
+
+    result = Searcher(JanggiGame(position), table=_worker_table).search(
+        max_depth=max_depth, max_nodes=max_nodes, on_iteration=iterations.append, root_moves=moves
+    )
+
+    return iterations, result.nodes
+
+
+class ParallelSearcher:
+    """
+    Searches a position on several processes by splitting its root moves between them.
+
+    The root moves are ordered (see MoveOrderer) and dealt out in turn, so each worker gets a share of the promising
+    ones. Every worker runs an ordinary Searcher restricted to its moves, and the best of their results is returned;
+    the score is the same as a single search to the same depth would find. With a node budget the workers may stop at
+    different depths, so results are only compared at the deepest depth every worker completed. The workers share one
+    TranspositionTable held in a multiprocessing SharedMemory block, so results found by one worker for positions
+    reachable from several root moves are reused by the others.
+
+    The processes and the shared memory are released by close(), or by using the searcher as a context manager.
+    """
+
+    def __init__(self, workers: Optional[int] = None, megabytes: float = DEFAULT_MEGABYTES) -> None:
+        """
+        Start the worker processes and allocate the shared transposition table.
+
+        :param workers: Number of worker processes; defaults to the number of CPUs.
+        :param megabytes: Memory budget of the shared transposition table.
+        """
+
+        self.__workers: int = max(1, workers if workers is not None else os.cpu_count() or 1)
+        self.__megabytes: float = megabytes
+        self.__memory = shared_memory.SharedMemory(create=True, size=TranspositionTable.size_for(megabytes))
+        self.__table: TranspositionTable = TranspositionTable(megabytes, buffer=self.__memory.buf)
+        self.__pool: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=self.__workers, initializer=_attach_table, initargs=(self.__memory.name, megabytes)
+        )
+
+    @property
+    def workers(self) -> int:
+        return self.__workers
+
+    @property
+    def table(self) -> TranspositionTable:
+        """View of the shared transposition table from this process (its counters only count this process)."""
+
+        return self.__table
+
+    def search(self, game: JanggiGame, max_depth: int, max_nodes: Optional[int] = None) -> SearchResult:
+        """
+        Search the current position of a game.
+
+        :param game: Game holding the position; it is not modified.
+        :param max_depth: Depth limit in plies.
+        :param max_nodes: Optional budget of nodes for each worker.
+        :return: Best result among the workers, with the nodes of all workers and the wall-clock time.
+        """
+
+        start = time.perf_counter()
+        moves = MoveOrderer(game.board, MAX_PLY).order(game.legal_moves(), 0)
+
+        # Checkmate or a forced pass: there is nothing to split.
+        if len(moves) < 2 or self.__workers == 1:
+            return Searcher(game, table=self.__table).search(max_depth=max_depth, max_nodes=max_nodes)
+
+        self.__table.new_search()
+        position = game.to_notation()
+        shares = [moves[index::self.__workers] for index in range(min(self.__workers, len(moves)))]
+        futures = [self.__pool.submit(_search_root_moves, position, share, self.__table.age, max_depth, max_nodes)
+                   for share in shares]
+        results = [future.result() for future in futures]
+        nodes = sum(worker_nodes for _, worker_nodes in results)
+        completed = [iterations for iterations, _ in results if iterations]
+
+        # No worker completed an iteration within its budget: fall back to any legal move.
+        if not completed:
+            return SearchResult(moves[0], 0, 0, list(), nodes, time.perf_counter() - start)
+
+        # Scores from different depths are not comparable; a worker that finished none of its moves has no score.
+        depth = min(iterations[-1].depth for iterations in completed)
+        best = max((next(result for result in iterations if result.depth == depth) for iterations in completed),
+                   key=lambda result: result.score)
+
+        return SearchResult(best.move, best.score, depth, best.pv, nodes, time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Stop the worker processes and free the shared transposition table."""
+
+        self.__pool.shutdown()
+        self.__table.close()
+        self.__memory.close()
+        self.__memory.unlink()
+
+    def __enter__(self) -> ParallelSearcher:
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[type],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from game import JanggiGame
+from .searcher import MAX_PLY, SearchResult, Searcher
+from .transposition import TranspositionTable
+
+
+class Ponderer:
+    """
+    Searches on the opponent's time: while the opponent thinks, the position after their expected reply (the second
+    move of the engine's principal variation) is searched in a background thread.
+
+    When the opponent moves, respond() either keeps the background search if the move was the expected one (a ponder
+    hit), letting it run on until the deadline or depth limit of the move, or stops it and searches the actual position
+    (a ponder miss). Both searches share one TranspositionTable, which may also be shared with the engine's own
+    searches, so that even a miss reuses the positions the two have in common.
+
+    The background search runs on a copy of the position, so the game may keep being used meanwhile. respond() blocks
+    until the move is chosen; from an event loop, call it through run_in_executor.
+    """
+
+    def __init__(self, table: Optional[TranspositionTable] = None) -> None:
+        """
+        Create a ponderer.
+
+        :param table: Transposition table shared by the background and follow-up searches; defaults to a new table.
+        """
+
+        self.__table: TranspositionTable = table if table is not None else TranspositionTable()
+        self.__game: Optional[JanggiGame] = None
+        self.__move: Optional[int] = None
+        self.__searcher: Optional[Searcher] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__result: Optional[SearchResult] = None
+        self.__target_depth: Optional[int] = None
+
+    @property
+    def table(self) -> TranspositionTable:
+        return self.__table
+
+    @property
+    def move(self) -> Optional[int]:
+        """The expected reply being pondered on, or None if not pondering."""
+
+        return self.__move
+
+    @property
+    def is_pondering(self) -> bool:
+        return self.__thread is not None
+
+    def start(self, game: JanggiGame, move: int) -> None:
+        """
+        Start searching the position after the opponent's expected reply, stopping any search already running.
+
+        :param game: Game holding the position with the opponent to move; it is not modified.
+        :param move: Expected packed reply of the opponent, which must be legal.
+        """
+
+        self.cancel()
+
+        self.__game = JanggiGame(game.to_notation())
+        self.__game.board.make(move)
+        self.__move = move
+        self.__result = None
+        self.__target_depth = None
+        self.__searcher = Searcher(self.__game, table=self.__table)
+        self.__thread = threading.Thread(target=self.__ponder, name="ponder", daemon=True)
+        self.__thread.start()
+
+    def respond(self, move: int, deadline: Optional[float] = None, max_depth: Optional[int] = None) -> SearchResult:
+        """
+        Choose a reply to the opponent's actual move, reusing the background search on a ponder hit.
+
+        :param move: Packed move the opponent played.
+        :param deadline: Optional time.monotonic() time by which the reply is chosen.
+        :param max_depth: Optional depth limit in plies.
+        :return: Result of the search of the position after the move; on a ponder hit, its statistics include the time
+                 spent pondering.
+        :raises RuntimeError: If not pondering.
+        :raises ValueError: If neither a deadline nor a depth limit is given.
+        """
+
+        if self.__thread is None:
+            raise RuntimeError("Not pondering.")
+
+        if deadline is None and max_depth is None:
+            raise ValueError("A depth limit or a deadline is required.")
+
+        if move != self.__move:
+            self.__stop()
+            board = self.__game.board
+            board.unmake()
+            board.make(move)
+
+            try:
+                return Searcher(self.__game, table=self.__table).search(max_depth=max_depth, deadline=deadline)
+            finally:
+                self.__reset()
+
+        # The depth limit is applied by the background search itself, as its iterations complete.
+        self.__target_depth = max_depth
+
+        if self.__result is not None and max_depth is not None and self.__result.depth >= max_depth:
+            self.__searcher.stop()
+
+        self.__thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        self.__stop()
+
+        try:
+            return self.__result
+        finally:
+            self.__reset()
+
+    def cancel(self) -> None:
+        """Stop pondering, discarding the background search; does nothing if not pondering."""
+
+        if self.__thread is not None:
+            self.__stop()
+            self.__reset()
+
+    def __ponder(self) -> None:
+        """Background thread: search the pondered position until stopped."""
+
+        result = self.__searcher.search(max_depth=MAX_PLY, on_iteration=self.__iteration_completed)
+
+        # A stop before the first iteration completes leaves only the final result.
+        if self.__result is None or result.depth >= self.__result.depth:
+            self.__result = result
+
+    def __iteration_completed(self, result: SearchResult) -> None:
+        """Background thread: keep the latest iteration, and stop once the depth limit of a ponder hit is reached."""
+
+        self.__result = result
+        target_depth = self.__target_depth
+
+        if target_depth is not None and result.depth >= target_depth:
+            self.__searcher.stop()
+
+    def __stop(self) -> None:
+        """Stop the background search and wait for its thread."""
+
+        self.__searcher.stop()
+        self.__thread.join()
+
+    def __reset(self) -> None:
+        self.__game = None
+        self.__move = None
+        self.__searcher = None
+        self.__thread = None
+        self.__result = None
+        self.__target_depth = None
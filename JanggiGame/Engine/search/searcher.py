@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, List, Optional, TYPE_CHECKING
+
+from utils import MOVE_SQUARE_BITS, MOVE_SQUARE_MASK, encode_move
+from .evaluation import MaterialEvaluator
+from .ordering import MoveOrderer
+from .see import static_exchange
+from .tablebase import LOSS, WIN
+from .transposition import BOUND_EXACT, BOUND_LOWER, BOUND_UPPER, TranspositionTable
+
+if TYPE_CHECKING:
+    from game import JanggiGame
+    from piece import PieceColor
+    from .evaluation import IEvaluator
+    from .tablebase import Tablebase
+
+# Score of a position in which the side to move has been checkmated; mates found nearer the root score higher.
+MATE_SCORE: int = 100000
+
+# Deepest ply the search will reach, which bounds the principal variation table.
+MAX_PLY: int = 64
+
+INFINITY: int = MATE_SCORE + 1
+
+# The deadline and stop requests are checked whenever the node count is a multiple of this power of two.
+LIMIT_CHECK_INTERVAL: int = 256
+
+
+class SearchResult:
+    """Outcome of a search: the best move found, its score and principal variation, and search statistics."""
+
+    def __init__(self, move: Optional[int], score: int, depth: int, pv: List[int], nodes: int, elapsed: float) -> None:
+        """
+        Create a search result.
+
+        :param move: Best packed move, or None if the side to move has no move at all.
+        :param score: Score of the best move for the side to move, in hundredths of a point.
+        :param depth: Depth of the last completed iteration.
+        :param pv: Principal variation, starting with the best move.
+        :param nodes: Number of nodes searched.
+        :param elapsed: Time spent searching, in seconds.
+        """
+
+        self.__move: Optional[int] = move
+        self.__score: int = score
+        self.__depth: int = depth
+        self.__pv: List[int] = pv
+        self.__nodes: int = nodes
+        self.__elapsed: float = elapsed
+
+    @property
+    def move(self) -> Optional[int]:
+        return self.__move
+
+    @property
+    def score(self) -> int:
+        return self.__score
+
+    @property
+    def depth(self) -> int:
+        return self.__depth
+
+    @property
+    def pv(self) -> List[int]:
+        return self.__pv
+
+    @property
+    def nodes(self) -> int:
+        return self.__nodes
+
+    @property
+    def elapsed(self) -> float:
+        return self.__elapsed
+
+    @property
+    def nps(self) -> float:
+        """Nodes searched per second."""
+
+        return self.__nodes / self.__elapsed if self.__elapsed > 0 else 0.0
+
+    @property
+    def is_mate(self) -> bool:
+        """True if the score is a forced checkmate, for either side."""
+
+        return abs(self.__score) >= MATE_SCORE - MAX_PLY
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(move={self.__move}, score={self.__score}, depth={self.__depth}, "
+                f"nodes={self.__nodes}, nps={self.nps:.0f})")
+
+
+class Searcher:
+    """
+    Chooses a move for the side to move with a negamax alpha-beta search and iterative deepening.
+
+    Moves are made and unmade directly on the game's JanggiBoard (see JanggiBoard.make), bypassing the game's
+    CommandManager, and legal moves come from the game's MoveGenerator. Results are kept in a TranspositionTable keyed
+    by the board's Zobrist hash, whose bounds cut off repeated positions and whose best moves are searched first; each
+    iteration also searches the principal variation of the previous one first. The remaining moves are ordered by a
+    MoveOrderer (captures by MVV-LVA, then killer moves, then quiet moves by history), unless ordering is disabled.
+
+    At the horizon a quiescence search resolves pending captures before the position is evaluated: the side to move
+    may stand pat on the static evaluation or try a capture, skipping captures that lose material by static exchange
+    evaluation (see static_exchange). Evasions are searched when in check, and optionally moves that give check on
+    the first quiescence ply.
+
+    With a Tablebase, positions below the root whose material it covers are scored exactly from it (as won, drawn or
+    lost with their distance to mate) instead of being searched.
+
+    The search stops at a depth limit, a node budget, a deadline, a call to stop(), or when a forced mate has been
+    found; all but the depth limit and a mate may interrupt an iteration, in which case the last completed iteration is
+    reported. stop() may be called from another thread, which makes the search usable as an anytime search (see
+    search_async).
+
+    Passing the turn is only searched when the side to move has no other legal move.
+    """
+
+    def __init__(self,
+                 game: JanggiGame,
+                 evaluator: Optional[IEvaluator] = None,
+                 table: Optional[TranspositionTable] = None,
+                 ordering: bool = True,
+                 quiescence: bool = True,
+                 quiescence_checks: bool = False,
+                 tablebase: Optional[Tablebase] = None) -> None:
+        """
+        Create a searcher for a game.
+
+        :param game: Game whose current position is searched; its board is restored after every search.
+        :param evaluator: Static evaluation used at the leaves; defaults to a MaterialEvaluator of the game's board.
+        :param table: Transposition table, kept between searches; defaults to a table of the default size.
+        :param ordering: Whether to order moves with a MoveOrderer; if False, only the hash and principal variation
+                         moves are moved to the front (for benchmarking).
+        :param quiescence: Whether to resolve captures at the horizon; if False, the horizon is evaluated statically.
+        :param quiescence_checks: Whether the first quiescence ply also searches quiet moves that give check.
+        :param tablebase: Optional endgame tablebase to score the positions it covers.
+        """
+
+        self.__board = game.board
+        self.__generator = game.move_generator
+        self.__evaluator: IEvaluator = evaluator if evaluator is not None else MaterialEvaluator(game.board)
+        self.__table: TranspositionTable = table if table is not None else TranspositionTable()
+        self.__orderer: Optional[MoveOrderer] = MoveOrderer(game.board, MAX_PLY) if ordering else None
+        self.__quiescence: bool = quiescence
+        self.__quiescence_checks: bool = quiescence_checks
+        self.__tablebase: Optional[Tablebase] = tablebase
+        self.__nodes: int = 0
+        self.__max_nodes: Optional[int] = None
+        self.__deadline: Optional[float] = None
+        self.__stopped: bool = False
+        self.__stop_requested: threading.Event = threading.Event()
+        self.__pv: List[List[int]] = [[] for _ in range(MAX_PLY + 1)]
+        self.__previous_pv: List[int] = list()
+        self.__follow_pv: bool = False
+        self.__root_moves: Optional[List[int]] = None
+
+    @property
+    def nodes(self) -> int:
+        """Number of nodes searched by the current (or last) search."""
+
+        return self.__nodes
+
+    @property
+    def table(self) -> TranspositionTable:
+        return self.__table
+
+    def stop(self) -> None:
+        """
+        Ask the running search to return its result as soon as possible; if no search is running, the next one returns
+        as soon as it starts. Safe to call from any thread.
+        """
+
+        self.__stop_requested.set()
+
+    def search(self,
+               max_depth: Optional[int] = None,
+               max_nodes: Optional[int] = None,
+               deadline: Optional[float] = None,
+               on_iteration: Optional[Callable[[SearchResult], None]] = None,
+               root_moves: Optional[List[int]] = None) -> SearchResult:
+        """
+        Search the current position, deepening one ply at a time until a limit is reached.
+
+        :param max_depth: Optional depth limit in plies.
+        :param max_nodes: Optional budget of nodes to search.
+        :param deadline: Optional time.monotonic() time by which the search returns.
+        :param on_iteration: Optional callback receiving the result of each completed iteration.
+        :param root_moves: Optional subset of the legal moves to restrict the root to; the result is then the best of
+                           these moves.
+        :return: Result of the deepest completed iteration.
+        :raises ValueError: If none of a depth limit, a node budget and a deadline is given.
+        """
+
+        if max_depth is None and max_nodes is None and deadline is None:
+            raise ValueError("A depth limit, a node budget or a deadline is required.")
+
+        depth_limit = MAX_PLY if max_depth is None else min(max_depth, MAX_PLY)
+
+        self.__nodes = 0
+        self.__max_nodes = max_nodes
+        self.__deadline = deadline
+        self.__stopped = self.__stop_requested.is_set()
+        self.__previous_pv = list()
+        self.__root_moves = root_moves
+        self.__table.new_search()
+
+        if self.__orderer is not None:
+            self.__orderer.new_search()
+
+        start = time.perf_counter()
+        result: Optional[SearchResult] = None
+
+        for depth in range(1, depth_limit + 1):
+            if depth > 1:
+                self.__check_limits()
+
+            if self.__stopped and result is not None:
+                break
+
+            self.__follow_pv = True
+            score = self.__negamax(depth, -INFINITY, INFINITY, 0)
+            pv = list(self.__pv[0])
+
+            # An interrupted iteration is only used if no iteration has completed, and only for the moves it finished.
+            if self.__stopped and (result is not None or not pv):
+                break
+
+            result = SearchResult(pv[0] if pv else None, score, depth, pv, self.__nodes, time.perf_counter() - start)
+
+            if on_iteration is not None:
+                on_iteration(result)
+
+            if self.__stopped or result.is_mate or result.move is None:
+                break
+
+            self.__previous_pv = pv
+
+        elapsed = time.perf_counter() - start
+        self.__stop_requested.clear()
+
+        if result is None:
+            return SearchResult(self.__first_move(), 0, 0, list(), self.__nodes, elapsed)
+
+        return SearchResult(result.move, result.score, result.depth, result.pv, self.__nodes, elapsed)
+
+    def __negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Score the current position for the side to move.
+
+        :param depth: Remaining depth in plies.
+        :param alpha: Lower bound of the search window.
+        :param beta: Upper bound of the search window.
+        :param ply: Distance from the root.
+        :return: Score of the position; meaningless if the search was stopped.
+        """
+
+        board = self.__board
+        pv = self.__pv[ply]
+        pv.clear()
+
+        if depth <= 0 and self.__quiescence:
+            self.__follow_pv = False
+            return self.__quiesce(alpha, beta, ply, 0)
+
+        self.__nodes += 1
+
+        if self.__max_nodes is not None and self.__nodes >= self.__max_nodes:
+            self.__stopped = True
+        elif not self.__nodes % LIMIT_CHECK_INTERVAL:
+            self.__check_limits()
+
+        color = board.turn
+
+        if depth <= 0 or ply >= MAX_PLY:
+            self.__follow_pv = False
+            return self.__evaluator.evaluate(color)
+
+        if self.__tablebase is not None and ply > 0:
+            hit = self.__tablebase.probe(board)
+
+            if hit is not None:
+                self.__follow_pv = False
+                result, distance = hit
+
+                if result == WIN:
+                    return MATE_SCORE - ply - distance
+                if result == LOSS:
+                    return -MATE_SCORE + ply + distance
+
+                return 0
+
+        key = board.position_hash
+        entry = self.__table.probe(key)
+        table_move = 0
+
+        if entry is not None:
+            table_move, table_depth, bound, score = entry
+            score = self.__score_from_table(score, ply)
+
+            # The root always searches, so that it has a principal variation to report.
+            if ply > 0 and table_depth >= depth and (bound == BOUND_EXACT or
+                                                     bound == BOUND_LOWER and score >= beta or
+                                                     bound == BOUND_UPPER and score <= alpha):
+                if table_move:
+                    pv.append(table_move)
+
+                return score
+
+        moves = self.__generator.legal_move_list(color)
+
+        if not moves:
+            general = board.general(color)
+
+            if general is None or board.attack_map.is_attacked(general.position.square, color.opponent):
+                return -MATE_SCORE + ply
+
+            moves = [encode_move(general.position.square, general.position.square)]
+
+        if ply == 0 and self.__root_moves is not None:
+            moves = [move for move in moves if move in self.__root_moves]
+
+        # Search the previous iteration's principal variation first, otherwise the table's best move.
+        first = table_move
+
+        if self.__follow_pv:
+            if ply < len(self.__previous_pv) and self.__previous_pv[ply] in moves:
+                first = self.__previous_pv[ply]
+            else:
+                self.__follow_pv = False
+
+        if self.__orderer is not None:
+            self.__orderer.order(moves, ply, first)
+        elif first and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+
+        original_alpha = alpha
+        best = -INFINITY
+        best_move = 0
+
+        for move in moves:
+            board.make(move)
+            score = -self.__negamax(depth - 1, -beta, -alpha, ply + 1)
+            board.unmake()
+
+            self.__follow_pv = False
+
+            if self.__stopped:
+                return best
+
+            if score > best:
+                best = score
+                best_move = move
+
+                if score > alpha:
+                    alpha = score
+                    pv[:] = [move]
+                    pv.extend(self.__pv[ply + 1])
+
+                    if alpha >= beta:
+                        if self.__orderer is not None and not self.__orderer.is_capture(move):
+                            self.__orderer.record_cutoff(move, depth, ply)
+                        break
+
+        if best >= beta:
+            bound = BOUND_LOWER
+        elif best > original_alpha:
+            bound = BOUND_EXACT
+        else:
+            bound = BOUND_UPPER
+
+        # The score of a restricted root is not the score of the position.
+        if ply > 0 or self.__root_moves is None:
+            self.__table.store(key, best_move, depth, bound, self.__score_to_table(best, ply))
+
+        return best
+
+    def __quiesce(self, alpha: int, beta: int, ply: int, depth: int) -> int:
+        """
+        Score the current position for the side to move once the captures available in it have been resolved.
+
+        :param alpha: Lower bound of the search window.
+        :param beta: Upper bound of the search window.
+        :param ply: Distance from the root.
+        :param depth: Distance from the horizon.
+        :return: Score of the position; meaningless if the search was stopped.
+        """
+
+        board = self.__board
+        generator = self.__generator
+
+        self.__nodes += 1
+
+        if self.__max_nodes is not None and self.__nodes >= self.__max_nodes:
+            self.__stopped = True
+        elif not self.__nodes % LIMIT_CHECK_INTERVAL:
+            self.__check_limits()
+
+        color = board.turn
+
+        if ply >= MAX_PLY:
+            return self.__evaluator.evaluate(color)
+
+        general = board.general(color)
+        in_check = general is not None and board.attack_map.is_attacked(general.position.square, color.opponent)
+
+        if in_check:
+            # No standing pat in check: every evasion is searched.
+            best = -INFINITY
+            moves = generator.legal_move_list(color)
+
+            if not moves:
+                return -MATE_SCORE + ply
+        else:
+            best = self.__evaluator.evaluate(color)
+
+            if best >= beta:
+                return best
+
+            alpha = max(alpha, best)
+            moves = [move for move in generator.legal_moves(color, captures_only=True)
+                     if static_exchange(board, move) >= 0]
+
+            if self.__quiescence_checks and depth == 0:
+                moves.extend(self.__quiet_checks(color))
+
+        if self.__orderer is not None:
+            self.__orderer.order(moves, ply)
+
+        for move in moves:
+            board.make(move)
+            score = -self.__quiesce(-beta, -alpha, ply + 1, depth + 1)
+            board.unmake()
+
+            if self.__stopped:
+                return best
+
+            if score > best:
+                best = score
+
+                if score > alpha:
+                    alpha = score
+
+                    if alpha >= beta:
+                        break
+
+        return best
+
+    def __quiet_checks(self, color: PieceColor) -> List[int]:
+        """Return the legal non-capturing moves of color that give check."""
+
+        board = self.__board
+        enemy_general = board.general(color.opponent)
+
+        if enemy_general is None:
+            return list()
+
+        squares = board.coord_map.squares
+        checks = list()
+
+        for move in self.__generator.legal_moves(color):
+            if squares[move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK] is not None:
+                continue
+
+            board.make(move)
+            if board.attack_map.is_attacked(enemy_general.position.square, color):
+                checks.append(move)
+            board.unmake()
+
+        return checks
+
+    def __check_limits(self) -> None:
+        """Stop the search if a stop has been requested or the deadline has passed."""
+
+        if self.__stop_requested.is_set() or self.__deadline is not None and time.monotonic() >= self.__deadline:
+            self.__stopped = True
+
+    @staticmethod
+    def __score_to_table(score: int, ply: int) -> int:
+        """Convert a mate score from distance-to-root to distance-to-this-position, which is the same everywhere."""
+
+        if score >= MATE_SCORE - MAX_PLY:
+            return score + ply
+        if score <= MAX_PLY - MATE_SCORE:
+            return score - ply
+
+        return score
+
+    @staticmethod
+    def __score_from_table(score: int, ply: int) -> int:
+        """Convert a mate score read from the table back to distance-to-root."""
+
+        if score >= MATE_SCORE - MAX_PLY:
+            return score - ply
+        if score <= MAX_PLY - MATE_SCORE:
+            return score + ply
+
+        return score
+
+    def __first_move(self) -> Optional[int]:
+        """Return any legal move of the side to move, for searches stopped before completing a single move."""
+
+        return next(self.__generator.legal_moves(self.__board.turn), None)
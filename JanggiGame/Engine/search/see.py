@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import List, Optional, TYPE_CHECKING
+
+from piece import PieceCategory
+from utils import MOVE_SQUARE_BITS, MOVE_SQUARE_MASK
+from .evaluation import PIECE_VALUES
+
+if TYPE_CHECKING:
+    from board import JanggiBoard
+    from piece import JanggiPiece
+
+# Value of a General in an exchange: it may only recapture last, as any further attacker would capture it.
+GENERAL_EXCHANGE_VALUE: int = 100000
+
+EXCHANGE_VALUES: List[int] = [
+    GENERAL_EXCHANGE_VALUE if category is PieceCategory.GENERAL else PIECE_VALUES[category]
+    for category in PieceCategory
+]
+
+# Categories from the least to the most valuable, the order in which each side recaptures.
+RECAPTURE_ORDER: List[PieceCategory] = sorted(PieceCategory, key=lambda category: EXCHANGE_VALUES[category.index])
+
+
+def static_exchange(board: JanggiBoard, move: int) -> int:
+    """
+    Estimate the material won by a capture, assuming both sides then keep recapturing on the destination square with
+    their least valuable attacker for as long as it pays.
+
+    Attackers are found by the Bitboard in the hypothetical position after each capture, so pieces that were blocked
+    by a capturing piece join in, and a Cannon gains or loses its screen as pieces leave its line (palace diagonals
+    included). Pins are ignored.
+
+    :param board: Board holding the position before the move.
+    :param move: Packed move; if its destination is empty the result is the loss (if any) of the moving piece.
+    :return: Expected material gain for the side making the move, in hundredths of a point.
+    """
+
+    bitboard = board.bitboard
+    squares = board.coord_map.squares
+    source = move & MOVE_SQUARE_MASK
+    target = move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
+    target_bit = 1 << target
+
+    attacker: JanggiPiece = squares[source]
+    victim: Optional[JanggiPiece] = squares[target]
+    cannon_index = PieceCategory.CANNON.index
+
+    occupancy = bitboard.occupancy & ~(1 << source) | target_bit
+    cannons = bitboard.category_mask(PieceCategory.CANNON) & ~(1 << source | target_bit)
+    if attacker.category.index == cannon_index:
+        cannons |= target_bit
+
+    removed = 1 << source
+    gains = [EXCHANGE_VALUES[victim.category.index] if victim is not None else 0]
+    on_target = EXCHANGE_VALUES[attacker.category.index]
+    side = attacker.color.opponent
+
+    while True:
+        attackers = bitboard.attackers_of(target, side, occupancy, cannons, removed | target_bit)
+
+        if not attackers:
+            break
+
+        for category in RECAPTURE_ORDER:
+            candidates = attackers & bitboard.piece_mask(side, category)
+            if candidates:
+                break
+
+        recapturer = candidates & -candidates
+        gains.append(on_target - gains[-1])
+
+        # Neither side can improve on standing pat from here.
+        if max(-gains[-2], gains[-1]) < 0:
+            break
+
+        on_target = EXCHANGE_VALUES[category.index]
+        occupancy &= ~recapturer
+        removed |= recapturer
+        cannons = cannons & ~recapturer | target_bit if category.index == cannon_index else cannons & ~target_bit
+        side = side.opponent
+
+    # Each side chooses between recapturing and stopping, from the last capture back to the first.
+    for index in range(len(gains) - 1, 0, -1):
+        gains[index - 1] = -max(-gains[index - 1], gains[index])
+
+    return gains[0]
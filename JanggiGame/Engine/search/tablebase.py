@@ -0,0 +1,599 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from game import JanggiGame
+from helpers.notation import LETTER_PIECES, PIECE_LETTERS, TURN_LETTERS
+from piece import PieceCategory, PieceColor
+from utils import BOARD_HEIGHT, BOARD_WIDTH, MOVE_SQUARE_BITS, MOVE_SQUARE_MASK, SQUARE_COUNT, Point2D, encode_move, \
+    to_coordinates, to_square
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from board import JanggiBoard
+    from piece import JanggiPiece
+
+# File layout: a header (magic, format version, value size, material, position count) followed by one little-endian
+# 16-bit value per position index (see Material.index).
+TABLE_MAGIC: bytes = b"JGTB"
+TABLE_VERSION: int = 1
+TABLE_HEADER: struct.Struct = struct.Struct("<4sHH16sQ")
+TABLE_SUFFIX: str = ".jtb"
+
+# Values: a distance to mate in plies, odd if the side to move mates, even if it is mated (0 if it is mated now);
+# or one of these markers.
+ILLEGAL_VALUE: int = 0xFFFF
+DRAW_VALUE: int = 0xFFFE
+
+# Results of a probe, for the side to move.
+WIN: int = 1
+DRAW: int = 0
+LOSS: int = -1
+
+# A probe hit: (WIN, DRAW or LOSS, distance to mate in plies, or 0 for a draw).
+ProbeResult = Tuple[int, int]
+
+# A position's moves, as found by a worker: whether it is checkmate, the indices of the positions reached by moves
+# that keep the material, and the (material, index) pairs reached by captures. None if the position is illegal.
+Successors = Optional[Tuple[bool, List[int], List[Tuple[str, int]]]]
+
+
+def _domain(color: PieceColor, category: PieceCategory) -> List[int]:
+    """
+    Return the squares a piece can ever stand on: its palace for a General or Guard, its own soldiers' rank and
+    beyond for a Soldier, and the whole board otherwise.
+    """
+
+    blue = color is PieceColor.BLUE
+    domain = list()
+
+    for square in range(SQUARE_COUNT):
+        x, y = to_coordinates(square)
+
+        if category is PieceCategory.GENERAL or category is PieceCategory.GUARD:
+            if 3 <= x <= 5 and (y <= 2 if blue else y >= BOARD_HEIGHT - 3):
+                domain.append(square)
+        elif category is PieceCategory.SOLDIER:
+            if y >= 3 if blue else y <= BOARD_HEIGHT - 4:
+                domain.append(square)
+        else:
+            domain.append(square)
+
+    return domain
+
+
+class Material:
+    """
+    A set of pieces, and the numbering of every placement of them with a side to move.
+
+    The pieces are ordered by color (BLUE first) and then by category. Each piece ranges over the squares it can
+    reach in play (see _domain); a position's index is the side to move plus twice the mixed-radix number formed by
+    the pieces' positions within their domains, the first piece varying fastest. Placements of two identical pieces
+    that differ only by swapping them get two indices with the same value.
+
+    Materials are named like position notation: upper case letters for BLUE's pieces and lower case for RED's, in
+    piece order, e.g. "GRg" for a General and Chariot against a General.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Parse a material name.
+
+        :param name: Material name; the letters may be in any order.
+        :raises ValueError: If the name has a letter that is not a piece, or does not have one General of each color.
+        """
+
+        pieces = list()
+
+        for letter in name:
+            category = LETTER_PIECES.get(letter.lower())
+
+            if category is None:
+                raise ValueError(f"Invalid material: {name!r}")
+
+            pieces.append((PieceColor.BLUE if letter.isupper() else PieceColor.RED, category))
+
+        pieces.sort(key=lambda piece: (piece[0].index, piece[1].index))
+
+        if [piece for piece in pieces if piece[1] is PieceCategory.GENERAL] != \
+                [(PieceColor.BLUE, PieceCategory.GENERAL), (PieceColor.RED, PieceCategory.GENERAL)]:
+            raise ValueError(f"Invalid material: {name!r}; it must have one General of each color.")
+
+        self.__pieces: List[Tuple[PieceColor, PieceCategory]] = pieces
+        self.__name: str = "".join(self.letter(*piece) for piece in pieces)
+        self.__domains: List[List[int]] = [_domain(*piece) for piece in pieces]
+        self.__lookups: List[List[int]] = list()
+
+        for domain in self.__domains:
+            lookup = [-1] * SQUARE_COUNT
+            for position, square in enumerate(domain):
+                lookup[square] = position
+            self.__lookups.append(lookup)
+
+        self.__size: int = 2
+
+        for domain in self.__domains:
+            self.__size *= len(domain)
+
+    @staticmethod
+    def letter(color: PieceColor, category: PieceCategory) -> str:
+        """Return the letter of a piece in material names."""
+
+        letter = PIECE_LETTERS[category]
+
+        return letter.upper() if color is PieceColor.BLUE else letter
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def pieces(self) -> List[Tuple[PieceColor, PieceCategory]]:
+        return self.__pieces
+
+    @property
+    def size(self) -> int:
+        """Number of position indices."""
+
+        return self.__size
+
+    def without(self, index: int) -> Material:
+        """Return the material left after the piece at an index of pieces is captured."""
+
+        return Material(self.__name[:index] + self.__name[index + 1:])
+
+    def index(self, squares: List[int], turn: PieceColor) -> int:
+        """
+        Return the index of a position.
+
+        :param squares: Square of each piece, in piece order.
+        :param turn: Side to move.
+        :return: Position index, or -1 if a piece is outside its domain.
+        """
+
+        index = 0
+        radix = 2
+
+        for square, lookup, domain in zip(squares, self.__lookups, self.__domains):
+            position = lookup[square]
+
+            if position < 0:
+                return -1
+
+            index += position * radix
+            radix *= len(domain)
+
+        return index + turn.index
+
+    def placement(self, index: int) -> Tuple[List[int], PieceColor]:
+        """
+        Return the position with an index.
+
+        :param index: Position index.
+        :return: Tuple of the square of each piece, in piece order, and the side to move.
+        """
+
+        turn = PieceColor.RED if index & 1 else PieceColor.BLUE
+        index >>= 1
+        squares = list()
+
+        for domain in self.__domains:
+            index, position = divmod(index, len(domain))
+            squares.append(domain[position])
+
+        return squares, turn
+
+    def game(self) -> JanggiGame:
+        """Return a game holding the pieces, placed anywhere in their domains (for set_position)."""
+
+        letters: Dict[int, str] = dict()
+
+        for (color, category), domain in zip(self.__pieces, self.__domains):
+            square = next(square for square in domain if square not in letters)
+            letters[square] = self.letter(color, category)
+
+        ranks = list()
+
+        for y in range(BOARD_HEIGHT - 1, -1, -1):
+            rank = "".join(letters.get(to_square(x, y), "1") for x in range(BOARD_WIDTH))
+            ranks.append(re.sub(r"1+", lambda run: str(len(run.group())), rank))
+
+        return JanggiGame("/".join(ranks) + " " + TURN_LETTERS[PieceColor.BLUE])
+
+    def __repr__(self) -> str:
+        return f"Material({self.__name!r})"
+
+
+def set_position(board: JanggiBoard, pieces: List[JanggiPiece], squares: List[int], turn: PieceColor) -> bool:
+    """
+    Move the pieces of a board to the given squares and set the side to move.
+
+    :param board: Board holding exactly the pieces.
+    :param pieces: The board's pieces, in the order of squares.
+    :param squares: Square for each piece.
+    :param turn: Side to move.
+    :return: False if two pieces would share a square (the board is then unchanged), True otherwise.
+    """
+
+    if len(set(squares)) != len(squares):
+        return False
+
+    mailbox = board.coord_map
+    moved = [(piece, square) for piece, square in zip(pieces, squares) if piece.position.square != square]
+
+    # Lift every moving piece before placing any, as a piece may move to a square another one is leaving.
+    for piece, _ in moved:
+        mailbox.set_square(piece.position.square, None)
+
+    for piece, square in moved:
+        mailbox.set_square(square, piece)
+        piece.position = Point2D.from_square(square)
+
+    board.turn = turn
+
+    return True
+
+
+def _successors(name: str, start: int, stop: int) -> List[Successors]:
+    """Worker task: list the moves of the positions of a material with indices in [start, stop)."""
+
+    material = Material(name)
+    game = material.game()
+    board = game.board
+    generator = game.move_generator
+    pieces = sorted(board.coord_map.occupants(), key=lambda piece: (piece.color.index, piece.category.index))
+    sub_materials = [None if category is PieceCategory.GENERAL else material.without(position)
+                     for position, (_, category) in enumerate(material.pieces)]
+    results: List[Successors] = list()
+
+    for index in range(start, stop):
+        placement, turn = material.placement(index)
+
+        if not set_position(board, pieces, placement, turn):
+            results.append(None)
+            continue
+
+        # The side that just moved may not be in check.
+        enemy_general = board.general(turn.opponent)
+        if board.attack_map.is_attacked(enemy_general.position.square, turn):
+            results.append(None)
+            continue
+
+        moves = generator.legal_move_list(turn)
+        general = board.general(turn)
+
+        if not moves:
+            if board.attack_map.is_attacked(general.position.square, turn.opponent):
+                results.append((True, list(), list()))
+                continue
+
+            moves = [encode_move(general.position.square, general.position.square)]
+
+        internal = list()
+        external = list()
+        opponent = turn.opponent
+
+        for move in moves:
+            source = move & MOVE_SQUARE_MASK
+            destination = move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
+            child = list(placement)
+            child[placement.index(source)] = destination
+
+            if destination == source or destination not in placement:
+                internal.append(material.index(child, opponent))
+            else:
+                position = placement.index(destination)
+                del child[position]
+                external.append((sub_materials[position].name, sub_materials[position].index(child, opponent)))
+
+        results.append((False, internal, external))
+
+    return results
+
+
+def solve(material: Material, successors: List[Successors], resolved: Dict[str, array]) -> array:
+    """
+    Solve a material by retrograde analysis.
+
+    Every position's value is settled in increasing order of distance to mate, starting from the checkmates and the
+    captures into already solved materials: a position is won as soon as one of its moves reaches a lost position, and
+    lost once all of its moves reach won positions. The moves are walked backwards, from each settled position to the
+    positions that reach it. Positions never settled are draws.
+
+    :param material: Material being solved.
+    :param successors: Moves of each position, by index.
+    :param resolved: Values of the materials reached by captures, by name.
+    :return: Value of each position, by index.
+    """
+
+    size = material.size
+    values = array("H", [ILLEGAL_VALUE]) * size
+    remaining = array("l", [0]) * size
+    longest = array("H", [0]) * size
+    can_lose = bytearray(size)
+    counts = array("l", [0]) * (size + 1)
+    queue: List[Tuple[int, int]] = list()
+
+    for index, entry in enumerate(successors):
+        if entry is None:
+            continue
+
+        values[index] = DRAW_VALUE
+        mated, internal, external = entry
+
+        if mated:
+            queue.append((0, index))
+            continue
+
+        remaining[index] = len(internal)
+        can_lose[index] = 1
+
+        for name, child in external:
+            value = resolved[name][child]
+
+            if value == DRAW_VALUE:
+                can_lose[index] = 0
+            elif value & 1:
+                longest[index] = max(longest[index], value + 1)
+            else:
+                # A capture into a lost position wins, so this position can never be lost.
+                can_lose[index] = 0
+                queue.append((value + 1, index))
+
+        for child in internal:
+            counts[child + 1] += 1
+
+        if not internal and can_lose[index]:
+            queue.append((longest[index], index))
+
+    # Predecessor lists, as one array indexed by the running totals of the counts.
+    for index in range(size):
+        counts[index + 1] += counts[index]
+
+    predecessors = array("l", [0]) * counts[size]
+    filled = array("l", counts[:size])
+
+    for index, entry in enumerate(successors):
+        if entry is not None:
+            for child in entry[1]:
+                predecessors[filled[child]] = index
+                filled[child] += 1
+
+    settled = bytearray(size)
+    heapq.heapify(queue)
+
+    while queue:
+        distance, index = heapq.heappop(queue)
+
+        if settled[index]:
+            continue
+
+        settled[index] = 1
+        values[index] = distance
+
+        for parent in predecessors[counts[index]:counts[index + 1]]:
+            if settled[parent]:
+                continue
+
+            if distance & 1:
+                remaining[parent] -= 1
+                longest[parent] = max(longest[parent], distance + 1)
+
+                if remaining[parent] == 0 and can_lose[parent]:
+                    heapq.heappush(queue, (longest[parent], parent))
+            else:
+                heapq.heappush(queue, (distance + 1, parent))
+
+    return values
+
+
+def table_path(directory: str, name: str) -> str:
+    """Return the path of a material's table in a directory."""
+
+    return os.path.join(directory, name + TABLE_SUFFIX)
+
+
+def write_table(path: str, material: Material, values: array) -> None:
+    """
+    Write a table file.
+
+    :param path: Path of the file to create or overwrite.
+    :param material: Material of the table.
+    :param values: Value of each position, by index.
+    """
+
+    if sys.byteorder != "little":
+        values = array("H", values)
+        values.byteswap()
+
+    with open(path, "wb") as file:
+        file.write(TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, values.itemsize, material.name.encode("ascii"),
+                                     len(values)))
+        values.tofile(file)
+
+
+def generate(name: str, directory: str, workers: int = 1) -> array:
+    """
+    Generate the table of a material, and first those of the materials its captures lead to that are not yet in the
+    directory.
+
+    :param name: Material name (see Material).
+    :param directory: Directory holding the tables; the new tables are written to it.
+    :param workers: Number of processes listing moves; 1 lists them in this process.
+    :return: Value of each position of the material, by index.
+    :raises ValueError: If the name is not a valid material.
+    """
+
+    material = Material(name)
+    resolved: Dict[str, array] = dict()
+
+    for position, (_, category) in enumerate(material.pieces):
+        sub_material = None if category is PieceCategory.GENERAL else material.without(position)
+
+        if sub_material is None or sub_material.name in resolved:
+            continue
+
+        path = table_path(directory, sub_material.name)
+
+        if os.path.exists(path):
+            with open(path, "rb") as file:
+                file.seek(TABLE_HEADER.size)
+                resolved[sub_material.name] = array("H")
+                resolved[sub_material.name].frombytes(file.read())
+
+            if sys.byteorder != "little":
+                resolved[sub_material.name].byteswap()
+        else:
+            resolved[sub_material.name] = generate(sub_material.name, directory, workers)
+
+    size = material.size
+
+    if workers > 1:
+        chunk = -(-size // (workers * 8))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_successors, material.name, start, min(start + chunk, size))
+                       for start in range(0, size, chunk)]
+            successors = [entry for future in futures for entry in future.result()]
+    else:
+        successors = _successors(material.name, 0, size)
+
+    values = solve(material, successors, resolved)
+    write_table(table_path(directory, material.name), material, values)
+
+    return values
+
+
+class Tablebase:
+    """
+    Endgame tablebase: the exact result and distance to mate of every position of some small materials.
+
+    Each material's table is a file of 16-bit values, one per position index (see Material), written by generate().
+    The files are opened with mmap and read in place, so opening a tablebase costs nothing and every process that
+    opens the same files shares one copy of them in the page cache.
+
+    Tables are generated by retrograde analysis from the checkmates: positions are settled in increasing order of
+    distance to mate, a position being won once any move reaches a lost one and lost once every move reaches a won
+    one. Passing the turn is a move only when there is no other (see Searcher), and positions whose side not to move
+    is in check are illegal.
+
+    The files are released by close(), or by using the tablebase as a context manager.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Open every table in a directory.
+
+        :param directory: Directory holding table files.
+        :raises ValueError: If a table file is invalid.
+        """
+
+        self.__maps: List[mmap.mmap] = list()
+        self.__tables: Dict[str, Tuple[Material, memoryview]] = dict()
+        self.__max_pieces: int = 0
+
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.endswith(TABLE_SUFFIX):
+                self.__open(os.path.join(directory, file_name))
+
+    @property
+    def materials(self) -> List[str]:
+        """Names of the materials covered."""
+
+        return sorted(self.__tables)
+
+    @property
+    def max_pieces(self) -> int:
+        """Number of pieces (Generals included) of the largest material covered."""
+
+        return self.__max_pieces
+
+    def probe(self, board: JanggiBoard) -> Optional[ProbeResult]:
+        """
+        Look up the current position of a board.
+
+        :param board: Board holding the position.
+        :return: Tuple of the result for the side to move (WIN, DRAW or LOSS) and the distance to mate in plies (0 for
+                 a draw), or None if the position's material is not covered.
+        """
+
+        squares = board.coord_map.squares
+        occupancy = board.bitboard.occupancy
+
+        if bin(occupancy).count("1") > self.__max_pieces:
+            return None
+
+        pieces = list()
+
+        while occupancy:
+            bit = occupancy & -occupancy
+            pieces.append(squares[bit.bit_length() - 1])
+            occupancy ^= bit
+
+        pieces.sort(key=lambda piece: (piece.color.index, piece.category.index))
+        table = self.__tables.get("".join(Material.letter(piece.color, piece.category) for piece in pieces))
+
+        if table is None:
+            return None
+
+        material, values = table
+        index = material.index([piece.position.square for piece in pieces], board.turn)
+        value = values[index] if index >= 0 else ILLEGAL_VALUE
+
+        if value == ILLEGAL_VALUE:
+            return None
+        if value == DRAW_VALUE:
+            return DRAW, 0
+
+        return (WIN if value & 1 else LOSS), value
+
+    def close(self) -> None:
+        """Unmap the table files."""
+
+        for _, values in self.__tables.values():
+            values.release()
+
+        for table_map in self.__maps:
+            table_map.close()
+
+        self.__tables.clear()
+        self.__maps.clear()
+
+    def __open(self, path: str) -> None:
+        """Map a table file."""
+
+        with open(path, "rb") as file:
+            table_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, value_size, name, count = TABLE_HEADER.unpack_from(table_map, 0)
+            material = Material(name.rstrip(b"\0").decode("ascii"))
+        except (struct.error, UnicodeDecodeError, ValueError):
+            table_map.close()
+            raise ValueError(f"Not a tablebase file: {path!r}")
+
+        if magic != TABLE_MAGIC or version != TABLE_VERSION or value_size != 2 or count != material.size or \
+                len(table_map) != TABLE_HEADER.size + count * value_size or sys.byteorder != "little":
+            table_map.close()
+            raise ValueError(f"Not a tablebase file, or an unsupported version: {path!r}")
+
+        self.__maps.append(table_map)
+        self.__tables[material.name] = (material, memoryview(table_map)[TABLE_HEADER.size:].cast("H"))
+        self.__max_pieces = max(self.__max_pieces, len(material.pieces))
+
+    def __enter__(self) -> Tablebase:
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[type],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
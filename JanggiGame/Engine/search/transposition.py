@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from array import array
+from typing import Any, Optional, Tuple
+
+# Bound types: the stored score is exact, a lower bound (the search failed high) or an upper bound (it failed low).
+BOUND_EXACT: int = 1
+BOUND_LOWER: int = 2
+BOUND_UPPER: int = 3
+
+# Size of the table when no budget is given.
+DEFAULT_MEGABYTES: int = 16
+
+# Each bucket holds two entries of two 64-bit words each (key and data): a depth-preferred slot and an
+# always-replace slot.
+BUCKET_WORDS: int = 4
+BUCKET_BYTES: int = BUCKET_WORDS * 8
+
+# Layout of an entry's data word, from the least significant bit.
+MOVE_BITS: int = 14
+DEPTH_SHIFT: int = MOVE_BITS
+DEPTH_BITS: int = 8
+BOUND_SHIFT: int = DEPTH_SHIFT + DEPTH_BITS
+AGE_SHIFT: int = BOUND_SHIFT + 2
+AGE_BITS: int = 8
+SCORE_SHIFT: int = 32
+SCORE_OFFSET: int = 1 << 20
+
+MOVE_MASK: int = (1 << MOVE_BITS) - 1
+DEPTH_MASK: int = (1 << DEPTH_BITS) - 1
+AGE_MASK: int = (1 << AGE_BITS) - 1
+
+# A probe hit: (best move, depth, bound, score).
+TableEntry = Tuple[int, int, int, int]
+
+
+class TranspositionTable:
+    """
+    Fixed-size hash table of search results, keyed by the 64-bit Zobrist hash of a position.
+
+    Entries are packed into a flat array of unsigned 64-bit words rather than held as objects: each entry is a key
+    word and a data word holding the best move, depth, bound type, score and the age of the search that stored it.
+    The key word is stored XOR-ed with the data word, so an entry whose two words do not belong together (for
+    instance, written concurrently) fails verification instead of returning another position's data.
+
+    The table is divided into buckets of two entries selected by the low bits of the hash. The first slot keeps the
+    deepest result (or any result from the current search if it holds one from an earlier search); the second is
+    always replaced, so recent shallow results are still kept.
+
+    The words can live in a buffer supplied by the caller, such as a multiprocessing SharedMemory block, so that
+    several processes share one table. Writes are not locked; the XOR check discards entries torn by concurrent
+    writes. Counters and the search age are kept per instance.
+    """
+
+    def __init__(self, megabytes: float = DEFAULT_MEGABYTES, buffer: Optional[Any] = None) -> None:
+        """
+        Allocate an empty table, or attach to an existing one.
+
+        :param megabytes: Memory budget in megabytes; the table uses the largest power-of-two number of buckets that
+                          fits in it.
+        :param buffer: Optional writable buffer of at least size_for(megabytes) bytes to hold the table instead of
+                       allocating one; its contents are used as they are.
+        :raises ValueError: If the budget is too small for a single bucket, or the buffer too small for the budget.
+        """
+
+        size = self.size_for(megabytes)
+        self.__mask: int = size // BUCKET_BYTES - 1
+
+        if buffer is None:
+            self.__words: Any = array("Q", [0]) * (size // 8)
+        elif len(buffer) < size:
+            raise ValueError(f"Buffer of {len(buffer)} bytes too small for a {size} byte table")
+        else:
+            self.__words = memoryview(buffer)[:size].cast("Q")
+
+        self.__age: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__stores: int = 0
+        self.__overwrites: int = 0
+
+    @staticmethod
+    def size_for(megabytes: float) -> int:
+        """
+        Return the number of bytes a table with a given budget uses.
+
+        :param megabytes: Memory budget in megabytes.
+        :return: Size in bytes: the largest power-of-two number of buckets that fits in the budget.
+        :raises ValueError: If the budget is too small for a single bucket.
+        """
+
+        buckets = int(megabytes * (1 << 20)) // BUCKET_BYTES
+
+        if buckets < 1:
+            raise ValueError(f"Transposition table budget too small: {megabytes} MB")
+
+        return (1 << buckets.bit_length() - 1) * BUCKET_BYTES
+
+    @property
+    def capacity(self) -> int:
+        """Number of entries the table can hold."""
+
+        return (self.__mask + 1) * 2
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self.__words) * self.__words.itemsize
+
+    @property
+    def age(self) -> int:
+        """Age of the current search, stored with every entry; processes sharing a table must agree on it."""
+
+        return self.__age
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self.__age = value & AGE_MASK
+
+    @property
+    def hits(self) -> int:
+        """Number of probes that found the position."""
+
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of probes that did not find the position."""
+
+        return self.__misses
+
+    @property
+    def stores(self) -> int:
+        return self.__stores
+
+    @property
+    def overwrites(self) -> int:
+        """Number of stores that replaced the entry of a different position."""
+
+        return self.__overwrites
+
+    @property
+    def hit_rate(self) -> float:
+        probes = self.__hits + self.__misses
+
+        return self.__hits / probes if probes else 0.0
+
+    def new_search(self) -> None:
+        """Start a new search: entries stored by earlier searches become the first to be replaced."""
+
+        self.__age = (self.__age + 1) & AGE_MASK
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+
+        self.__words[:] = array("Q", [0]) * len(self.__words)
+        self.__age = 0
+        self.reset_counters()
+
+    def close(self) -> None:
+        """Release a buffer supplied to the constructor, so that its owner can close it. The table is unusable after."""
+
+        if isinstance(self.__words, memoryview):
+            self.__words.release()
+
+    def reset_counters(self) -> None:
+        self.__hits = 0
+        self.__misses = 0
+        self.__stores = 0
+        self.__overwrites = 0
+
+    def fill_rate(self, sample: int = 1000) -> float:
+        """
+        Estimate the fraction of entries in use from the first entries of the table.
+
+        :param sample: Number of entries to inspect.
+        :return: Fraction of the sampled entries holding a result from the current search.
+        """
+
+        words = self.__words
+        sample = min(sample, self.capacity)
+        used = 0
+
+        for index in range(0, sample * 2, 2):
+            data = words[index + 1]
+
+            if data and data >> AGE_SHIFT & AGE_MASK == self.__age:
+                used += 1
+
+        return used / sample
+
+    def probe(self, key: int) -> Optional[TableEntry]:
+        """
+        Look up a position.
+
+        :param key: 64-bit Zobrist hash of the position.
+        :return: Tuple of (best move, depth, bound, score), or None if the position is not in the table.
+        """
+
+        words = self.__words
+        base = (key & self.__mask) * BUCKET_WORDS
+
+        for index in (base, base + 2):
+            data = words[index + 1]
+
+            if data and words[index] ^ data == key:
+                self.__hits += 1
+
+                return (data & MOVE_MASK, data >> DEPTH_SHIFT & DEPTH_MASK, data >> BOUND_SHIFT & 3,
+                        (data >> SCORE_SHIFT) - SCORE_OFFSET)
+
+        self.__misses += 1
+
+        return None
+
+    def store(self, key: int, move: int, depth: int, bound: int, score: int) -> None:
+        """
+        Record the result of searching a position.
+
+        :param key: 64-bit Zobrist hash of the position.
+        :param move: Best packed move found, or 0 if none.
+        :param depth: Depth the position was searched to.
+        :param bound: BOUND_EXACT, BOUND_LOWER or BOUND_UPPER.
+        :param score: Score of the position, which must fit in 20 bits either side of zero.
+        """
+
+        words = self.__words
+        base = (key & self.__mask) * BUCKET_WORDS
+        depth = min(max(depth, 0), DEPTH_MASK)
+        data = (move & MOVE_MASK | depth << DEPTH_SHIFT | bound << BOUND_SHIFT | self.__age << AGE_SHIFT |
+                score + SCORE_OFFSET << SCORE_SHIFT)
+
+        first = words[base + 1]
+        first_key = words[base] ^ first
+        second = words[base + 3]
+        second_lost = bool(second) and words[base + 2] ^ second != key
+
+        if not first or first_key == key:
+            index = base
+        elif depth >= first >> DEPTH_SHIFT & DEPTH_MASK or first >> AGE_SHIFT & AGE_MASK != self.__age:
+            # The depth-preferred slot is taken over; its previous result moves to the always-replace slot.
+            index = base
+            self.__overwrites += second_lost
+            words[base + 2] = words[base]
+            words[base + 3] = first
+        else:
+            index = base + 2
+            self.__overwrites += second_lost
+
+        self.__stores += 1
+        words[index] = key ^ data
+        words[index + 1] = data
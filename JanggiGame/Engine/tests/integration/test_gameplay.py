@@ -1,6 +1,8 @@
 import unittest
 
 from game import GameState, JanggiGame
+from helpers.notation import move_to_algebraic
+from piece import PieceColor
 
 
 class TestGamePlay(unittest.TestCase):
@@ -441,7 +443,8 @@ class TestGamePlay(unittest.TestCase):
         """
         SCENARIO 3:
 
-        Sequence of moves that leads to BLUE cannon performing a checkmate on RED General.
+        Sequence of moves that leads to BLUE cannon checking the RED General, using a RED soldier as its screen. It is
+        not a checkmate: the soldier can step off the file, which removes the screen.
         """
 
         # -------------------- Act ------------------------ #
@@ -482,9 +485,11 @@ class TestGamePlay(unittest.TestCase):
         self.game.make_move('b8', 'e8')
 
         # -------------------- Assert --------------------- #
-        state = self.game.game_state
-        expected_state = GameState.BLUE_WON
-        self.assertEqual(expected_state, state)
+        self.assertEqual(GameState.UNFINISHED, self.game.game_state)
+        self.assertTrue(self.game.is_in_check(PieceColor.RED))
+        self.assertEqual(["e4d4", "e4f4"], sorted(move_to_algebraic(move) for move in self.game.legal_moves()))
+        self.assertTrue(self.game.make_move('e4', 'd4'))
+        self.assertFalse(self.game.is_in_check(PieceColor.RED))
 
     def test_gameplay_sequence_scenario_four(self) -> None:
         """
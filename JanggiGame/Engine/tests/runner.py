@@ -2,9 +2,31 @@ import unittest
 from unittest import TestResult
 
 from integration import test_gameplay
+from unit import test_bitboard
+from unit import test_board
 from unit import test_janggi_game
 from unit import test_obstacle_detection_strategy
 from unit import test_path_generation_strategy
+from unit import test_path_table
+from unit import test_point
+from unit import test_zobrist
+from unit import test_attack_map
+from unit import test_piece_index
+from unit import test_move_generator
+from unit import test_notation
+from unit import test_perft
+from unit import test_searcher
+from unit import test_transposition
+from unit import test_ordering
+from unit import test_see
+from unit import test_parallel
+from unit import test_anytime
+from unit import test_book
+from unit import test_tablebase
+from unit import test_evaluation
+from unit import test_batch
+from unit import test_tournament
+from unit import test_ponder
 
 
 def run_tests(*args, **kwargs) -> TestResult:
@@ -30,9 +52,31 @@ def run_tests(*args, **kwargs) -> TestResult:
 
 if __name__ == "__main__":
     modules = [
+        test_bitboard,
+        test_board,
         test_janggi_game,
         test_obstacle_detection_strategy,
         test_path_generation_strategy,
+        test_path_table,
+        test_point,
+        test_zobrist,
+        test_attack_map,
+        test_piece_index,
+        test_move_generator,
+        test_notation,
+        test_perft,
+        test_searcher,
+        test_transposition,
+        test_ordering,
+        test_see,
+        test_parallel,
+        test_anytime,
+        test_book,
+        test_tablebase,
+        test_evaluation,
+        test_batch,
+        test_tournament,
+        test_ponder,
         test_gameplay
     ]
 
@@ -1,5 +1,27 @@
+from .test_bitboard import TestBitboard
+from .test_board import TestJanggiBoard, TestMailbox
 from .test_janggi_game import TestJanggiGame
 from .test_obstacle_detection_strategy import TestIObstacleDetectionStrategy, TestIllegalDestinationStrategy, \
     TestIllegalPathStrategy, TestInsidePalaceStrategy
 from .test_path_generation_strategy import TestIPathGenerationStrategy, TestBranchPathStrategy, \
     TestLinearPathStrategy, TestLinearDiagonalPathStrategy
+from .test_path_table import TestPathTable
+from .test_point import TestPoint2D
+from .test_zobrist import TestZobristHash
+from .test_attack_map import TestAttackMap
+from .test_piece_index import TestPieceIndex
+from .test_move_generator import TestMoveGenerator
+from .test_notation import TestNotation
+from .test_perft import TestPerft
+from .test_searcher import TestSearcher
+from .test_transposition import TestTranspositionTable
+from .test_ordering import TestMoveOrderer
+from .test_see import TestStaticExchange
+from .test_parallel import TestParallelSearcher
+from .test_anytime import TestAnytimeSearch
+from .test_book import TestOpeningBook
+from .test_tablebase import TestTablebase
+from .test_evaluation import TestPieceSquareEvaluator
+from .test_batch import TestBatchEvaluator, TestBatchEvaluatorWithoutNumpy
+from .test_tournament import TestTournament
+from .test_ponder import TestPonderer
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from game import JanggiGame
+from search import SearchResult, Searcher, search_async
+from tools.bench import BENCH_POSITIONS
+
+
+class TestAnytimeSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame(BENCH_POSITIONS[1])
+
+    def test_deadline_returns_completed_iteration(self) -> None:
+        # -------------------- Arrange -------------------- #
+        searcher = Searcher(self.game)
+        depths = list()
+        start = time.monotonic()
+
+        # -------------------- Act ------------------------ #
+        result = searcher.search(deadline=start + 0.3, on_iteration=lambda info: depths.append(info.depth))
+
+        # -------------------- Assert --------------------- #
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertIn(result.move, self.game.legal_moves())
+        self.assertEqual(depths[-1], result.depth)
+        self.assertEqual(BENCH_POSITIONS[1], self.game.to_notation())
+
+    def test_stop_from_another_thread(self) -> None:
+        # -------------------- Arrange -------------------- #
+        searcher = Searcher(self.game)
+        timer = threading.Timer(0.2, searcher.stop)
+        start = time.monotonic()
+
+        # -------------------- Act ------------------------ #
+        timer.start()
+        result = searcher.search(max_depth=20)
+
+        # -------------------- Assert --------------------- #
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertIn(result.move, self.game.legal_moves())
+
+        # The request is consumed: the next search runs to its limit.
+        self.assertEqual(2, searcher.search(max_depth=2).depth)
+
+    def test_search_async_does_not_block_event_loop(self) -> None:
+        # -------------------- Arrange -------------------- #
+        ticks = list()
+
+        async def tick() -> None:
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def search() -> SearchResult:
+            ticker = asyncio.ensure_future(tick())
+            result = await search_async(self.game, 0.3)
+            ticker.cancel()
+            return result
+
+        # -------------------- Act ------------------------ #
+        result = asyncio.run(search())
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(result.move, self.game.legal_moves())
+        self.assertGreater(len(ticks), 5)
+        self.assertEqual(BENCH_POSITIONS[1], self.game.to_notation())
+
+    def test_search_async_cancellation(self) -> None:
+        # -------------------- Arrange -------------------- #
+        async def cancel() -> float:
+            task = asyncio.ensure_future(search_async(self.game, 60))
+            await asyncio.sleep(0.2)
+            start = time.monotonic()
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            return time.monotonic() - start
+
+        # -------------------- Act ------------------------ #
+        latency = asyncio.run(cancel())
+
+        # -------------------- Assert --------------------- #
+        self.assertLess(latency, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
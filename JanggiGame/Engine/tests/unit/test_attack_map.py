@@ -0,0 +1,100 @@
+import random
+import unittest
+
+from game import JanggiGame
+from piece import PieceCategory, PieceColor
+from utils import Point2D, SQUARE_COUNT, to_square
+
+
+class TestAttackMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+        self.attack_map = self.board.attack_map
+
+    def assert_matches_bitboard(self, squares=range(SQUARE_COUNT)) -> None:
+        for square in squares:
+            for color in PieceColor:
+                expected = self.board.bitboard.attackers_of(square, color)
+                self.assertEqual(expected, self.attack_map.attackers_of(square, color))
+                self.assertEqual(bin(expected).count("1"), self.attack_map.attack_count(square, color))
+
+    def test_counts_attackers_in_starting_position(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        # The blue general is defended by both guards.
+        self.assertEqual(2, self.attack_map.attack_count(to_square(4, 1), PieceColor.BLUE))
+        self.assertFalse(self.attack_map.is_attacked(to_square(4, 1), PieceColor.RED))
+        self.assert_matches_bitboard()
+
+    def test_discovered_attack_updates_entry(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Put a red chariot on the e-file behind the blue soldier on (4, 3).
+        self.board.move(Point2D(0, 9), Point2D(4, 5))
+        self.assertFalse(self.attack_map.is_attacked(to_square(4, 2), PieceColor.RED))
+        self.assertFalse(self.game.is_in_check(PieceColor.BLUE))
+
+        # -------------------- Act ------------------------ #
+        self.board.move(Point2D(4, 3), Point2D(3, 3))
+
+        # -------------------- Assert --------------------- #
+        self.assertTrue(self.attack_map.is_attacked(to_square(4, 2), PieceColor.RED))
+        self.assertTrue(self.game.is_in_check(PieceColor.BLUE))
+        self.assert_matches_bitboard()
+
+    def test_region_stops_at_second_piece_on_each_ray(self) -> None:
+        # -------------------- Act ------------------------ #
+        region = self.attack_map.region_of(to_square(4, 1), PieceColor.RED)
+
+        # -------------------- Assert --------------------- #
+        # Up the e-file the first piece is the soldier on (4, 3) and the second the soldier on (4, 6).
+        self.assertTrue(region >> to_square(4, 6) & 1)
+        self.assertFalse(region >> to_square(4, 7) & 1)
+
+        # Horse sources and their legs around the general are part of the region, far squares are not.
+        self.assertTrue(region >> to_square(2, 2) & 1)
+        self.assertFalse(region >> to_square(8, 9) & 1)
+
+    def test_change_outside_region_keeps_entry(self) -> None:
+        # -------------------- Arrange -------------------- #
+        square = to_square(4, 1)
+        region = self.attack_map.region_of(square, PieceColor.RED)
+
+        # -------------------- Act ------------------------ #
+        self.board.move(Point2D(8, 6), Point2D(8, 5))
+
+        # -------------------- Assert --------------------- #
+        self.assertFalse(region >> to_square(8, 6) & 1)
+        self.assertEqual(region, self.attack_map.region_of(square, PieceColor.RED))
+        self.assert_matches_bitboard([square])
+
+    def test_attackers_match_bitboard_through_random_moves_and_undos(self) -> None:
+        # -------------------- Arrange -------------------- #
+        rng = random.Random(11)
+        watched = [to_square(4, 1), to_square(4, 8), to_square(4, 4), to_square(1, 2)]
+        played = 0
+
+        # -------------------- Act/Assert -------------------- #
+        for _ in range(60):
+            moves = [(piece.position, path[-1])
+                     for piece in self.board.search(self.game.player_turn)
+                     for path in self.board.generate_paths(piece)
+                     if self.board.coord_map.get(path[-1].to_tuple()) is None or
+                     self.board.coord_map.get(path[-1].to_tuple()).category is not PieceCategory.GENERAL]
+            if not moves:
+                break
+
+            self.game.move(*rng.choice(moves))
+            played += 1
+
+            with self.subTest(ply=played):
+                self.assert_matches_bitboard(watched if played % 10 else range(SQUARE_COUNT))
+
+        for _ in range(played):
+            self.game.undo_move()
+            self.assert_matches_bitboard(watched)
+
+        self.assert_matches_bitboard()
+
+
+if __name__ == "__main__":
+    unittest.main()
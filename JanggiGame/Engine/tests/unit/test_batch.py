@@ -0,0 +1,75 @@
+import unittest
+
+from game import JanggiGame
+from piece import PieceColor
+from search import MaterialEvaluator, PieceSquareEvaluator
+from search.batch import MOBILITY_WEIGHT, BatchEvaluator, encode
+from tools.bench import BENCH_POSITIONS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestBatchEvaluator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.boards = [JanggiGame(position).board for position in BENCH_POSITIONS]
+        self.squares = encode(self.boards)
+        self.evaluator = BatchEvaluator()
+
+    def test_encode(self) -> None:
+        # -------------------- Assert --------------------- #
+        self.assertEqual((len(BENCH_POSITIONS), 90), self.squares.shape)
+        self.assertEqual(np.int8, self.squares.dtype)
+
+        # Starting position: BLUE Chariot on square 0, BLUE General on square 13, RED Chariot on square 81.
+        self.assertEqual(5, self.squares[0, 0])
+        self.assertEqual(1, self.squares[0, 13])
+        self.assertEqual(-5, self.squares[0, 81])
+        self.assertEqual(0, self.squares[0, 40])
+
+    def test_matches_per_position_evaluators(self) -> None:
+        # -------------------- Act ------------------------ #
+        material = self.evaluator.material(self.squares)
+        piece_square = self.evaluator.piece_square(self.squares)
+        points = self.evaluator.points(self.squares)
+
+        # -------------------- Assert --------------------- #
+        for index, board in enumerate(self.boards):
+            evaluator = PieceSquareEvaluator(board)
+            self.assertEqual(MaterialEvaluator(board).evaluate(PieceColor.BLUE), material[index])
+            self.assertEqual(evaluator.evaluate(PieceColor.BLUE), piece_square[index])
+            self.assertEqual([evaluator.points(color) for color in PieceColor], list(points[index]))
+
+    def test_mobility(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # The Chariot slides 9 squares up its file and 3 along its rank before reaching its own General.
+        squares = encode([JanggiGame("4g4/9/9/9/9/9/9/9/9/R3G4 b").board])
+
+        # -------------------- Act ------------------------ #
+        mobility = self.evaluator.mobility(squares)
+        scores = self.evaluator.evaluate(squares)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual([12], list(mobility))
+        self.assertEqual(list(self.evaluator.piece_square(squares) + 12 * MOBILITY_WEIGHT), list(scores))
+
+        # The starting position is symmetrical.
+        self.assertEqual(0, self.evaluator.mobility(self.squares[:1])[0])
+
+
+@unittest.skipIf(np is not None, "numpy is installed")
+class TestBatchEvaluatorWithoutNumpy(unittest.TestCase):
+    def test_requires_numpy(self) -> None:
+        # -------------------- Assert --------------------- #
+        with self.assertRaises(ImportError):
+            BatchEvaluator()
+
+        with self.assertRaises(ImportError):
+            encode([JanggiGame().board])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import random
+import unittest
+
+from game import JanggiGame
+from helpers.bitboard import iterate_bits
+from piece import PieceCategory, PieceColor
+from utils import Point2D, to_square
+
+
+class TestBitboard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+        self.bitboard = self.board.bitboard
+
+    def attacked_squares(self, x: int, y: int) -> set:
+        return set(iterate_bits(self.bitboard.attacks_from(to_square(x, y))))
+
+    def test_masks_reflect_starting_position(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(32, bin(self.bitboard.occupancy).count("1"))
+        self.assertEqual(16, bin(self.bitboard.color_mask(PieceColor.BLUE)).count("1"))
+        self.assertEqual(1 << to_square(4, 1), self.bitboard.piece_mask(PieceColor.BLUE, PieceCategory.GENERAL))
+        self.assertEqual(4, bin(self.bitboard.category_mask(PieceCategory.CANNON)).count("1"))
+
+    def test_masks_follow_moves_and_direct_map_writes(self) -> None:
+        # -------------------- Arrange -------------------- #
+        chariot = self.board.coord_map[(0, 0)]
+
+        # -------------------- Act ------------------------ #
+        self.board.move(Point2D(0, 0), Point2D(0, 2))
+        del self.board.coord_map[(8, 0)]
+
+        # -------------------- Assert --------------------- #
+        chariots = self.bitboard.piece_mask(PieceColor.BLUE, PieceCategory.CHARIOT)
+        self.assertEqual(1 << to_square(0, 2), chariots)
+        self.assertIs(chariot, self.board.coord_map[(0, 2)])
+
+    def test_chariot_attacks_stop_at_first_blocker(self) -> None:
+        # -------------------- Act ------------------------ #
+        attacks = self.attacked_squares(0, 0)
+
+        # -------------------- Assert --------------------- #
+        # Up the a-file to (and including) the soldier, right to (and including) the elephant.
+        self.assertEqual({to_square(0, 1), to_square(0, 2), to_square(0, 3), to_square(1, 0)}, attacks)
+
+    def test_cannon_cannot_jump_or_capture_cannon(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Line up blue cannon, a soldier screen, then the red cannon on the b-file.
+        self.board.move(Point2D(1, 7), Point2D(1, 5))
+        self.board.move(Point2D(2, 3), Point2D(1, 3))
+
+        # -------------------- Act ------------------------ #
+        attacks = self.attacked_squares(1, 2)
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(to_square(1, 4), attacks)
+        self.assertNotIn(to_square(1, 5), attacks)
+
+        # A cannon screen cannot be jumped: put the red cannon directly in front of the blue cannon.
+        self.board.move(Point2D(1, 3), Point2D(2, 3))
+        self.board.move(Point2D(1, 5), Point2D(1, 3))
+        self.assertNotIn(to_square(1, 4), self.attacked_squares(1, 2))
+
+    def test_horse_leg_blocks_attack(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        # Blue horse at (2, 0): the leg at (2, 1) is free, the legs at (1, 0) and (3, 0) are blocked.
+        self.assertEqual({to_square(1, 2), to_square(3, 2)}, self.attacked_squares(2, 0))
+
+        # Moving the elephant off (1, 0) frees the leg towards (0, 1).
+        self.board.move(Point2D(1, 0), Point2D(1, 1))
+        self.assertEqual({to_square(1, 2), to_square(3, 2), to_square(0, 1)}, self.attacked_squares(2, 0))
+
+    def test_palace_diagonal_attack_reaches_general(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.board.move(Point2D(0, 6), Point2D(5, 2))
+
+        # -------------------- Act/Assert -------------------- #
+        attackers = self.bitboard.attackers_of(to_square(4, 1), PieceColor.RED)
+        self.assertEqual(1 << to_square(5, 2), attackers)
+
+    def test_attacks_match_path_generation_in_random_positions(self) -> None:
+        """Attack masks must agree with the path generation and obstacle detection strategies."""
+
+        rng = random.Random(2021)
+
+        for game_number in range(10):
+            game = JanggiGame()
+            board = game.board
+
+            for _ in range(rng.randint(10, 60)):
+                moves = [(piece.position, path[-1])
+                         for piece in board.search(game.player_turn)
+                         for path in board.generate_paths(piece)
+                         if board.coord_map.get(path[-1].to_tuple()) is None or
+                         board.coord_map.get(path[-1].to_tuple()).category is not PieceCategory.GENERAL]
+                if not moves:
+                    break
+                game.move(*rng.choice(moves))
+
+            for piece in board.coord_map.occupants():
+                with self.subTest(game=game_number, piece=(piece.color, piece.category, piece.position.to_tuple())):
+                    # -------------------- Arrange -------------------- #
+                    expected = {to_square(path[-1].x, path[-1].y) for path in board.generate_paths(piece)}
+                    attacks = board.bitboard.attacks_from(to_square(piece.position.x, piece.position.y))
+                    attacks &= ~board.bitboard.color_mask(piece.color)
+
+                    if piece.category is PieceCategory.CANNON:
+                        attacks &= ~board.bitboard.category_mask(PieceCategory.CANNON)
+
+                    # -------------------- Act/Assert -------------------- #
+                    self.assertEqual(expected, set(iterate_bits(attacks)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+import unittest
+
+from game import JanggiGame
+from helpers import Mailbox
+from piece import PieceCategory, PieceColor
+from utils import Point2D, encode_move, to_square
+
+
+class TestMailbox(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.piece = self.game.board.coord_map[(0, 0)]
+
+    def test_mailbox_supports_mapping_protocol_over_tuple_coordinates(self) -> None:
+        # -------------------- Arrange -------------------- #
+        mailbox = Mailbox({(4, 1): self.piece})
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertIs(self.piece, mailbox[(4, 1)])
+        self.assertIs(self.piece, mailbox.get((4, 1)))
+        self.assertIsNone(mailbox.get((4, 2)))
+        self.assertIsNone(mailbox.get((9, 0)))
+        self.assertIn((4, 1), mailbox)
+        self.assertNotIn((4, 2), mailbox)
+        self.assertEqual([(4, 1)], list(mailbox))
+        self.assertEqual(1, len(mailbox))
+
+        with self.assertRaises(KeyError):
+            _ = mailbox[(4, 2)]
+
+    def test_mailbox_indexes_squares_row_by_row(self) -> None:
+        # -------------------- Arrange -------------------- #
+        mailbox = Mailbox()
+
+        # -------------------- Act ------------------------ #
+        mailbox[(2, 3)] = self.piece
+
+        # -------------------- Assert --------------------- #
+        self.assertIs(self.piece, mailbox.get_square(3 * 9 + 2))
+
+    def test_mailbox_pop_and_delete_empty_square(self) -> None:
+        # -------------------- Arrange -------------------- #
+        mailbox = Mailbox({(0, 0): self.piece})
+
+        # -------------------- Act ------------------------ #
+        popped = mailbox.pop((0, 0))
+
+        # -------------------- Assert --------------------- #
+        self.assertIs(self.piece, popped)
+        self.assertEqual(0, len(mailbox))
+        self.assertIsNone(mailbox.get_square(0))
+
+
+class TestJanggiBoard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+
+    def test_new_board_holds_thirty_two_pieces(self) -> None:
+        self.assertEqual(32, len(self.board.coord_map))
+
+    def test_move_updates_map_and_piece_position(self) -> None:
+        # -------------------- Arrange -------------------- #
+        piece = self.board.coord_map[(0, 0)]
+
+        # -------------------- Act ------------------------ #
+        self.board.move(Point2D(0, 0), Point2D(0, 2))
+
+        # -------------------- Assert --------------------- #
+        self.assertIsNone(self.board.coord_map.get((0, 0)))
+        self.assertIs(piece, self.board.coord_map[(0, 2)])
+        self.assertEqual(Point2D(0, 2), piece.position)
+
+    def test_swap_exchanges_pieces_and_positions(self) -> None:
+        # -------------------- Arrange -------------------- #
+        elephant = self.board.coord_map[(1, 0)]
+        horse = self.board.coord_map[(2, 0)]
+
+        # -------------------- Act ------------------------ #
+        self.board.swap(Point2D(1, 0), Point2D(2, 0))
+
+        # -------------------- Assert --------------------- #
+        self.assertIs(horse, self.board.coord_map[(1, 0)])
+        self.assertIs(elephant, self.board.coord_map[(2, 0)])
+        self.assertEqual(Point2D(1, 0), horse.position)
+        self.assertEqual(Point2D(2, 0), elephant.position)
+
+    def test_search_filters_by_color_and_category(self) -> None:
+        # -------------------- Act ------------------------ #
+        blue_pieces = self.board.search(PieceColor.BLUE)
+        red_soldiers = self.board.search(PieceColor.RED, PieceCategory.SOLDIER)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(16, len(blue_pieces))
+        self.assertEqual(5, len(red_soldiers))
+        self.assertTrue(all(piece.category is PieceCategory.SOLDIER for piece in red_soldiers))
+
+    def test_make_and_unmake_capture(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.board.move(Point2D(0, 3), Point2D(1, 3))
+        chariot = self.board.coord_map[(0, 0)]
+        soldier = self.board.coord_map[(0, 6)]
+        position_hash = self.board.position_hash
+
+        # -------------------- Act ------------------------ #
+        self.board.make(encode_move(to_square(0, 0), to_square(0, 6)))
+
+        # -------------------- Assert --------------------- #
+        self.assertIs(chariot, self.board.coord_map[(0, 6)])
+        self.assertEqual(Point2D(0, 6), chariot.position)
+        self.assertIs(PieceColor.RED, self.board.turn)
+        self.assertEqual(1, self.board.ply)
+        self.assertEqual(position_hash, self.board.hash_before(0))
+        self.assertEqual(4, len(self.board.search(PieceColor.RED, PieceCategory.SOLDIER)))
+
+        self.board.unmake()
+        self.assertIs(chariot, self.board.coord_map[(0, 0)])
+        self.assertIs(soldier, self.board.coord_map[(0, 6)])
+        self.assertEqual(Point2D(0, 0), chariot.position)
+        self.assertIs(PieceColor.BLUE, self.board.turn)
+        self.assertEqual(0, self.board.ply)
+        self.assertEqual(position_hash, self.board.position_hash)
+
+    def test_make_pass_only_changes_turn(self) -> None:
+        # -------------------- Arrange -------------------- #
+        square = to_square(4, 1)
+        position_hash = self.board.position_hash
+
+        # -------------------- Act ------------------------ #
+        self.board.make(encode_move(square, square))
+
+        # -------------------- Assert --------------------- #
+        self.assertIsNotNone(self.board.coord_map.get((4, 1)))
+        self.assertIs(PieceColor.RED, self.board.turn)
+
+        self.board.unmake()
+        self.assertEqual(position_hash, self.board.position_hash)
+
+    def test_unmake_restores_lines_deeper_than_initial_capacity(self) -> None:
+        # -------------------- Arrange -------------------- #
+        a, b = to_square(0, 0), to_square(0, 1)
+        position_hash = self.board.position_hash
+
+        # -------------------- Act ------------------------ #
+        for ply in range(1000):
+            self.board.make(encode_move(a, b) if ply % 2 == 0 else encode_move(b, a))
+
+        for _ in range(1000):
+            self.board.unmake()
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(0, self.board.ply)
+        self.assertEqual(position_hash, self.board.position_hash)
+        self.assertEqual(Point2D(0, 0), self.board.coord_map[(0, 0)].position)
+
+        with self.assertRaises(IndexError):
+            self.board.unmake()
+
+    def test_legality_probes_leave_command_stacks_untouched(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.game.make_move("a7", "a6")
+        self.game.undo_move()
+
+        # -------------------- Act ------------------------ #
+        self.game.return_piece_destinations((0, 0))
+
+        # -------------------- Assert --------------------- #
+        self.game.redo_move()
+        self.assertIsNotNone(self.board.coord_map.get((0, 4)))
+        self.assertIs(PieceColor.RED, self.game.player_turn)
+
+
+if __name__ == "__main__":
+    unittest.main()
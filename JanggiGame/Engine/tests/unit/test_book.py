@@ -0,0 +1,131 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from game import JanggiGame
+from helpers.notation import algebraic_to_move
+from piece import PieceColor
+from search.book import BOOK_HEADER, BOOK_RECORD, DRAW_POINTS, WIN_POINTS, BookBuilder, OpeningBook
+
+
+class TestOpeningBook(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "book.bin")
+
+        builder = BookBuilder(max_ply=3)
+        builder.add_game(["c7c6", "c4c5", "a7a6", "a4a5"], PieceColor.BLUE)
+        builder.add_game(["c7c6", "g4g5"], PieceColor.RED)
+        builder.add_game(["g7g6", "c4c5"], None)
+        builder.add_game(["g7g6"], PieceColor.BLUE, dict(blue_left_transposed=True))
+        self.records = builder.write(self.path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_write(self) -> None:
+        # -------------------- Assert --------------------- #
+        # Two moves from the start, one from the transposed start, two after c7c6, one after c7c6 c4c5, one after g7g6.
+        self.assertEqual(7, self.records)
+        self.assertEqual(BOOK_HEADER.size + 7 * BOOK_RECORD.size, os.path.getsize(self.path))
+
+    def test_probe(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+
+        # -------------------- Act ------------------------ #
+        with OpeningBook(self.path) as book:
+            start = book.probe(game.board.position_hash)
+            game.make_move("c7", "c6")
+            after = book.probe(game.board.position_hash)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(sorted([(algebraic_to_move("c7c6"), WIN_POINTS, 2),
+                                 (algebraic_to_move("g7g6"), DRAW_POINTS, 1)]), start)
+        self.assertEqual(sorted([(algebraic_to_move("c4c5"), 0, 1),
+                                 (algebraic_to_move("g4g5"), WIN_POINTS, 1)]), after)
+
+    def test_setups_are_separate_positions(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+        game.transpose_pieces(dict(blue_left_transposed=True))
+
+        # -------------------- Act ------------------------ #
+        with OpeningBook(self.path) as book:
+            entries = book.probe(game.board.position_hash)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual([(algebraic_to_move("g7g6"), WIN_POINTS, 1)], entries)
+
+    def test_choose(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+        rng = random.Random(1)
+
+        # -------------------- Act ------------------------ #
+        with OpeningBook(self.path) as book:
+            choices = {book.choose(game, rng) for _ in range(50)}
+            game.make_move("a7", "a6")
+            out_of_book = book.choose(game, rng)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual({algebraic_to_move("c7c6"), algebraic_to_move("g7g6")}, choices)
+        self.assertIsNone(out_of_book)
+
+    def test_ply_limit_and_min_games(self) -> None:
+        # -------------------- Arrange -------------------- #
+        builder = BookBuilder(max_ply=1)
+        builder.add_game(["c7c6", "c4c5"], PieceColor.BLUE)
+        builder.add_game(["c7c6", "g4g5"], PieceColor.BLUE)
+        builder.add_game(["g7g6"], PieceColor.BLUE)
+
+        # -------------------- Act ------------------------ #
+        records = builder.write(self.path, min_games=2)
+
+        # -------------------- Assert --------------------- #
+        with OpeningBook(self.path) as book:
+            self.assertEqual(1, records)
+            self.assertEqual([(algebraic_to_move("c7c6"), 2 * WIN_POINTS, 2)],
+                             book.probe(JanggiGame().board.position_hash))
+
+    def test_illegal_move(self) -> None:
+        # -------------------- Assert --------------------- #
+        with self.assertRaises(ValueError):
+            BookBuilder().add_game(["c7c6", "c7c5"], None)
+
+    def test_forced_pass(self) -> None:
+        # -------------------- Arrange -------------------- #
+        builder = BookBuilder()
+        legal_moves = JanggiGame.legal_moves
+
+        # RED has no move but to pass at the second ply.
+        def without_moves_at_second_ply(game: JanggiGame) -> list:
+            return list() if game.board.ply == 1 else legal_moves(game)
+
+        # -------------------- Act ------------------------ #
+        with patch.object(JanggiGame, "legal_moves", without_moves_at_second_ply):
+            builder.add_game(["c7c6", "e2e2", "c6c5"], PieceColor.BLUE)
+
+        records = builder.write(self.path)
+
+        # -------------------- Assert --------------------- #
+        # The pass is replayed but not recorded.
+        self.assertEqual(2, records)
+
+        with self.assertRaises(ValueError):
+            BookBuilder().add_game(["c7c6", "e2e2"], None)
+
+    def test_not_a_book(self) -> None:
+        # -------------------- Arrange -------------------- #
+        with open(self.path, "wb") as file:
+            file.write(b"not a book at all")
+
+        # -------------------- Assert --------------------- #
+        with self.assertRaises(ValueError):
+            OpeningBook(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from game import JanggiGame
+from piece import PieceColor
+from search import MaterialEvaluator, PieceSquareEvaluator, Searcher
+from tools.bench import BENCH_POSITIONS
+
+
+class TestPieceSquareEvaluator(unittest.TestCase):
+    def test_starting_position_is_even(self) -> None:
+        # -------------------- Arrange -------------------- #
+        evaluator = PieceSquareEvaluator(JanggiGame().board)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(0, evaluator.evaluate(PieceColor.BLUE))
+        self.assertEqual(72, evaluator.points(PieceColor.BLUE))
+        self.assertEqual(73.5, evaluator.points(PieceColor.RED))
+
+    def test_follows_moves(self) -> None:
+        for position in BENCH_POSITIONS:
+            with self.subTest(position=position):
+                # -------------------- Arrange -------------------- #
+                game = JanggiGame(position)
+                board = game.board
+                evaluator = PieceSquareEvaluator(board)
+                initial = evaluator.evaluate(PieceColor.BLUE)
+                rng = random.Random(position)
+
+                # -------------------- Act ------------------------ #
+                for _ in range(12):
+                    moves = game.legal_moves()
+                    if not moves:
+                        break
+                    board.make(rng.choice(moves))
+
+                    # -------------------- Assert --------------------- #
+                    fresh = PieceSquareEvaluator(board)
+                    fresh.detach()
+
+                    for color in PieceColor:
+                        self.assertEqual(fresh.evaluate(color), evaluator.evaluate(color))
+                        self.assertEqual(fresh.points(color), evaluator.points(color))
+
+                while board.ply:
+                    board.unmake()
+
+                self.assertEqual(initial, evaluator.evaluate(PieceColor.BLUE))
+
+    def test_material_matches_material_evaluator(self) -> None:
+        for position in BENCH_POSITIONS:
+            with self.subTest(position=position):
+                # -------------------- Arrange -------------------- #
+                board = JanggiGame(position).board
+
+                # -------------------- Act ------------------------ #
+                evaluator = PieceSquareEvaluator(board)
+
+                # -------------------- Assert --------------------- #
+                self.assertEqual(MaterialEvaluator(board).evaluate(PieceColor.BLUE),
+                                 evaluator.material(PieceColor.BLUE) - evaluator.material(PieceColor.RED))
+
+    def test_detach(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+        evaluator = PieceSquareEvaluator(game.board)
+
+        # -------------------- Act ------------------------ #
+        evaluator.detach()
+        game.board.make(game.legal_moves()[0])
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(0, evaluator.evaluate(PieceColor.BLUE))
+
+    def test_searcher_with_evaluator(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame(BENCH_POSITIONS[1])
+
+        # -------------------- Act ------------------------ #
+        result = Searcher(game, evaluator=PieceSquareEvaluator(game.board)).search(max_depth=2)
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(result.move, game.legal_moves())
+        self.assertEqual(BENCH_POSITIONS[1], game.to_notation())
+
+
+if __name__ == "__main__":
+    unittest.main()
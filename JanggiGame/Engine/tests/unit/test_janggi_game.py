@@ -105,6 +105,16 @@ class TestJanggiGame(unittest.TestCase):
         result = self.game.make_move(source2, destination2)
         self.assertFalse(result)
 
+    def test_make_move_returns_false_if_square_is_not_on_board(self) -> None:
+        for source, destination in (("j5", "a1"), ("a1", "j5"), ("z0", "e9"), ("a11", "a1")):
+            with self.subTest(source=source, destination=destination):
+                # -------------------- Act -------------------- #
+                result = self.game.make_move(source, destination)
+
+                # -------------------- Assert -------------------- #
+                self.assertFalse(result)
+                self.assertEqual(PieceColor.BLUE, self.game.player_turn)
+
     def test_make_move_returns_true_if_current_players_turn(self) -> None:
         """
         Calling make_move should return true if the piece that is being moved is the same color as current player
@@ -0,0 +1,155 @@
+import random
+import unittest
+
+from game import JanggiGame
+from piece import PieceCategory, PieceColor
+from utils import Point2D, encode_move, move_destination, to_square
+
+
+class TestMoveGenerator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+        self.generator = self.game.move_generator
+
+    def trial_moves(self, color: PieceColor) -> set:
+        """Legal moves established the slow way: every path endpoint, made and unmade to test for check."""
+
+        moves = set()
+
+        for piece in self.board.search(color):
+            for path in self.board.generate_paths(piece):
+                move = encode_move(path[0].square, path[-1].square)
+
+                self.board.make(move)
+                in_check = self.game.is_in_check(color)
+                self.board.unmake()
+
+                if not in_check:
+                    moves.add(move)
+
+        return moves
+
+    def test_starting_position_moves(self) -> None:
+        # -------------------- Act ------------------------ #
+        moves = self.game.legal_moves()
+
+        # -------------------- Assert --------------------- #
+        # Passing the turn is not generated.
+        self.assertEqual(31, len(moves))
+        self.assertEqual(self.trial_moves(PieceColor.BLUE), set(moves))
+
+    def test_pinned_piece_may_only_move_along_pin(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Clear the e-file and pin the blue soldier between its General and a red chariot.
+        self.board.move(Point2D(4, 6), Point2D(3, 6))
+        self.board.move(Point2D(0, 9), Point2D(4, 6))
+        self.board.move(Point2D(4, 3), Point2D(4, 2))
+
+        # -------------------- Act ------------------------ #
+        moves = self.generator.legal_move_list(PieceColor.BLUE, to_square(4, 2))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual([encode_move(to_square(4, 2), to_square(4, 3))], moves)
+
+    def test_cannon_screens(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Red cannon on the e-file, with only the blue soldier on (4, 3) between it and the General: that is check.
+        self.board.move(Point2D(4, 6), Point2D(3, 6))
+        self.board.move(Point2D(1, 7), Point2D(4, 6))
+        self.assertTrue(self.game.is_in_check(PieceColor.BLUE))
+
+        # -------------------- Act/Assert -------------------- #
+        # The screen escapes the check by stepping off the file; stepping forward keeps it a screen.
+        screen = to_square(4, 3)
+        self.assertEqual({encode_move(screen, to_square(3, 3)), encode_move(screen, to_square(5, 3))},
+                         set(self.generator.legal_move_list(PieceColor.BLUE, screen)))
+        self.assertEqual(self.trial_moves(PieceColor.BLUE), set(self.game.legal_moves(PieceColor.BLUE)))
+
+        # With a second piece on the file the cannon no longer checks, but the inner piece is now pinned: moving it
+        # would leave the outer one as the screen.
+        self.board.move(Point2D(0, 3), Point2D(4, 4))
+        self.assertFalse(self.game.is_in_check(PieceColor.BLUE))
+        self.assertEqual([], self.generator.legal_move_list(PieceColor.BLUE, to_square(4, 3)))
+        self.assertEqual(self.trial_moves(PieceColor.BLUE), set(self.game.legal_moves(PieceColor.BLUE)))
+
+    def test_in_check_only_evasions_are_generated(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.board.move(Point2D(0, 9), Point2D(4, 5))
+        self.board.move(Point2D(4, 3), Point2D(3, 3))
+        self.assertTrue(self.game.is_in_check(PieceColor.BLUE))
+
+        # -------------------- Act ------------------------ #
+        moves = set(self.game.legal_moves(PieceColor.BLUE))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(self.trial_moves(PieceColor.BLUE), moves)
+        self.assertIn(encode_move(to_square(3, 3), to_square(4, 3)), moves)
+
+    def test_iterator_is_lazy(self) -> None:
+        # -------------------- Act ------------------------ #
+        moves = self.game.iter_legal_moves()
+        first = next(moves)
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(first, self.game.legal_moves())
+
+    def test_is_legal_rejects_illegal_moves(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertTrue(self.generator.is_legal(encode_move(to_square(0, 0), to_square(0, 2))))
+        self.assertFalse(self.generator.is_legal(encode_move(to_square(0, 0), to_square(0, 4))))
+        self.assertFalse(self.generator.is_legal(encode_move(to_square(4, 4), to_square(4, 5))))
+        self.assertFalse(self.generator.is_legal(encode_move(to_square(1, 2), to_square(1, 2))))
+
+    def test_has_legal_move_finds_only_reply(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Blue General boxed in by its own pieces on (3, 2), with the red chariot checking down the d-file.
+        self.game.move(Point2D(4, 1), Point2D(3, 2))
+        self.game.move(Point2D(2, 3), Point2D(3, 1))
+        self.game.move(Point2D(4, 3), Point2D(4, 2))
+        self.game.move(Point2D(1, 0), Point2D(4, 1))
+        self.game.move(Point2D(0, 9), Point2D(3, 6))
+        self.assertTrue(self.game.is_in_check(PieceColor.BLUE))
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertFalse(self.generator.has_legal_move(PieceColor.BLUE))
+        self.assertEqual([], self.game.legal_moves(PieceColor.BLUE))
+        self.assertTrue(self.game.is_checkmate(PieceColor.BLUE))
+
+        # A blue chariot able to interpose on the d-file is the only way out.
+        self.board.move(Point2D(8, 0), Point2D(8, 4))
+        self.assertTrue(self.generator.has_legal_move(PieceColor.BLUE))
+        self.assertEqual([encode_move(to_square(8, 4), to_square(3, 4))], self.game.legal_moves(PieceColor.BLUE))
+        self.assertFalse(self.game.is_checkmate(PieceColor.BLUE))
+
+    def test_matches_trial_execution_in_random_positions(self) -> None:
+        rng = random.Random(9)
+
+        for game_number in range(8):
+            game = JanggiGame()
+            self.game, self.board, self.generator = game, game.board, game.move_generator
+
+            for ply in range(rng.randint(10, 70)):
+                color = game.player_turn
+
+                with self.subTest(game=game_number, ply=ply):
+                    # -------------------- Arrange -------------------- #
+                    expected = self.trial_moves(color)
+
+                    # -------------------- Act/Assert -------------------- #
+                    self.assertEqual(expected, set(game.legal_moves()))
+                    self.assertEqual(bool(expected), game.has_legal_move())
+
+                # Play a random pseudo-legal move (which may leave the General in check) to reach odd positions too.
+                squares = self.board.coord_map.squares
+                moves = [move for move in self.generator.pseudo_legal_moves(color)
+                         if squares[move_destination(move)] is None or
+                         squares[move_destination(move)].category is not PieceCategory.GENERAL]
+                if not moves:
+                    break
+
+                self.board.make(rng.choice(moves))
+
+
+if __name__ == "__main__":
+    unittest.main()
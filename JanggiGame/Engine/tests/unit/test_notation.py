@@ -0,0 +1,63 @@
+import unittest
+
+from game import JanggiGame
+from helpers.notation import STARTING_POSITION, algebraic_to_move, move_to_algebraic, parse_position, \
+    square_to_algebraic
+from piece import PieceCategory, PieceColor
+from utils import Point2D, encode_move, to_square
+
+
+class TestNotation(unittest.TestCase):
+    def test_starting_position_round_trips(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(STARTING_POSITION, JanggiGame().to_notation())
+
+    def test_game_loads_position_and_side_to_move(self) -> None:
+        # -------------------- Arrange -------------------- #
+        position = "4g4/9/9/9/9/9/9/9/4A4/3G5 r"
+
+        # -------------------- Act ------------------------ #
+        game = JanggiGame(position)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(position, game.to_notation())
+        self.assertIs(PieceColor.RED, game.player_turn)
+        self.assertEqual(Point2D(3, 0), game.board.general(PieceColor.BLUE).position)
+        self.assertIs(PieceCategory.GUARD, game.board.coord_map[(4, 1)].category)
+        self.assertEqual(3, len(game.board.coord_map))
+
+    def test_parse_position_reads_ranks_top_down(self) -> None:
+        # -------------------- Act ------------------------ #
+        placements, turn = parse_position(STARTING_POSITION)
+
+        # -------------------- Assert --------------------- #
+        self.assertIs(PieceColor.BLUE, turn)
+        self.assertEqual(32, len(placements))
+        self.assertIn((PieceColor.RED, PieceCategory.CHARIOT, Point2D(0, 9)), placements)
+        self.assertIn((PieceColor.BLUE, PieceCategory.CANNON, Point2D(1, 2)), placements)
+
+    def test_invalid_positions_are_rejected(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        for position in ("", "9/9/9 b", "4g4/9/9/9/9/9/9/9/4A4/3G5 x", "4g5/9/9/9/9/9/9/9/4A4/3G5 b",
+                         "4x4/9/9/9/9/9/9/9/4A4/3G5 b"):
+            with self.subTest(position=position):
+                with self.assertRaises(ValueError):
+                    JanggiGame(position)
+
+    def test_algebraic_moves_match_make_move_notation(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+        move = algebraic_to_move("a7a6")
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(encode_move(to_square(0, 3), to_square(0, 4)), move)
+        self.assertEqual("a7a6", move_to_algebraic(move))
+        self.assertEqual("a10", square_to_algebraic(0))
+        self.assertIn(move, game.legal_moves())
+
+        with self.assertRaises(ValueError):
+            algebraic_to_move("a11a10")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+from game import JanggiGame
+from search import MAX_PLY, MoveOrderer, Searcher
+from tools.bench import BENCH_POSITIONS, bench
+from utils import encode_move, to_square
+
+
+class TestMoveOrderer(unittest.TestCase):
+    def setUp(self) -> None:
+        # Blue chariot on (4, 6) can capture a red cannon or soldier; the blue soldier on (8, 5) can take a soldier.
+        self.game = JanggiGame("3ag4/4a4/2c1c4/s3R3s/8S/9/S5h1S/1C3H3/3GA4/3A5 b")
+        self.orderer = MoveOrderer(self.game.board, MAX_PLY)
+        self.moves = self.game.legal_moves()
+
+    def test_captures_ordered_by_victim_then_attacker(self) -> None:
+        # -------------------- Arrange -------------------- #
+        chariot_takes_cannon = encode_move(to_square(4, 6), to_square(4, 7))
+        soldier_takes_soldier = encode_move(to_square(8, 5), to_square(8, 6))
+        chariot_takes_soldier = encode_move(to_square(4, 6), to_square(0, 6))
+        self.assertTrue({chariot_takes_cannon, soldier_takes_soldier, chariot_takes_soldier} <= set(self.moves))
+
+        # -------------------- Act ------------------------ #
+        ordered = self.orderer.order(list(self.moves), 0)
+
+        # -------------------- Assert --------------------- #
+        captures = [move for move in ordered if self.orderer.is_capture(move)]
+        self.assertEqual(captures, ordered[:len(captures)])
+        self.assertEqual(chariot_takes_cannon, ordered[0])
+        self.assertLess(ordered.index(soldier_takes_soldier), ordered.index(chariot_takes_soldier))
+
+    def test_hash_move_killers_and_history(self) -> None:
+        # -------------------- Arrange -------------------- #
+        quiet = [move for move in self.moves if not self.orderer.is_capture(move)]
+        hash_move, killer, historic = quiet[-1], quiet[-2], quiet[-3]
+
+        # -------------------- Act ------------------------ #
+        self.orderer.record_cutoff(historic, 6, 3)
+        self.orderer.record_cutoff(killer, 1, 0)
+        ordered = self.orderer.order(list(self.moves), 0, hash_move)
+
+        # -------------------- Assert --------------------- #
+        captures = len(self.moves) - len(quiet)
+        self.assertEqual(hash_move, ordered[0])
+        self.assertEqual(killer, ordered[captures + 1])
+        self.assertEqual(historic, ordered[captures + 2])
+
+        # Killers are per ply, history is not.
+        ordered = self.orderer.order(list(self.moves), 1)
+        self.assertEqual(historic, ordered[captures])
+
+    def test_ordering_keeps_score_and_reduces_nodes(self) -> None:
+        for ordering in (False, True):
+            with self.subTest(ordering=ordering):
+                # -------------------- Act ------------------------ #
+                result = Searcher(JanggiGame(BENCH_POSITIONS[1]), ordering=ordering).search(max_depth=3)
+
+                # -------------------- Assert --------------------- #
+                self.assertEqual(Searcher(JanggiGame(BENCH_POSITIONS[1]), ordering=False).search(max_depth=3).score,
+                                 result.score)
+
+        self.assertLess(bench(BENCH_POSITIONS[:2], 3, True)[0], bench(BENCH_POSITIONS[:2], 3, False)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
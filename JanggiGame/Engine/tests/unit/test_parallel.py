@@ -0,0 +1,67 @@
+import unittest
+
+from game import JanggiGame
+from search import Searcher
+from search.parallel import ParallelSearcher
+from tools.bench import BENCH_POSITIONS
+
+
+class TestParallelSearcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.searcher = ParallelSearcher(workers=2, megabytes=1)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.searcher.close()
+
+    def test_matches_serial_search(self) -> None:
+        for position in BENCH_POSITIONS[1:3]:
+            with self.subTest(position=position):
+                # -------------------- Arrange -------------------- #
+                game = JanggiGame(position)
+                serial = Searcher(JanggiGame(position)).search(max_depth=3)
+
+                # -------------------- Act ------------------------ #
+                result = self.searcher.search(game, 3)
+
+                # -------------------- Assert --------------------- #
+                self.assertEqual(serial.score, result.score)
+                self.assertIn(result.move, game.legal_moves())
+                self.assertEqual(3, result.depth)
+                self.assertEqual(position, game.to_notation())
+
+    def test_node_budget_compares_common_depth(self) -> None:
+        # -------------------- Arrange -------------------- #
+        position = BENCH_POSITIONS[1]
+        game = JanggiGame(position)
+
+        # -------------------- Act ------------------------ #
+        result = self.searcher.search(game, 8, max_nodes=3000)
+        serial = Searcher(JanggiGame(position)).search(max_depth=result.depth)
+
+        # -------------------- Assert --------------------- #
+        # The score is that of a full search to the reported depth, not a mix of depths.
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertLess(result.depth, 8)
+        self.assertEqual(serial.score, result.score)
+        self.assertIn(result.move, game.legal_moves())
+
+    def test_workers_share_table(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+        table = self.searcher.table
+        table.clear()
+
+        # -------------------- Act ------------------------ #
+        self.searcher.search(game, 2)
+
+        # -------------------- Assert --------------------- #
+        # Entries stored by the workers can be read from this process.
+        game.board.make(game.legal_moves()[0])
+        self.assertIsNotNone(table.probe(game.board.position_hash))
+        self.assertEqual(0, table.stores)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import unittest
+from typing import List, TYPE_CHECKING
+
+from helpers import BranchPathStrategy, LinearDiagonalPathStrategy, LinearPathStrategy, PathTable
+from utils import Point2D
+
+if TYPE_CHECKING:
+    from helpers import IPathGenerationStrategy
+
+
+class TestPathTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.strategies: List[IPathGenerationStrategy] = [
+            LinearPathStrategy(step_range=(1, 10), x_magnitudes={0, 1}, y_magnitudes={-1, 1}),
+            LinearDiagonalPathStrategy(step_range=(1, 10), x_magnitudes={-1, 0, 1}, y_magnitudes={-1, 0, 1},
+                                       diag_limit=2),
+            BranchPathStrategy(step_range=(2, 3), scalars={0, 1}, x_magnitudes={-1, 1}, y_magnitudes={-1, 1})
+        ]
+
+    def test_lookup_matches_generated_paths_that_stay_on_board(self) -> None:
+        """Every square's table entry should equal the generator's output with off-board paths removed."""
+
+        for strategy in self.strategies:
+            table = PathTable.for_strategy(strategy)
+
+            for x in range(9):
+                for y in range(10):
+                    with self.subTest(strategy=type(strategy).__name__, x=x, y=y):
+                        # -------------------- Arrange -------------------- #
+                        source = Point2D(x, y)
+                        expected = [
+                            path for path in strategy.path_generator(source)
+                            if all(0 <= p.x < 9 and 0 <= p.y < 10 for p in path)
+                        ]
+
+                        # -------------------- Act/Assert -------------------- #
+                        self.assertEqual(expected, table.lookup(source))
+
+    def test_for_strategy_shares_table_between_equal_configurations(self) -> None:
+        # -------------------- Arrange -------------------- #
+        strategy_a = LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={1})
+        strategy_b = LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={1})
+        strategy_c = LinearPathStrategy(step_range=(1, 2), x_magnitudes={-1, 0, 1}, y_magnitudes={-1})
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertIs(PathTable.for_strategy(strategy_a), PathTable.for_strategy(strategy_b))
+        self.assertIsNot(PathTable.for_strategy(strategy_a), PathTable.for_strategy(strategy_c))
+
+    def test_precomputed_paths_falls_back_to_generator_for_off_board_source(self) -> None:
+        # -------------------- Arrange -------------------- #
+        strategy = self.strategies[0]
+        source = Point2D(-1, -1)
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(list(strategy.path_generator(source)), strategy.precomputed_paths(source))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import io
+import unittest
+from contextlib import redirect_stderr
+
+from game import JanggiGame
+from tools.perft import divide, main, perft
+from utils import encode_move
+
+
+class TestPerft(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+
+    def trial_perft(self, depth: int) -> int:
+        """Reference count using path generation and trial execution instead of the move generator."""
+
+        if depth == 0:
+            return 1
+
+        board = self.game.board
+        color = self.game.player_turn
+        nodes = 0
+
+        for piece in board.search(color):
+            for path in board.generate_paths(piece):
+                board.make(encode_move(path[0].square, path[-1].square))
+
+                if not self.game.is_in_check(color):
+                    nodes += self.trial_perft(depth - 1)
+
+                board.unmake()
+
+        return nodes
+
+    def test_perft_from_starting_position(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(1, perft(self.game, 0))
+        self.assertEqual(31, perft(self.game, 1))
+        self.assertEqual(961, perft(self.game, 2))
+        self.assertEqual(self.trial_perft(2), perft(self.game, 2))
+
+    def test_perft_matches_trial_execution_in_tactical_position(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.game = JanggiGame("3ag4/4a4/2c1c4/s3R3s/9/9/S5h1S/1C3H3/3GA4/3A5 r")
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(self.trial_perft(3), perft(self.game, 3))
+
+    def test_divide_sums_to_perft_and_restores_board(self) -> None:
+        # -------------------- Arrange -------------------- #
+        position = self.game.to_notation()
+
+        # -------------------- Act ------------------------ #
+        results = divide(self.game, 2)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(31, len(results))
+        self.assertEqual(perft(self.game, 2), sum(count for _, count in results))
+        self.assertEqual(position, self.game.to_notation())
+        self.assertEqual(0, self.game.board.ply)
+
+    def test_command_line_rejects_invalid_position(self) -> None:
+        # -------------------- Arrange -------------------- #
+        stderr = io.StringIO()
+
+        # -------------------- Act/Assert -------------------- #
+        with redirect_stderr(stderr), self.assertRaises(SystemExit):
+            main(["1", "--position", "nonsense"])
+
+        self.assertIn("usage:", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
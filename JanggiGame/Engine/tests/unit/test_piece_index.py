@@ -0,0 +1,71 @@
+import unittest
+
+from game import JanggiGame
+from piece import PieceCategory, PieceColor
+from utils import Point2D, to_square
+
+
+class TestPieceIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+        self.index = self.board.piece_index
+
+    def assert_matches_board(self) -> None:
+        for color in PieceColor:
+            expected = {piece.position.square: piece for piece in self.board.coord_map.occupants()
+                        if piece.color is color}
+            self.assertEqual(expected, self.index.pieces(color))
+
+            for category in PieceCategory:
+                expected_category = {square: piece for square, piece in expected.items()
+                                     if piece.category is category}
+                self.assertEqual(expected_category, self.index.pieces(color, category))
+
+    def test_index_reflects_starting_position(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(16, len(self.index.pieces(PieceColor.RED)))
+        self.assertEqual(5, len(self.index.pieces(PieceColor.BLUE, PieceCategory.SOLDIER)))
+        self.assertEqual(Point2D(4, 1), self.board.general(PieceColor.BLUE).position)
+        self.assertEqual(Point2D(4, 8), self.board.general(PieceColor.RED).position)
+        self.assert_matches_board()
+
+    def test_index_follows_captures_and_undo(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Blue chariot captures the red soldier on (0, 6).
+        self.board.move(Point2D(0, 3), Point2D(1, 3))
+
+        # -------------------- Act ------------------------ #
+        self.game.move(Point2D(0, 0), Point2D(0, 6))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(4, len(self.index.pieces(PieceColor.RED, PieceCategory.SOLDIER)))
+        self.assertIn(to_square(0, 6), self.index.pieces(PieceColor.BLUE, PieceCategory.CHARIOT))
+        self.assert_matches_board()
+
+        self.game.undo_move()
+        self.assertEqual(5, len(self.index.pieces(PieceColor.RED, PieceCategory.SOLDIER)))
+        self.assert_matches_board()
+
+    def test_index_follows_transpositions_and_general_moves(self) -> None:
+        # -------------------- Act ------------------------ #
+        self.game.transpose_pieces(dict(blue_left_transposed=True, red_right_transposed=True))
+        self.game.move(Point2D(4, 1), Point2D(4, 2))
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(to_square(1, 0), self.index.pieces(PieceColor.BLUE, PieceCategory.HORSE))
+        self.assertIn(to_square(2, 9), self.index.pieces(PieceColor.RED, PieceCategory.ELEPHANT))
+        self.assertEqual(Point2D(4, 2), self.board.general(PieceColor.BLUE).position)
+        self.assert_matches_board()
+
+    def test_general_is_none_when_removed(self) -> None:
+        # -------------------- Act ------------------------ #
+        del self.board.coord_map[(4, 8)]
+
+        # -------------------- Assert --------------------- #
+        self.assertIsNone(self.board.general(PieceColor.RED))
+        self.assertEqual([], self.board.search(PieceColor.RED, PieceCategory.GENERAL))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import pickle
+import unittest
+
+from utils import Point2D, Rectangle
+
+
+class TestPoint2D(unittest.TestCase):
+    def test_board_points_and_vectors_are_interned(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertIs(Point2D(4, 1), Point2D(4, 1))
+        self.assertIs(Point2D(0, -1), Point2D(0, -1))
+        self.assertIs(Point2D(3, 2), Point2D(1, 1) + Point2D(2, 1))
+        self.assertIs(Point2D(-1, 1), Point2D(2, 3) - Point2D(3, 2))
+        self.assertIs(Point2D(5, 5), Point2D(4, 4).offset(1, 1))
+
+    def test_points_outside_pool_are_equal_but_distinct(self) -> None:
+        # -------------------- Arrange -------------------- #
+        point_a = Point2D(20, 20)
+        point_b = Point2D(20, 20)
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertIsNot(point_a, point_b)
+        self.assertEqual(point_a, point_b)
+        self.assertEqual(Point2D(0.5, 1), Point2D(0.5, 1))
+
+    def test_points_are_hashable(self) -> None:
+        # -------------------- Arrange -------------------- #
+        points = {Point2D(1, 2): "a", Point2D(20, 20): "b"}
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual("a", points[Point2D(1, 2)])
+        self.assertEqual("b", points[Point2D(20, 20)])
+        self.assertEqual(1, len({Point2D(1, 2), Point2D(1, 2)}))
+
+    def test_points_are_slotted(self) -> None:
+        with self.assertRaises(AttributeError):
+            Point2D(1, 1).z = 3
+
+    def test_square_number(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(0, Point2D(0, 0).square)
+        self.assertEqual(89, Point2D(8, 9).square)
+        self.assertEqual(-1, Point2D(-1, 0).square)
+
+    def test_unpickled_points_are_interned(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertIs(Point2D(2, 7), pickle.loads(pickle.dumps(Point2D(2, 7))))
+
+    def test_rectangle_contains_point(self) -> None:
+        # -------------------- Arrange -------------------- #
+        palace = Rectangle([Point2D(3, 0), Point2D(3, 2), Point2D(5, 2), Point2D(5, 0)])
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertIn(Point2D(4, 1), palace)
+        self.assertIn(Point2D(5, 2), palace)
+        self.assertNotIn(Point2D(6, 1), palace)
+        self.assertNotIn(Point2D(4, 3), palace)
+
+
+if __name__ == "__main__":
+    unittest.main()
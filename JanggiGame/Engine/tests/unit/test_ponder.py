@@ -0,0 +1,89 @@
+import time
+import unittest
+
+from game import JanggiGame
+from search import Ponderer, Searcher
+from tools.bench import BENCH_POSITIONS
+
+
+class TestPonderer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame(BENCH_POSITIONS[1])
+        result = Searcher(self.game).search(max_depth=2)
+        self.game.board.make(result.move)
+        self.position = self.game.to_notation()
+        self.reply = result.pv[1]
+        self.ponderer = Ponderer()
+
+    def tearDown(self) -> None:
+        self.ponderer.cancel()
+
+    def test_ponder_hit(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.ponderer.start(self.game, self.reply)
+        time.sleep(0.2)
+
+        # -------------------- Act ------------------------ #
+        result = self.ponderer.respond(self.reply, max_depth=2)
+
+        # -------------------- Assert --------------------- #
+        self.game.board.make(self.reply)
+        self.assertIn(result.move, self.game.legal_moves())
+        self.assertGreaterEqual(result.depth, 2)
+        self.assertFalse(self.ponderer.is_pondering)
+
+    def test_ponder_hit_runs_until_deadline(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.ponderer.start(self.game, self.reply)
+        start = time.monotonic()
+
+        # -------------------- Act ------------------------ #
+        result = self.ponderer.respond(self.reply, deadline=start + 0.3)
+
+        # -------------------- Assert --------------------- #
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertGreaterEqual(result.depth, 1)
+
+    def test_ponder_miss(self) -> None:
+        # -------------------- Arrange -------------------- #
+        actual = next(move for move in self.game.legal_moves() if move != self.reply)
+        self.ponderer.start(self.game, self.reply)
+        time.sleep(0.1)
+
+        # -------------------- Act ------------------------ #
+        result = self.ponderer.respond(actual, max_depth=2)
+
+        # -------------------- Assert --------------------- #
+        self.game.board.make(actual)
+        self.assertIn(result.move, self.game.legal_moves())
+        self.assertEqual(2, result.depth)
+
+    def test_cancel(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.ponderer.start(self.game, self.reply)
+        time.sleep(0.1)
+        start = time.monotonic()
+
+        # -------------------- Act ------------------------ #
+        self.ponderer.cancel()
+
+        # -------------------- Assert --------------------- #
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertFalse(self.ponderer.is_pondering)
+        self.assertIsNone(self.ponderer.move)
+        self.assertEqual(self.position, self.game.to_notation())
+
+        with self.assertRaises(RuntimeError):
+            self.ponderer.respond(self.reply, max_depth=1)
+
+    def test_limit_required(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.ponderer.start(self.game, self.reply)
+
+        # -------------------- Assert --------------------- #
+        with self.assertRaises(ValueError):
+            self.ponderer.respond(self.reply)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+
+from game import JanggiGame
+from search import MATE_SCORE, MaterialEvaluator, Searcher
+from utils import encode_move, to_square
+
+
+class TestSearcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+
+    def minimax(self, depth: int) -> int:
+        """Reference negamax score without pruning or move ordering."""
+
+        color = self.board.turn
+
+        if depth == 0:
+            return MaterialEvaluator(self.board).evaluate(color)
+
+        moves = self.game.legal_moves()
+
+        if not moves:
+            return -MATE_SCORE + self.board.ply if self.game.is_in_check(color) else 0
+
+        best = -MATE_SCORE - 1
+
+        for move in moves:
+            self.board.make(move)
+            best = max(best, -self.minimax(depth - 1))
+            self.board.unmake()
+
+        return best
+
+    def test_finds_mate_in_one(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # Blue General boxed in on (3, 2) by its own pieces; the red chariot can check along the d-file or rank 2.
+        self.game = JanggiGame("9/4g4/9/9/r8/9/9/3GS4/3SE4/9 r")
+        mates = {encode_move(to_square(0, 5), to_square(3, 5)), encode_move(to_square(0, 5), to_square(0, 2))}
+
+        # -------------------- Act ------------------------ #
+        result = Searcher(self.game).search(max_depth=4)
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(result.move, mates)
+        self.assertEqual(MATE_SCORE - 1, result.score)
+        self.assertTrue(result.is_mate)
+        # The quiescence search finds the General has no evasion at the horizon.
+        self.assertEqual(1, result.depth)
+
+    def test_matches_minimax_score(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.game = JanggiGame("3ag4/4a4/2c1c4/s3R3s/9/9/S5h1S/1C3H3/3GA4/3A5 r")
+        self.board = self.game.board
+
+        for depth in (1, 2, 3):
+            with self.subTest(depth=depth):
+                # -------------------- Act ------------------------ #
+                result = Searcher(self.game, quiescence=False).search(max_depth=depth)
+
+                # -------------------- Assert --------------------- #
+                self.assertEqual(self.minimax(depth), result.score)
+                self.assertEqual(depth, len(result.pv))
+                self.assertEqual(result.move, result.pv[0])
+
+    def test_quiescence_sees_recapture(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # The blue chariot can take the soldier on (0, 5), but the red cannon recaptures over its screen on (0, 7).
+        position = "c8/5g3/s8/9/s7R/9/9/9/3G5/9 b"
+        capture = encode_move(to_square(8, 5), to_square(0, 5))
+
+        # -------------------- Act ------------------------ #
+        static = Searcher(JanggiGame(position), quiescence=False).search(max_depth=1)
+        resolved = Searcher(JanggiGame(position)).search(max_depth=1)
+        with_checks = Searcher(JanggiGame(position), quiescence_checks=True).search(max_depth=2)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(capture, static.move)
+        self.assertEqual(400, static.score)
+        self.assertNotEqual(capture, resolved.move)
+        self.assertEqual(200, resolved.score)
+        self.assertEqual(200, with_checks.score)
+
+    def test_search_restores_position(self) -> None:
+        # -------------------- Arrange -------------------- #
+        position = self.game.to_notation()
+        position_hash = self.board.position_hash
+
+        # -------------------- Act ------------------------ #
+        result = Searcher(self.game).search(max_depth=3)
+
+        # -------------------- Assert --------------------- #
+        self.assertIn(result.move, self.game.legal_moves())
+        self.assertEqual(position, self.game.to_notation())
+        self.assertEqual(position_hash, self.board.position_hash)
+        self.assertEqual(0, self.board.ply)
+
+    def test_node_budget_stops_search(self) -> None:
+        # -------------------- Arrange -------------------- #
+        depths = list()
+
+        # -------------------- Act ------------------------ #
+        result = Searcher(self.game).search(max_nodes=300, on_iteration=lambda info: depths.append(info.depth))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(300, result.nodes)
+        self.assertIn(result.move, self.game.legal_moves())
+        self.assertEqual(depths[-1], result.depth)
+        self.assertEqual(list(range(1, len(depths) + 1)), depths)
+        self.assertEqual(0, self.board.ply)
+
+    def test_limit_is_required(self) -> None:
+        with self.assertRaises(ValueError):
+            Searcher(self.game).search()
+
+
+if __name__ == "__main__":
+    unittest.main()
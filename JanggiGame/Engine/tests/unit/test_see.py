@@ -0,0 +1,57 @@
+import unittest
+
+from game import JanggiGame
+from search import PIECE_VALUES, static_exchange
+from piece import PieceCategory
+from utils import encode_move, to_square
+
+
+class TestStaticExchange(unittest.TestCase):
+    def exchange(self, position: str, source: tuple, destination: tuple) -> int:
+        game = JanggiGame(position)
+        move = encode_move(to_square(*source), to_square(*destination))
+        self.assertIn(move, game.legal_moves())
+
+        return static_exchange(game.board, move)
+
+    def test_undefended_capture_wins_victim(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(PIECE_VALUES[PieceCategory.SOLDIER], self.exchange("9/5g3/9/9/s7R/9/9/9/3G5/9 b", (8, 5),
+                                                                            (0, 5)))
+
+    def test_cannon_recaptures_over_screen(self) -> None:
+        # -------------------- Act ------------------------ #
+        # The red cannon on (0, 9) defends (0, 5) over the soldier on (0, 7).
+        gain = self.exchange("c8/5g3/s8/9/s7R/9/9/9/3G5/9 b", (8, 5), (0, 5))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(PIECE_VALUES[PieceCategory.SOLDIER] - PIECE_VALUES[PieceCategory.CHARIOT], gain)
+
+    def test_capturing_screen_disarms_cannon(self) -> None:
+        # -------------------- Act ------------------------ #
+        # The chariot is the cannon's only screen: once it captures on the cannon's line, the cannon cannot recapture.
+        gain = self.exchange("c8/5g3/9/R8/s8/9/9/9/3G5/9 b", (0, 6), (0, 5))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(PIECE_VALUES[PieceCategory.SOLDIER], gain)
+
+    def test_exchange_along_palace_diagonal(self) -> None:
+        # -------------------- Act ------------------------ #
+        # The chariot captures the guard on the palace centre diagonally; the guard in the corner recaptures.
+        gain = self.exchange("5a3/4a1g2/3R5/9/9/9/9/9/3G5/9 b", (3, 7), (4, 8))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(PIECE_VALUES[PieceCategory.GUARD] - PIECE_VALUES[PieceCategory.CHARIOT], gain)
+
+    def test_recapture_is_optional(self) -> None:
+        # -------------------- Act ------------------------ #
+        # Soldier takes soldier, uncovering the blue chariot behind it: recapturing with the red chariot would lose it,
+        # so the exchange stops after the first capture.
+        gain = self.exchange("9/5g3/9/r8/s8/S8/9/R8/3G5/9 b", (0, 4), (0, 5))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(PIECE_VALUES[PieceCategory.SOLDIER], gain)
+
+
+if __name__ == "__main__":
+    unittest.main()
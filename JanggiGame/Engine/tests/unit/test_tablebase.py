@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+from game import JanggiGame
+from search import Searcher
+from search.tablebase import DRAW, DRAW_VALUE, ILLEGAL_VALUE, Material, Tablebase, generate, solve
+
+
+class TestTablebase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.values = generate("GRg", cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def test_material(self) -> None:
+        # -------------------- Arrange -------------------- #
+        material = Material("gGAr")
+
+        # -------------------- Act ------------------------ #
+        squares, turn = material.placement(12345)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual("GAgr", material.name)
+        self.assertEqual(2 * 9 * 9 * 9 * 90, material.size)
+        self.assertEqual(12345, material.index(squares, turn))
+        self.assertEqual("GAg", material.without(3).name)
+
+        with self.assertRaises(ValueError):
+            Material("GRR")
+
+    def test_generate_writes_sub_tables(self) -> None:
+        # -------------------- Arrange -------------------- #
+        files = sorted(os.listdir(self.directory.name))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(["GRg.jtb", "Gg.jtb"], files)
+        self.assertEqual(Material("GRg").size, len(self.values))
+
+    def test_probe(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # A lone Chariot cannot mate: the General always has a square off its line.
+        game = JanggiGame("4g4/9/9/9/9/9/9/9/1R2G4/9 r")
+
+        # -------------------- Act ------------------------ #
+        with Tablebase(self.directory.name) as tablebase:
+            materials = tablebase.materials
+            hit = tablebase.probe(game.board)
+            missing = tablebase.probe(JanggiGame().board)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(["GRg", "Gg"], materials)
+        self.assertEqual((DRAW, 0), hit)
+        self.assertIsNone(missing)
+        self.assertEqual({DRAW_VALUE, ILLEGAL_VALUE}, set(self.values))
+
+    def test_solve(self) -> None:
+        # -------------------- Arrange -------------------- #
+        # A hand-made move graph: 0 is checkmate; 4 and 5 pass to each other; captures lead to "X".
+        successors = [None] * Material("Gg").size
+        successors[0] = (True, [], [])
+        successors[1] = (False, [0], [])
+        successors[2] = (False, [1], [])
+        successors[3] = (False, [2, 4], [])
+        successors[4] = (False, [5], [])
+        successors[5] = (False, [4], [])
+        successors[6] = (False, [4], [("X", 0)])
+        successors[7] = (False, [], [("X", 1)])
+        successors[8] = (False, [1], [("X", 2)])
+
+        # Captures into lost positions win, even with no other move or a quicker loss by the other moves.
+        successors[9] = (False, [], [("X", 4)])
+        successors[10] = (False, [9], [("X", 10)])
+
+        # -------------------- Act ------------------------ #
+        values = solve(Material("Gg"), successors, dict(X=[0, 1, DRAW_VALUE, 3, 4, 5, 6, 7, 8, 9, 10]))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual([0, 1, 2, 3, DRAW_VALUE, DRAW_VALUE, 1, 2, DRAW_VALUE, 5, 11, ILLEGAL_VALUE],
+                         list(values[:12]))
+
+    def test_searcher_uses_tablebase(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame("4g4/9/9/9/9/9/9/9/1R2G4/9 b")
+
+        # -------------------- Act ------------------------ #
+        with Tablebase(self.directory.name) as tablebase:
+            result = Searcher(game, tablebase=tablebase).search(max_depth=2)
+
+        # -------------------- Assert --------------------- #
+        # A Chariot ahead is worth 1300 by material, but the ending is a draw.
+        self.assertEqual(0, result.score)
+        self.assertIn(result.move, game.legal_moves())
+
+    def test_parallel_generation_matches(self) -> None:
+        # -------------------- Arrange -------------------- #
+        with tempfile.TemporaryDirectory() as directory:
+            # -------------------- Act ------------------------ #
+            values = generate("GAg", directory, workers=2)
+
+            # -------------------- Assert --------------------- #
+            self.assertEqual(list(generate("GAg", directory)), list(values))
+
+    def test_not_a_table(self) -> None:
+        # -------------------- Arrange -------------------- #
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "GRg.jtb"), "wb") as file:
+                file.write(b"not a table at all, but long enough for a header")
+
+            # -------------------- Assert --------------------- #
+            with self.assertRaises(ValueError):
+                Tablebase(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import math
+import unittest
+
+from game import JanggiGame
+from helpers.notation import algebraic_to_move
+from piece import PieceColor
+from search import BookBuilder
+from tools.tournament import OPENINGS, elo, parse_engine, play_game, run
+
+
+class TestTournament(unittest.TestCase):
+    def test_openings(self) -> None:
+        # -------------------- Assert --------------------- #
+        self.assertEqual(16, len(OPENINGS))
+        self.assertEqual(16, len({tuple(sorted(opening.items())) for opening in OPENINGS}))
+
+    def test_parse_engine(self) -> None:
+        # -------------------- Act ------------------------ #
+        default = parse_engine("")
+        timed = parse_engine("time=0.5,evaluator=pst,quiescence=0")
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(2, default["depth"])
+        self.assertIsNone(timed["depth"])
+        self.assertEqual(0.5, timed["time"])
+        self.assertEqual("pst", timed["evaluator"])
+        self.assertEqual(0, timed["quiescence"])
+
+        for settings in ("speed=3", "depth=", "evaluator=neural"):
+            with self.subTest(settings=settings):
+                with self.assertRaises(ValueError):
+                    parse_engine(settings)
+
+    def test_elo(self) -> None:
+        # -------------------- Act ------------------------ #
+        even, even_margin = elo(5, 0, 5)
+        ahead, _ = elo(3, 0, 1)
+        perfect, _ = elo(4, 0, 0)
+
+        # -------------------- Assert --------------------- #
+        self.assertAlmostEqual(0.0, even)
+        self.assertGreater(even_margin, 0)
+        self.assertAlmostEqual(-400 * math.log10(1 / 0.75 - 1), ahead)
+        self.assertEqual(math.inf, perfect)
+
+    def test_play_game(self) -> None:
+        # -------------------- Arrange -------------------- #
+        engine = parse_engine("depth=1")
+        setup = OPENINGS[5]
+
+        # -------------------- Act ------------------------ #
+        record = play_game(engine, engine, setup, max_plies=6)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(6, len(record["moves"]))
+        self.assertEqual("points", record["reason"])
+        self.assertIn(record["winner"], ("BLUE", "RED"))
+        self.assertGreater(record["nodes"]["BLUE"], 0)
+
+        # The moves replay from the opening.
+        game = JanggiGame()
+        game.transpose_pieces(setup)
+
+        for move in record["moves"]:
+            self.assertIn(algebraic_to_move(move), game.legal_moves())
+            game.board.make(algebraic_to_move(move))
+
+    def test_output_builds_book(self) -> None:
+        # -------------------- Arrange -------------------- #
+        engines = (parse_engine("depth=1"), parse_engine("depth=1,evaluator=pst"))
+        builder = BookBuilder()
+
+        # -------------------- Act ------------------------ #
+        for _, record in run(engines, 2, workers=1, max_plies=12):
+            builder.add_game(record["moves"], PieceColor[record["winner"]], record["setup"])
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(2, builder.games)
+
+    def test_run_alternates_colors(self) -> None:
+        # -------------------- Arrange -------------------- #
+        engines = (parse_engine("depth=1"), parse_engine("depth=1,evaluator=pst"))
+
+        # -------------------- Act ------------------------ #
+        games = dict(run(engines, 2, workers=1, max_plies=2))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual({0, 1}, set(games))
+        self.assertEqual(games[0]["setup"], games[1]["setup"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+
+from game import JanggiGame
+from search import BOUND_EXACT, BOUND_LOWER, BOUND_UPPER, MATE_SCORE, Searcher, TranspositionTable
+from utils import encode_move
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.table = TranspositionTable(megabytes=1)
+        self.buckets = self.table.capacity // 2
+        self.move = encode_move(89, 3)
+
+    def colliding_keys(self, count: int) -> list:
+        """Distinct keys that all map to the same bucket."""
+
+        return [0x9E3779B97F4A7C15 + n * self.buckets for n in range(count)]
+
+    def test_budget_sets_size(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(1 << 20, self.table.size_bytes)
+        self.assertEqual(65536, self.table.capacity)
+        self.assertEqual(1 << 20, TranspositionTable(megabytes=1.5).size_bytes)
+
+        with self.assertRaises(ValueError):
+            TranspositionTable(megabytes=0)
+
+    def test_store_and_probe(self) -> None:
+        # -------------------- Arrange -------------------- #
+        key = (1 << 64) - 12345
+
+        # -------------------- Act ------------------------ #
+        missing = self.table.probe(key)
+        self.table.store(key, self.move, 7, BOUND_LOWER, -(MATE_SCORE - 3))
+
+        # -------------------- Assert --------------------- #
+        self.assertIsNone(missing)
+        self.assertEqual((self.move, 7, BOUND_LOWER, -(MATE_SCORE - 3)), self.table.probe(key))
+        self.assertIsNone(self.table.probe(key ^ 1 << 63))
+        self.assertEqual((1, 2, 1), (self.table.hits, self.table.misses, self.table.stores))
+        self.assertAlmostEqual(1 / 3, self.table.hit_rate)
+
+    def test_depth_preferred_and_always_replace_slots(self) -> None:
+        # -------------------- Arrange -------------------- #
+        deep, shallow, newer, deeper = self.colliding_keys(4)
+
+        # -------------------- Act/Assert -------------------- #
+        self.table.store(deep, self.move, 6, BOUND_EXACT, 10)
+        self.table.store(shallow, self.move, 2, BOUND_UPPER, 20)
+        self.assertIsNotNone(self.table.probe(deep))
+        self.assertIsNotNone(self.table.probe(shallow))
+        self.assertEqual(0, self.table.overwrites)
+
+        # A shallow result replaces the always-replace slot only.
+        self.table.store(newer, self.move, 1, BOUND_UPPER, 30)
+        self.assertIsNone(self.table.probe(shallow))
+        self.assertEqual(6, self.table.probe(deep)[1])
+        self.assertEqual(30, self.table.probe(newer)[3])
+        self.assertEqual(1, self.table.overwrites)
+
+        # A deeper result takes the depth-preferred slot and pushes its occupant into the other slot.
+        self.table.store(deeper, self.move, 9, BOUND_EXACT, 40)
+        self.assertEqual(9, self.table.probe(deeper)[1])
+        self.assertEqual(6, self.table.probe(deep)[1])
+        self.assertIsNone(self.table.probe(newer))
+        self.assertEqual(2, self.table.overwrites)
+
+        # Updating a position in place is not an overwrite.
+        self.table.store(deeper, self.move, 3, BOUND_LOWER, 50)
+        self.assertEqual((self.move, 3, BOUND_LOWER, 50), self.table.probe(deeper))
+        self.assertEqual(2, self.table.overwrites)
+
+    def test_entries_from_earlier_searches_are_replaced_first(self) -> None:
+        # -------------------- Arrange -------------------- #
+        old, current = self.colliding_keys(2)
+        self.table.store(old, self.move, 12, BOUND_EXACT, 0)
+
+        # -------------------- Act ------------------------ #
+        self.table.new_search()
+        self.table.store(current, self.move, 1, BOUND_EXACT, 0)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(1, self.table.probe(current)[1])
+        self.assertEqual(12, self.table.probe(old)[1])
+
+    def test_clear(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.table.store(42, self.move, 1, BOUND_EXACT, 0)
+
+        # -------------------- Act ------------------------ #
+        self.table.clear()
+
+        # -------------------- Assert --------------------- #
+        self.assertIsNone(self.table.probe(42))
+        self.assertEqual((0, 1, 0), (self.table.hits, self.table.misses, self.table.stores))
+
+    def test_tables_can_share_a_buffer(self) -> None:
+        # -------------------- Arrange -------------------- #
+        buffer = bytearray(TranspositionTable.size_for(1))
+        writer = TranspositionTable(1, buffer)
+        reader = TranspositionTable(1, buffer)
+
+        # -------------------- Act ------------------------ #
+        writer.store(42, self.move, 3, BOUND_EXACT, -5)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual((self.move, 3, BOUND_EXACT, -5), reader.probe(42))
+        self.assertEqual(self.table.size_bytes, reader.size_bytes)
+
+        with self.assertRaises(ValueError):
+            TranspositionTable(2, buffer)
+
+        writer.close()
+        reader.close()
+
+    def test_searcher_reuses_table(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game = JanggiGame()
+        searcher = Searcher(game, table=self.table)
+        first = searcher.search(max_depth=3)
+
+        # -------------------- Act ------------------------ #
+        second = searcher.search(max_depth=3)
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(first.score, second.score)
+        self.assertLess(second.nodes, first.nodes)
+        self.assertGreater(self.table.hits, 0)
+        self.assertGreater(self.table.fill_rate(self.table.capacity), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from game import JanggiGame
+from helpers import ZobristKeys
+from piece import PieceCategory, PieceColor
+
+
+class TestZobristHash(unittest.TestCase):
+    def setUp(self) -> None:
+        self.game = JanggiGame()
+        self.board = self.game.board
+
+    def recomputed_hash(self) -> int:
+        return self.board.zobrist.compute(self.board.coord_map, self.board.turn is PieceColor.RED)
+
+    def test_keys_are_deterministic(self) -> None:
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(ZobristKeys().side, ZobristKeys.default().side)
+        self.assertEqual(JanggiGame().board.position_hash, self.board.position_hash)
+        self.assertNotEqual(ZobristKeys(seed=1).side, ZobristKeys(seed=2).side)
+
+    def test_side_to_move_changes_hash(self) -> None:
+        # -------------------- Arrange -------------------- #
+        blue_to_move = self.board.position_hash
+
+        # -------------------- Act ------------------------ #
+        self.game.change_player()
+
+        # -------------------- Assert --------------------- #
+        self.assertNotEqual(blue_to_move, self.board.position_hash)
+        self.assertEqual(blue_to_move ^ self.board.zobrist.keys.side, self.board.position_hash)
+
+    def test_transposition_setup_changes_hash(self) -> None:
+        # -------------------- Arrange -------------------- #
+        standard = self.board.position_hash
+
+        # -------------------- Act ------------------------ #
+        self.game.transpose_pieces(dict(blue_left_transposed=True))
+
+        # -------------------- Assert --------------------- #
+        self.assertNotEqual(standard, self.board.position_hash)
+        self.assertEqual(self.recomputed_hash(), self.board.position_hash)
+
+        # Transposing back restores the standard setup.
+        self.game.transpose_pieces(dict(blue_left_transposed=True))
+        self.assertEqual(standard, self.board.position_hash)
+
+    def test_move_order_does_not_matter(self) -> None:
+        # -------------------- Arrange -------------------- #
+        other = JanggiGame()
+
+        # -------------------- Act ------------------------ #
+        for source, destination in (("a7", "a6"), ("a4", "a5"), ("c7", "c6"), ("c4", "c5")):
+            self.assertTrue(self.game.make_move(source, destination))
+
+        for source, destination in (("c7", "c6"), ("c4", "c5"), ("a7", "a6"), ("a4", "a5")):
+            self.assertTrue(other.make_move(source, destination))
+
+        # -------------------- Assert --------------------- #
+        self.assertEqual(other.board.position_hash, self.board.position_hash)
+
+    def test_incremental_hash_matches_recomputed_hash_through_moves_and_undos(self) -> None:
+        # -------------------- Arrange -------------------- #
+        rng = random.Random(5)
+        start = self.board.position_hash
+        played = 0
+
+        # -------------------- Act/Assert -------------------- #
+        for _ in range(80):
+            moves = [(piece.position, path[-1])
+                     for piece in self.board.search(self.game.player_turn)
+                     for path in self.board.generate_paths(piece)
+                     if self.board.coord_map.get(path[-1].to_tuple()) is None or
+                     self.board.coord_map.get(path[-1].to_tuple()).category is not PieceCategory.GENERAL]
+            if not moves:
+                break
+
+            self.game.move(*rng.choice(moves))
+            played += 1
+            self.assertEqual(self.recomputed_hash(), self.board.position_hash)
+
+        for _ in range(played):
+            self.game.undo_move()
+            self.assertEqual(self.recomputed_hash(), self.board.position_hash)
+
+        self.assertEqual(start, self.board.position_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Search benchmark: node counts and speed to a fixed depth over a fixed set of positions, with and without move
+ordering and quiescence search.
+
+Node counts are deterministic, so they show the effect of search changes independently of the machine; nodes per
+second shows the cost. The score swing is the mean change of score between the last two iterations, a measure of how
+stable the evaluation is at the chosen depth.
+
+Usage (from the Engine directory):
+    python -m tools.bench [--depth DEPTH] [--position NOTATION]...
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from game import JanggiGame
+from search import Searcher
+
+BENCH_POSITIONS: List[str] = [
+    "reha1aehr/4g4/1c5c1/s1s1s1s1s/9/9/S1S1S1S1S/1C5C1/4G4/REHA1AEHR b",
+    "1ehag1eh1/4a4/7c1/1s2s1ss1/r8/Sc3C2r/2S1SS2S/5GHC1/4A4/RE1A2E1R b",
+    "1eh1C1e1r/3aga3/rc6h/s1ss4s/2S6/S4s3/3S3SS/RC7/4cG3/1EH1AAEHR b",
+    "reha2eh1/8r/1c2ag1c1/2ss1Es2/3s4s/6S2/S1S1S3S/1C2GA1C1/8R/R1H1A1EH1 b",
+    "3ag4/4a4/2c1c4/s3R3s/9/9/S5h1S/1C3H3/3GA4/3A5 r",
+]
+
+DEFAULT_DEPTH: int = 4
+
+# Searcher configurations compared: (label, ordering, quiescence).
+CONFIGURATIONS: List[Tuple[str, bool, bool]] = [
+    ("unordered", False, True),
+    ("ordered", True, True),
+    ("no qsearch", True, False),
+]
+
+
+def bench(positions: List[str], depth: int, ordering: bool = True, quiescence: bool = True) -> Tuple[int, float, float]:
+    """
+    Search every position to a fixed depth with a fresh searcher.
+
+    :param positions: Position notation strings.
+    :param depth: Depth to search each position to.
+    :param ordering: Whether the searcher orders moves.
+    :param quiescence: Whether the searcher resolves captures at the horizon.
+    :return: Tuple of the total number of nodes searched, the total time in seconds, and the mean score swing between
+             the last two iterations.
+    """
+
+    nodes = 0
+    swing = 0
+    start = time.perf_counter()
+
+    for position in positions:
+        scores: List[int] = list()
+        result = Searcher(JanggiGame(position), ordering=ordering, quiescence=quiescence).search(
+            max_depth=depth, on_iteration=lambda info: scores.append(info.score)
+        )
+        nodes += result.nodes
+        swing += abs(scores[-1] - scores[-2]) if len(scores) > 1 else 0
+
+    return nodes, time.perf_counter() - start, swing / len(positions)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the search with and without move ordering and quiescence.")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="depth to search each position to")
+    parser.add_argument("--position", action="append", help="position notation to search (repeatable)")
+    args = parser.parse_args(argv)
+
+    positions = args.position or BENCH_POSITIONS
+
+    try:
+        for position in positions:
+            JanggiGame(position)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"{len(positions)} positions, depth {args.depth}")
+
+    results = dict()
+
+    for label, ordering, quiescence in CONFIGURATIONS:
+        nodes, elapsed, swing = bench(positions, args.depth, ordering, quiescence)
+        nps = nodes / elapsed if elapsed > 0 else 0.0
+        results[label] = nodes
+        print(f"{label:>10}: {nodes:>10,} nodes {elapsed:8.2f} s {nps:>10,.0f} nodes/s  score swing {swing:6.0f}")
+
+    print(f"Node reduction: {results['unordered'] / max(results['ordered'], 1):.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Opening book builder: compile an opening book from a corpus of recorded games, or list the book moves of a position.
+
+The corpus is a JSON-lines file with one game per line:
+    {"moves": ["c7c6", "c4c5", ...], "winner": "BLUE" | "RED" | null, "setup": {"blue_left_transposed": true, ...}}
+where "setup" holds the horse and elephant transpositions passed to JanggiGame.transpose_pieces and may be omitted.
+
+Usage (from the Engine directory):
+    python -m tools.book build GAMES BOOK [--max-ply PLY] [--min-games N]
+    python -m tools.book probe BOOK [--position NOTATION]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+
+from game import JanggiGame
+from helpers.notation import STARTING_POSITION, move_to_algebraic
+from piece import PieceColor
+from search.book import DEFAULT_BOOK_PLY, BookBuilder, OpeningBook
+
+
+def build(games_path: str, book_path: str, max_ply: int = DEFAULT_BOOK_PLY, min_games: int = 1) -> int:
+    """
+    Compile a book from a JSON-lines corpus of games.
+
+    :param games_path: Path of the corpus.
+    :param book_path: Path of the book file to write.
+    :param max_ply: Number of plies of each game to enter into the book.
+    :param min_games: Fewest games a move must have been played in to be written.
+    :return: Number of records written.
+    :raises ValueError: If a line of the corpus is not a valid game.
+    """
+
+    builder = BookBuilder(max_ply)
+
+    with open(games_path) as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+                winner = PieceColor[record["winner"]] if record.get("winner") else None
+                builder.add_game(record["moves"], winner, record.get("setup"))
+            except (KeyError, TypeError, ValueError) as error:
+                raise ValueError(f"{games_path}:{number}: invalid game ({error})") from error
+
+    return builder.write(book_path, min_games)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Build or inspect an opening book.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="compile a book from a JSON-lines corpus of games")
+    build_parser.add_argument("games", help="corpus of games, one JSON object per line")
+    build_parser.add_argument("book", help="book file to write")
+    build_parser.add_argument("--max-ply", type=int, default=DEFAULT_BOOK_PLY, help="plies of each game to enter")
+    build_parser.add_argument("--min-games", type=int, default=1, help="fewest games a move must appear in")
+
+    probe_parser = commands.add_parser("probe", help="list the book moves of a position")
+    probe_parser.add_argument("book", help="book file to read")
+    probe_parser.add_argument("--position", default=STARTING_POSITION, help="position notation to look up")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        start = time.perf_counter()
+
+        try:
+            records = build(args.games, args.book, args.max_ply, args.min_games)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+
+        print(f"{records:,} records written to {args.book} in {time.perf_counter() - start:.2f} s")
+        return 0
+
+    try:
+        game = JanggiGame(args.position)
+        book = OpeningBook(args.book)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    with book:
+        for move, weight, games in book.probe(game.board.position_hash):
+            print(f"{move_to_algebraic(move):<6} weight {weight:>6} games {games:>8}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Perft: count the leaf nodes of the legal move tree to a given depth.
+
+Used as the correctness oracle for move generation (counts must not change when the generator is optimised) and as
+the standard move generation throughput benchmark.
+
+Usage (from the Engine directory):
+    python -m tools.perft DEPTH [--position NOTATION] [--divide]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from game import JanggiGame
+from helpers.notation import STARTING_POSITION, move_to_algebraic
+
+
+def perft(game: JanggiGame, depth: int) -> int:
+    """
+    Count the leaf nodes of the legal move tree below the current position.
+
+    Moves are made and unmade on the board, so the game's command stacks are not touched.
+
+    :param game: Game holding the position; its board is restored before returning.
+    :param depth: Number of plies to search.
+    :return: Number of leaf nodes.
+    """
+
+    if depth <= 0:
+        return 1
+
+    board = game.board
+    moves = game.legal_moves()
+
+    # Bulk counting: the number of leaves one ply down is the number of legal moves.
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+
+    for move in moves:
+        board.make(move)
+        nodes += perft(game, depth - 1)
+        board.unmake()
+
+    return nodes
+
+
+def divide(game: JanggiGame, depth: int) -> List[Tuple[int, int]]:
+    """
+    Count the leaf nodes below each legal move of the current position.
+
+    :param game: Game holding the position; its board is restored before returning.
+    :param depth: Number of plies to search, including the root move.
+    :return: List of (packed move, leaf nodes) pairs.
+    """
+
+    board = game.board
+    results: List[Tuple[int, int]] = list()
+
+    for move in game.legal_moves():
+        board.make(move)
+        results.append((move, perft(game, depth - 1)))
+        board.unmake()
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Count leaf nodes of the legal move tree.")
+    parser.add_argument("depth", type=int, help="number of plies to search")
+    parser.add_argument("--position", default=STARTING_POSITION, help="position notation to start from")
+    parser.add_argument("--divide", action="store_true", help="print the leaf count below each root move")
+    args = parser.parse_args(argv)
+
+    try:
+        game = JanggiGame(args.position)
+    except ValueError as error:
+        parser.error(str(error))
+
+    start = time.perf_counter()
+
+    if args.divide:
+        results = divide(game, args.depth)
+
+        for move, count in sorted(results, key=lambda result: move_to_algebraic(result[0])):
+            print(f"{move_to_algebraic(move)}: {count}")
+
+        nodes = sum(count for _, count in results)
+    else:
+        nodes = perft(game, args.depth)
+
+    elapsed = time.perf_counter() - start
+    nps = nodes / elapsed if elapsed > 0 else 0.0
+
+    print(f"\nNodes searched: {nodes}")
+    print(f"Time: {elapsed:.3f} s ({nps:,.0f} nodes/s)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
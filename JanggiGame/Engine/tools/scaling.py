@@ -0,0 +1,93 @@
+"""
+Parallel search scaling: time to search the benchmark positions to a fixed depth with 1 to N worker processes.
+
+For each worker count the report shows the speedup over one worker, the parallel efficiency (speedup divided by the
+number of workers) and the search overhead (nodes searched relative to one worker), which is the price of workers not
+sharing their alpha-beta bounds at the root.
+
+Usage (from the Engine directory):
+    python -m tools.scaling [--workers N] [--depth DEPTH] [--position NOTATION]...
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from game import JanggiGame
+from search.parallel import ParallelSearcher
+from tools.bench import BENCH_POSITIONS
+
+DEFAULT_DEPTH: int = 4
+
+
+def measure(positions: List[str], depth: int, workers: int) -> Tuple[int, float]:
+    """
+    Search every position to a fixed depth with a parallel searcher.
+
+    :param positions: Position notation strings.
+    :param depth: Depth to search each position to.
+    :param workers: Number of worker processes.
+    :return: Tuple of the total number of nodes searched and the total wall-clock time in seconds, excluding the
+             start-up of the worker processes.
+    """
+
+    with ParallelSearcher(workers) as searcher:
+        # Start the worker processes before timing.
+        searcher.search(JanggiGame(positions[0]), 1)
+        searcher.table.clear()
+
+        nodes = 0
+        start = time.perf_counter()
+
+        for position in positions:
+            nodes += searcher.search(JanggiGame(position), depth).nodes
+
+        return nodes, time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Measure parallel search scaling.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="largest number of workers to try")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="depth to search each position to")
+    parser.add_argument("--position", action="append", help="position notation to search (repeatable)")
+    args = parser.parse_args(argv)
+
+    positions = args.position or BENCH_POSITIONS
+
+    try:
+        for position in positions:
+            JanggiGame(position)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"{len(positions)} positions, depth {args.depth}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'time':>8} {'nodes':>10} {'speedup':>8} {'efficiency':>10} {'overhead':>8}")
+
+    base_nodes, base_time = 0, 0.0
+
+    for workers in range(1, max(args.workers, 1) + 1):
+        nodes, elapsed = measure(positions, args.depth, workers)
+
+        if workers == 1:
+            base_nodes, base_time = nodes, elapsed
+
+        speedup = base_time / elapsed if elapsed > 0 else 0.0
+        print(f"{workers:>7} {elapsed:>7.2f}s {nodes:>10,} {speedup:>7.2f}x {speedup / workers:>9.0%} "
+              f"{nodes / base_nodes:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Endgame tablebase generator: solve small materials by retrograde analysis, or look up a position.
+
+Materials are named by their pieces' letters, upper case for BLUE and lower case for RED, e.g. "GAgr" for a General
+and a Guard against a General and a Chariot. The tables of the materials reachable by captures are generated first if
+they are not already in the directory.
+
+Usage (from the Engine directory):
+    python -m tools.tablebase generate MATERIAL... [--directory DIR] [--workers N]
+    python -m tools.tablebase probe NOTATION [--directory DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+from game import JanggiGame
+from search.tablebase import DRAW, DRAW_VALUE, ILLEGAL_VALUE, WIN, Tablebase, generate
+
+DEFAULT_DIRECTORY: str = "tablebases"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Generate or probe endgame tablebases.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="solve materials and write their tables")
+    generate_parser.add_argument("materials", nargs="+", help="material names, e.g. GAgr")
+    generate_parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="directory of the tables")
+    generate_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes listing moves")
+
+    probe_parser = commands.add_parser("probe", help="look up a position")
+    probe_parser.add_argument("position", help="position notation")
+    probe_parser.add_argument("--directory", default=DEFAULT_DIRECTORY, help="directory of the tables")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        os.makedirs(args.directory, exist_ok=True)
+        print(f"{'material':>10} {'positions':>10} {'won':>8} {'drawn':>8} {'lost':>8} {'longest':>7} {'time':>8}")
+
+        for material in args.materials:
+            start = time.perf_counter()
+
+            try:
+                values = generate(material, args.directory, max(args.workers, 1))
+            except ValueError as error:
+                parser.error(str(error))
+
+            legal = [value for value in values if value != ILLEGAL_VALUE]
+            mates = [value for value in legal if value != DRAW_VALUE]
+            won = sum(value & 1 for value in mates)
+            print(f"{material:>10} {len(legal):>10,} {won:>8,} {len(legal) - len(mates):>8,} {len(mates) - won:>8,} "
+                  f"{max(mates, default=0):>7} {time.perf_counter() - start:>7.2f}s")
+
+        return 0
+
+    try:
+        game = JanggiGame(args.position)
+        tablebase = Tablebase(args.directory)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    with tablebase:
+        hit = tablebase.probe(game.board)
+
+    if hit is None:
+        print("not in the tablebase")
+    elif hit[0] == DRAW:
+        print("draw")
+    else:
+        print(f"{'win' if hit[0] == WIN else 'loss'} in {hit[1]} plies")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
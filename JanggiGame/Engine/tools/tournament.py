@@ -0,0 +1,289 @@
+"""
+Self-play tournament: two engine configurations play each other on a process pool, and the result is reported as an
+Elo difference with a 95% error margin, along with the nodes per second of each engine.
+
+Each opening is one of the 16 combinations of the four horse and elephant setups of each side (see
+JanggiGame.transpose_pieces), and is played twice with the colors swapped. A game ends by checkmate, or after a
+number of plies by the counting rule (the side with more points wins; see PieceSquareEvaluator.points).
+
+Engines are described by comma-separated key=value settings:
+    depth=N       depth limit (default 2 if no other limit is given)
+    nodes=N       node budget per move
+    time=SECONDS  time limit per move
+    evaluator=material|pst
+    ordering=0|1, quiescence=0|1
+    table=MB      transposition table size (default 4)
+
+Finished games can be written as JSON lines in the corpus format of tools.book.
+
+Usage (from the Engine directory):
+    python -m tools.tournament [--engine SETTINGS] [--engine SETTINGS] [--games N] [--workers N] [--max-plies N]
+                               [--output GAMES]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from game import GameState, JanggiGame
+from helpers.notation import move_to_algebraic, square_to_algebraic
+from piece import PieceColor
+from search import MaterialEvaluator, PieceSquareEvaluator, Searcher, TranspositionTable
+from utils import move_destination, move_source
+
+# The setups of one side, as (left pair transposed, right pair transposed).
+SETUPS: List[Tuple[bool, bool]] = [(False, False), (True, False), (False, True), (True, True)]
+
+# Openings: every combination of a BLUE setup and a RED setup, as passed to JanggiGame.transpose_pieces.
+OPENINGS: List[Dict[str, bool]] = [
+    dict(blue_left_transposed=blue[0], blue_right_transposed=blue[1],
+         red_left_transposed=red[0], red_right_transposed=red[1])
+    for blue in SETUPS for red in SETUPS
+]
+
+DEFAULT_ENGINES: List[str] = ["depth=2", "depth=1"]
+DEFAULT_GAMES: int = 32
+DEFAULT_MAX_PLIES: int = 200
+
+# Depth limit of an engine given no limit at all.
+DEFAULT_DEPTH: int = 2
+
+ENGINE_DEFAULTS: Dict[str, Any] = dict(depth=None, nodes=None, time=None, evaluator="material", ordering=1,
+                                       quiescence=1, table=4)
+
+# Half-width of a 95% confidence interval, in standard errors.
+CONFIDENCE_Z: float = 1.96
+
+
+def parse_engine(settings: str) -> Dict[str, Any]:
+    """
+    Parse engine settings.
+
+    :param settings: Comma-separated key=value settings (see the module documentation).
+    :return: Settings by key, with defaults for those not given.
+    :raises ValueError: If a setting is unknown or malformed.
+    """
+
+    engine = dict(ENGINE_DEFAULTS)
+
+    for item in filter(None, settings.split(",")):
+        key, _, value = item.partition("=")
+
+        if key not in ENGINE_DEFAULTS or not value:
+            raise ValueError(f"Invalid engine setting: {item!r}")
+
+        if key == "evaluator":
+            if value not in ("material", "pst"):
+                raise ValueError(f"Invalid evaluator: {value!r}")
+            engine[key] = value
+        elif key in ("time", "table"):
+            engine[key] = float(value)
+        else:
+            engine[key] = int(value)
+
+    if engine["depth"] is None and engine["nodes"] is None and engine["time"] is None:
+        engine["depth"] = DEFAULT_DEPTH
+
+    return engine
+
+
+def play_game(blue: Dict[str, Any], red: Dict[str, Any], setup: Dict[str, bool], max_plies: int) -> Dict[str, Any]:
+    """
+    Play one game between two engines.
+
+    :param blue: Settings of the engine playing BLUE (see parse_engine).
+    :param red: Settings of the engine playing RED.
+    :param setup: Horse and elephant transpositions, as passed to JanggiGame.transpose_pieces.
+    :param max_plies: Number of plies after which the game is decided by the counting rule.
+    :return: Game record: the moves in algebraic notation, the winner ("BLUE" or "RED"), the setup, how the game
+             ended, and the nodes searched and search time of each side.
+    """
+
+    game = JanggiGame()
+    game.transpose_pieces(setup)
+
+    board = game.board
+    engines = dict()
+
+    for color, settings in ((PieceColor.BLUE, blue), (PieceColor.RED, red)):
+        evaluator = PieceSquareEvaluator(board) if settings["evaluator"] == "pst" else MaterialEvaluator(board)
+        searcher = Searcher(game, evaluator=evaluator, table=TranspositionTable(settings["table"]),
+                            ordering=bool(settings["ordering"]), quiescence=bool(settings["quiescence"]))
+        engines[color] = (searcher, settings)
+
+    moves: List[str] = list()
+    nodes = {color.name: 0 for color in PieceColor}
+    elapsed = {color.name: 0.0 for color in PieceColor}
+
+    while game.game_state is GameState.UNFINISHED and len(moves) < max_plies:
+        color = game.player_turn
+        searcher, settings = engines[color]
+        deadline = time.monotonic() + settings["time"] if settings["time"] is not None else None
+        result = searcher.search(max_depth=settings["depth"], max_nodes=settings["nodes"], deadline=deadline)
+
+        nodes[color.name] += result.nodes
+        elapsed[color.name] += result.elapsed
+
+        if result.move is None:
+            break
+
+        source, destination = move_source(result.move), move_destination(result.move)
+        game.make_move(square_to_algebraic(source), square_to_algebraic(destination))
+        moves.append(move_to_algebraic(result.move))
+
+    if game.game_state is GameState.BLUE_WON:
+        winner, reason = PieceColor.BLUE, "checkmate"
+    elif game.game_state is GameState.RED_WON:
+        winner, reason = PieceColor.RED, "checkmate"
+    else:
+        counter = PieceSquareEvaluator(game.board)
+        winner = max(PieceColor, key=counter.points)
+        reason = "points"
+
+    return dict(moves=moves, winner=winner.name, setup=setup, reason=reason, nodes=nodes, elapsed=elapsed)
+
+
+def _play_scheduled(index: int,
+                    engines: Tuple[Dict[str, Any], Dict[str, Any]],
+                    max_plies: int) -> Tuple[int, Dict[str, Any]]:
+    """Worker task: play the game at an index of the schedule."""
+
+    first, second = engines
+    setup = OPENINGS[index // 2 % len(OPENINGS)]
+    blue, red = (first, second) if index % 2 == 0 else (second, first)
+
+    return index, play_game(blue, red, setup, max_plies)
+
+
+def run(engines: Tuple[Dict[str, Any], Dict[str, Any]],
+        games: int,
+        workers: int = 1,
+        max_plies: int = DEFAULT_MAX_PLIES) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Play a tournament between two engines, alternating colors and cycling through the OPENINGS.
+
+    :param engines: Settings of the two engines (see parse_engine).
+    :param games: Number of games.
+    :param workers: Number of processes playing games; 1 plays them in this process.
+    :param max_plies: Number of plies after which a game is decided by the counting rule.
+    :return: Iterator of (game index, game record) pairs, in the order the games finish; the first engine plays BLUE
+             in games with an even index.
+    """
+
+    if workers <= 1:
+        for index in range(games):
+            yield _play_scheduled(index, engines, max_plies)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_play_scheduled, index, engines, max_plies) for index in range(games)]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def elo(wins: int, draws: int, losses: int) -> Tuple[float, float]:
+    """
+    Estimate the Elo difference implied by a match score.
+
+    :param wins: Games won.
+    :param draws: Games drawn.
+    :param losses: Games lost.
+    :return: Tuple of the Elo difference and the half-width of its 95% confidence interval; infinite if the score or
+             a bound of its interval is 0 or 1.
+    """
+
+    games = wins + draws + losses
+
+    if games == 0:
+        return 0.0, math.inf
+
+    score = (wins + draws / 2) / games
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / games
+    error = CONFIDENCE_Z * math.sqrt(variance / games)
+
+    def to_elo(fraction: float) -> float:
+        if fraction <= 0:
+            return -math.inf
+        if fraction >= 1:
+            return math.inf
+
+        return -400 * math.log10(1 / fraction - 1)
+
+    return to_elo(score), (to_elo(score + error) - to_elo(score - error)) / 2
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    :param argv: Command line arguments (defaults to sys.argv).
+    :return: Exit status.
+    """
+
+    parser = argparse.ArgumentParser(description="Play a self-play tournament between two engine configurations.")
+    parser.add_argument("--engine", action="append", help="engine settings (give twice; see the module documentation)")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="number of games")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of processes")
+    parser.add_argument("--max-plies", type=int, default=DEFAULT_MAX_PLIES, help="plies before the counting rule")
+    parser.add_argument("--output", help="file to write the games to, as JSON lines")
+    args = parser.parse_args(argv)
+
+    labels = args.engine or DEFAULT_ENGINES
+
+    if len(labels) != 2:
+        parser.error("give --engine exactly twice, or not at all")
+
+    try:
+        engines = (parse_engine(labels[0]), parse_engine(labels[1]))
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"A: {labels[0]}  B: {labels[1]}  {args.games} games, {args.workers} workers, {os.cpu_count()} CPUs")
+
+    points = [0, 0, 0]
+    nodes = [0, 0]
+    elapsed = [0.0, 0.0]
+    start = time.perf_counter()
+    output = open(args.output, "w") if args.output else None
+
+    try:
+        for index, record in run(engines, args.games, args.workers, args.max_plies):
+            first_color = PieceColor.BLUE if index % 2 == 0 else PieceColor.RED
+            won = record["winner"] == first_color.name
+            points[0 if won else 2] += 1
+
+            for engine, color in ((0, first_color), (1, first_color.opponent)):
+                nodes[engine] += record["nodes"][color.name]
+                elapsed[engine] += record["elapsed"][color.name]
+
+            print(f"game {index + 1:>4}: {'A' if won else 'B'} wins by {record['reason']} "
+                  f"as {first_color.name if won else first_color.opponent.name} in {len(record['moves'])} plies")
+
+            if output is not None:
+                output.write(json.dumps(record) + "\n")
+    finally:
+        if output is not None:
+            output.close()
+
+    difference, margin = elo(*points)
+    print(f"A: +{points[0]} ={points[1]} -{points[2]}  Elo difference {difference:+.0f} +/- {margin:.0f}")
+
+    for engine in range(2):
+        nps = nodes[engine] / elapsed[engine] if elapsed[engine] > 0 else 0.0
+        print(f"{'AB'[engine]}: {nodes[engine]:,} nodes {elapsed[engine]:.1f} s {nps:,.0f} nodes/s")
+
+    print(f"Wall-clock time: {time.perf_counter() - start:.1f} s")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,4 @@
+from .move import MOVE_SQUARE_BITS, MOVE_SQUARE_MASK, encode_move, move_destination, move_source
 from .point import Point2D
 from .rectangle import Rectangle
+from .square import BOARD_HEIGHT, BOARD_WIDTH, SQUARE_COUNT, is_on_board, to_coordinates, to_square
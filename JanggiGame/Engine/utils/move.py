@@ -0,0 +1,38 @@
+MOVE_SQUARE_BITS: int = 7
+MOVE_SQUARE_MASK: int = (1 << MOVE_SQUARE_BITS) - 1
+
+
+def encode_move(source: int, destination: int) -> int:
+    """
+    Pack a move into a single integer.
+
+    A move whose source and destination are the same square passes the turn.
+
+    :param source: Source square number.
+    :param destination: Destination square number.
+    :return: Packed move.
+    """
+
+    return source | destination << MOVE_SQUARE_BITS
+
+
+def move_source(move: int) -> int:
+    """
+    Return the source square of a packed move.
+
+    :param move: Packed move.
+    :return: Source square number.
+    """
+
+    return move & MOVE_SQUARE_MASK
+
+
+def move_destination(move: int) -> int:
+    """
+    Return the destination square of a packed move.
+
+    :param move: Packed move.
+    :return: Destination square number.
+    """
+
+    return move >> MOVE_SQUARE_BITS & MOVE_SQUARE_MASK
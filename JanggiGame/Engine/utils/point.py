@@ -1,21 +1,73 @@
 from __future__ import annotations
 
-from typing import Union
+from typing import List, Optional, Tuple, Union
+
+from .square import BOARD_HEIGHT, BOARD_WIDTH, SQUARE_COUNT, to_coordinates, to_square
+
+# Interned points cover every square of the board and every vector between two squares of the board.
+_X_RANGE: Tuple[int, int] = (-(BOARD_WIDTH - 1), BOARD_WIDTH - 1)
+_Y_RANGE: Tuple[int, int] = (-(BOARD_HEIGHT - 1), BOARD_HEIGHT - 1)
+_POOL_WIDTH: int = _X_RANGE[1] - _X_RANGE[0] + 1
 
 
 class Point2D:
-    """A class representing a 2D point in space."""
+    """
+    A class representing a 2D point in space.
+
+    Points are immutable and hashable. Integer points that lie on the board, as well as the vectors between any two
+    points on the board (which include the unit direction vectors), are flyweights: constructing one returns a shared
+    instance from a pool rather than allocating a new object.
+    """
+
+    __slots__ = ("_x", "_y", "_square")
 
-    def __init__(self, x: Union[int, float], y: Union[int, float]) -> None:
+    __pool: List[Optional[Point2D]] = list()
+    __squares: List[Point2D] = list()
+
+    def __new__(cls, x: Union[int, float], y: Union[int, float]) -> Point2D:
         """
-        Initialize a Point2D object with x and y coordinates.
+        Return the Point2D object for the x and y coordinates.
 
         :param x: The x coordinate of the point.
         :param y: The y coordinate of the point.
         """
 
-        self._x = x
-        self._y = y
+        if type(x) is int and type(y) is int and \
+                _X_RANGE[0] <= x <= _X_RANGE[1] and _Y_RANGE[0] <= y <= _Y_RANGE[1]:
+            return cls.__pool[(y - _Y_RANGE[0]) * _POOL_WIDTH + (x - _X_RANGE[0])]
+
+        return cls._create(x, y)
+
+    @classmethod
+    def _create(cls, x: Union[int, float], y: Union[int, float]) -> Point2D:
+        """Allocate a new point, bypassing the pool."""
+
+        point = object.__new__(cls)
+        point._x = x
+        point._y = y
+        point._square = to_square(x, y) if type(x) is int and type(y) is int else -1
+
+        return point
+
+    @classmethod
+    def _populate_pool(cls) -> None:
+        """Create the interned points; called once when the module is imported."""
+
+        cls.__pool = [cls._create(x, y)
+                      for y in range(_Y_RANGE[0], _Y_RANGE[1] + 1)
+                      for x in range(_X_RANGE[0], _X_RANGE[1] + 1)]
+        cls.__squares = [Point2D(*to_coordinates(square)) for square in range(SQUARE_COUNT)]
+
+    @classmethod
+    def from_square(cls, square: int) -> Point2D:
+        """
+        Return the interned point for a square number.
+
+        :param square: Square number in the range [0, 90).
+        :return: Point2D object.
+        """
+
+        return cls.__squares[square]
 
     @property
     def x(self) -> Union[int, float]:
@@ -25,25 +77,62 @@ class Point2D:
     def y(self) -> Union[int, float]:
         return self._y
 
+    @property
+    def square(self) -> int:
+        """Return the point's square number on the board, or -1 if it is not on the board."""
+
+        return self._square
+
+    def offset(self, dx: int, dy: int) -> Point2D:
+        """
+        Return the point translated by dx and dy, taken from the pool where possible.
+
+        :param dx: Translation along the x-axis.
+        :param dy: Translation along the y-axis.
+        :return: Translated point.
+        """
+
+        return Point2D(self._x + dx, self._y + dy)
+
     def __add__(self, other: Point2D) -> Point2D:
         """Override addition operator to assist in performing vector addition."""
 
-        return Point2D(self.x + other.x, self.y + other.y)
+        return Point2D(self._x + other._x, self._y + other._y)
 
     def __sub__(self, other: Point2D) -> Point2D:
         """Override subtraction operator to assist in performing vector subtraction."""
 
-        return Point2D(self.x - other.x, self.y - other.y)
+        return Point2D(self._x - other._x, self._y - other._y)
 
-    def __eq__(self, other: Point2D) -> bool:
+    def __eq__(self, other: object) -> bool:
         """Override the equality operator to assist in comparing two points by their x andy attributes."""
 
-        return (self.x, self.y) == (other.x, other.y)
+        if self is other:
+            return True
 
-    def __ne__(self, other: Point2D) -> bool:
+        if not isinstance(other, Point2D):
+            return NotImplemented
+
+        return self._x == other._x and self._y == other._y
+
+    def __ne__(self, other: object) -> bool:
         """Override the inequality operator to assist in comparing two points by they x and y attributes."""
 
-        return (self.x, self.y) != (other.x, other.y)
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
+    def __reduce__(self):
+        # Unpickled points go through __new__ so that they are interned again.
+        return Point2D, (self._x, self._y)
+
+    def __repr__(self) -> str:
+        return f"Point2D({self._x}, {self._y})"
 
     def to_tuple(self):
         return self.x, self.y
+
+
+Point2D._populate_pool()
@@ -30,12 +30,7 @@ class Rectangle:
         :return: True if point in rectangle, False otherwise.
         """
 
-        is_inside: List[bool] = [
-            self.top_left.x <= point.x <= self.top_right.x,
-            self.bottom_left.y <= point.y <= self.top_left.y
-        ]
-
-        return all(is_inside)
+        return self._top_left.x <= point.x <= self._top_right.x and self._bottom_left.y <= point.y <= self._top_left.y
 
     @property
     def bottom_left(self) -> Point2D:
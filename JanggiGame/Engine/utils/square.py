@@ -0,0 +1,44 @@
+from typing import Tuple
+
+BOARD_WIDTH: int = 9
+BOARD_HEIGHT: int = 10
+SQUARE_COUNT: int = BOARD_WIDTH * BOARD_HEIGHT
+
+
+def is_on_board(x: int, y: int) -> bool:
+    """
+    Determine if a coordinate lies within the 9x10 board.
+
+    :param x: The x coordinate.
+    :param y: The y coordinate.
+    :return: True if the coordinate is on the board, False otherwise.
+    """
+
+    return 0 <= x < BOARD_WIDTH and 0 <= y < BOARD_HEIGHT
+
+
+def to_square(x: int, y: int) -> int:
+    """
+    Convert a coordinate to its square number, counting row by row from the bottom-left corner.
+
+    :param x: The x coordinate.
+    :param y: The y coordinate.
+    :return: Square number in the range [0, 90), or -1 if the coordinate is off the board or not a pair of integers
+             (an unknown file in algebraic notation parses to None).
+    """
+
+    if not isinstance(x, int) or not isinstance(y, int) or not is_on_board(x, y):
+        return -1
+
+    return y * BOARD_WIDTH + x
+
+
+def to_coordinates(square: int) -> Tuple[int, int]:
+    """
+    Convert a square number back to its coordinate.
+
+    :param square: Square number in the range [0, 90).
+    :return: Tuple of x and y coordinates.
+    """
+
+    return square % BOARD_WIDTH, square // BOARD_WIDTH
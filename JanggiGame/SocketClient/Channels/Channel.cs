@@ -22,8 +22,12 @@ namespace SocketClient.Channels
         Task _receiveLoopTask;
 
 
+        public bool IsConnected
+            => _networkStream != null && _receiveLoopTask != null && !_receiveLoopTask.IsCompleted;
+
         public void Attach(Socket socket)
         {
+            _networkStream?.Close();
             _networkStream = new NetworkStream(socket, true);
             _receiveLoopTask = Task.Run(ReceiveLoop, _cancellationTokenSource.Token);
         }
@@ -14,6 +14,7 @@ namespace SocketClient.Channels
         public async Task ConnectAsync(IPEndPoint endPoint)
         {
             var socket = new Socket(endPoint.AddressFamily, SocketType.Stream, ProtocolType.Tcp);
+            socket.SetSocketOption(SocketOptionLevel.Socket, SocketOptionName.KeepAlive, true);
 
             await socket.ConnectAsync(endPoint).ConfigureAwait(false);
 
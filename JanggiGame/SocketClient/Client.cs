@@ -2,6 +2,7 @@
 using System.Collections.Generic;
 using System.Linq;
 using System.Net;
+using System.Threading;
 using System.Threading.Tasks;
 
 using Common;
@@ -17,7 +18,9 @@ namespace SocketClient
 
         private readonly IPEndPoint _endpoint;
         private readonly ClientChannel<JsonMessageProtocol, Message> _channel;
+        private readonly SemaphoreSlim _connectLock = new SemaphoreSlim(1, 1);
 
+        public string GameId;
         public List<PieceDTO> PieceDTOs;
         public List<Coordinate> PieceDestinations;
         public GameState GameState;
@@ -114,14 +117,41 @@ namespace SocketClient
         public async Task Connect()
             => await _channel.ConnectAsync(_endpoint).ConfigureAwait(false);
 
+        // The connection is kept open between messages, and only reopened once the server has closed it.
+        private async Task EnsureConnected()
+        {
+            await _connectLock.WaitAsync().ConfigureAwait(false);
+            try
+            {
+                if (!_channel.IsConnected)
+                    await Connect().ConfigureAwait(false);
+            }
+            finally
+            {
+                _connectLock.Release();
+            }
+        }
+
         public async Task SendMessage(Message message)
         {
-            await Connect().ConfigureAwait(false);
+            message.GameId = GameId;
+            await EnsureConnected().ConfigureAwait(false);
             await _channel.SendAsync(message).ConfigureAwait(false);
         }
 
         public Task OnMessage(Message message)
         {
+            switch (message.Action)
+            {
+                case MessageAction.GAME_STARTED:
+                    GameId = message.GameId;
+                    break;
+                case MessageAction.GAME_OVER:
+                case MessageAction.UNKNOWN_GAME:
+                    GameId = null;
+                    break;
+            }
+
             ExtractDTO(message);
             return Task.CompletedTask;
         }
@@ -4,5 +4,6 @@
     {
         public MessageAction Action { get; set; }
         public MessageData Data { get; set; }
+        public string GameId { get; set; }
     }
 }
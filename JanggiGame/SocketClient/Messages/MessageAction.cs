@@ -18,6 +18,7 @@ namespace SocketClient.Messages
         MOVE_CONFIRMED,
         END_GAME,
         GAME_OVER,
+        UNKNOWN_GAME,
         DEFAULT 
     }
 }
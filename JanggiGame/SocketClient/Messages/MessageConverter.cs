@@ -55,7 +55,8 @@ namespace SocketClient.Messages
             return new Message
             {
                 Action = action,
-                Data = data
+                Data = data,
+                GameId = jObject["GameId"]?.ToString()
             };
         }
 
@@ -1,32 +1,62 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import socket
+from typing import Optional, TYPE_CHECKING
 
 from action_request import ActionRequestHandler
 
 if TYPE_CHECKING:
     from protocols.protocol import Protocol
 
+# Seconds a connection may stay without receiving a message before the server closes it.
+IDLE_TIMEOUT = 300
+
 
 class Channel:
-    def __init__(self, server, protocol: Protocol):
+    def __init__(self, server, protocol: Protocol, idle_timeout: Optional[float] = IDLE_TIMEOUT):
         self.server = server
         self.protocol: Protocol = protocol
+        self.idle_timeout: Optional[float] = idle_timeout
 
     async def handle_conn(self, reader, writer):
-        # process request
-        msg = await self.receive_async(reader)
-
         addr = writer.get_extra_info('peername')
-        print(f"Received: {msg} from {addr!r}")
 
-        # perform action and return result
-        action_handler = ActionRequestHandler(msg, self.server)
-        response = action_handler.create_response()
+        # let the OS detect peers that vanished without closing the connection
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        try:
+            # serve requests until the peer disconnects or stays idle too long
+            while True:
+                try:
+                    msg = await asyncio.wait_for(self.receive_async(reader), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    print(f"Idle timeout: {addr!r}")
+                    break
+
+                print(f"Received: {msg} from {addr!r}")
+
+                # perform action and return result
+                action_handler = ActionRequestHandler(msg, self.server)
+                response = action_handler.create_response()
+
+                # return response
+                print(f"Send: {response}")
+                await self.send_async(writer, response)
+        except (asyncio.IncompleteReadError, ConnectionError) as error:
+            print(f"Connection lost: {addr!r} ({error!r})")
+        except EOFError:
+            print(f"Disconnected: {addr!r}")
+        finally:
+            print(f"Close the connection: {addr!r}")
+            writer.close()
 
-        # return response
-        print(f"Send: {response}")
-        await self.send_async(writer, response)
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
 
     async def receive_async(self, reader):
         msg = await self.protocol.receive_async(reader)
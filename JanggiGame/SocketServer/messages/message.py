@@ -8,3 +8,4 @@ from .message_data import MessageData
 class Message:
     Action: MessageAction
     Data: MessageData
+    GameId: str = ""
@@ -14,4 +14,5 @@ class MessageAction(Enum):
     MOVE_CONFIRMED = auto()
     END_GAME = auto()
     GAME_OVER = auto()
+    UNKNOWN_GAME = auto()
     DEFAULT = auto()
@@ -13,7 +13,8 @@ class MessageEncoder(JSONEncoder):
         if isinstance(o, Message):
             return {
                 "Action": o.Action.name,
-                "Data": dataclasses.asdict(o.Data)
+                "Data": dataclasses.asdict(o.Data),
+                "GameId": o.GameId
             }
 
         return json.JSONEncoder.default(self, o)
@@ -27,6 +28,7 @@ class MessageDecoder(JSONDecoder):
         if 'Action' in obj and 'Data' in obj:
             action = MessageAction[obj["Action"]]
             data = MessageData()
+            game_id = obj.get("GameId") or ""
 
             if action is MessageAction.NEW_GAME:
                 pass
@@ -41,7 +43,7 @@ class MessageDecoder(JSONDecoder):
             elif action is MessageAction.MOVE_COMPLETED:
                 data = MoveCompleted(**obj["Data"])
             else:
-                return Message(MessageAction.DEFAULT, MessageData())
+                return Message(MessageAction.DEFAULT, MessageData(), game_id)
 
-            return Message(action, data)
+            return Message(action, data, game_id)
         return obj
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import struct
 
 
@@ -21,19 +22,23 @@ class Protocol(metaclass=abc.ABCMeta):
         await writer.drain()
 
         print(f"Encoded response: {response}")
-        print("Close the connection")
-        writer.close()
 
     async def read_header(self, reader):
-        # Read header to get body length
-        header_bytes = await reader.read(self.HEADER_SIZE)
+        # Read header to get body length; a clean end of stream before a new message raises EOFError
+        try:
+            header_bytes = await reader.readexactly(self.HEADER_SIZE)
+        except asyncio.IncompleteReadError as error:
+            if error.partial:
+                raise
+            raise EOFError("Connection closed by peer") from None
+
         body_len = struct.unpack(self.HEADER_FORMAT, bytearray(header_bytes))[0]
 
         return body_len
 
     async def read_body(self, reader, length):
         # Read body length bytes
-        data = await reader.read(length)
+        data = await reader.readexactly(length)
         message = data.decode()
 
         return self.decode(message)
@@ -3,6 +3,7 @@ import asyncio
 from channels import Channel
 from protocols import JsonMessageProtocol
 from messages import MessageEncoder, MessageDecoder
+from sessions import SessionRegistry
 
 HOST = "127.0.0.1"
 PORT = 9001
@@ -17,7 +18,7 @@ class Server:
     def __init__(self, host, port):
         self.host = host
         self.port = port
-        self.game = None
+        self.sessions = SessionRegistry()
 
     async def run_server(self):
         channel = Channel(self, JsonMessageProtocol(MessageEncoder, MessageDecoder))
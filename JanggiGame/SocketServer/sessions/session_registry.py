@@ -0,0 +1,116 @@
+import dataclasses
+import time
+import uuid
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from Engine.game import JanggiGame
+
+# Seconds a game may go without a message before the registry forgets it.
+SESSION_TIMEOUT = 3600
+
+
+@dataclasses.dataclass
+class GameSession:
+    """State of one game hosted by the server."""
+
+    game_id: str
+    game: JanggiGame
+    last_active: float = dataclasses.field(default_factory=time.monotonic)
+
+    def touch(self) -> None:
+        """Record activity on the session."""
+
+        self.last_active = time.monotonic()
+
+
+class SessionRegistry:
+    """
+    Games hosted by the server, keyed by the game ID carried in every message.
+
+    Sessions are kept in order of last activity, so that games abandoned by their clients (which never send END_GAME)
+    can be expired from the front whenever a game is created.
+    """
+
+    def __init__(self, timeout: Optional[float] = SESSION_TIMEOUT) -> None:
+        """
+        :param timeout: Seconds a game may go without a message before it is expired, or None to keep games forever.
+        """
+
+        self.__sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+        self.__timeout: Optional[float] = timeout
+
+    def create(self) -> GameSession:
+        """
+        Start a new game under a fresh game ID, first expiring idle games.
+
+        :return: Session of the new game.
+        """
+
+        self.expire()
+
+        game_id = uuid.uuid4().hex
+        session = GameSession(game_id, JanggiGame())
+        self.__sessions[game_id] = session
+
+        return session
+
+    def get(self, game_id: Optional[str]) -> Optional[GameSession]:
+        """
+        Look up a game, recording activity on it.
+
+        :param game_id: ID of the game.
+        :return: Session of the game, or None if no game has this ID.
+        """
+
+        session = self.__sessions.get(game_id) if game_id else None
+
+        if session is not None:
+            session.touch()
+            self.__sessions.move_to_end(game_id)
+
+        return session
+
+    def remove(self, game_id: Optional[str]) -> Optional[GameSession]:
+        """
+        End a game, forgetting its state.
+
+        :param game_id: ID of the game.
+        :return: Session of the game, or None if no game has this ID.
+        """
+
+        return self.__sessions.pop(game_id, None) if game_id else None
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Forget the games that have been idle for longer than the timeout.
+
+        :param now: time.monotonic() time to measure idleness at; defaults to the current time.
+        :return: Number of games expired.
+        """
+
+        if self.__timeout is None:
+            return 0
+
+        cutoff = (time.monotonic() if now is None else now) - self.__timeout
+        expired = 0
+
+        while self.__sessions:
+            session = next(iter(self.__sessions.values()))
+
+            if session.last_active > cutoff:
+                break
+
+            del self.__sessions[session.game_id]
+            expired += 1
+
+        return expired
+
+    def __contains__(self, game_id: object) -> bool:
+        return game_id in self.__sessions
+
+    def __iter__(self) -> Iterator[GameSession]:
+        return iter(self.__sessions.values())
+
+    def __len__(self) -> int:
+        return len(self.__sessions)
@@ -0,0 +1,35 @@
+import unittest
+from unittest import TestResult
+
+from unit import test_action_request
+from unit import test_session_registry
+
+
+def run_tests(*args, **kwargs) -> TestResult:
+    """
+    Run test suite for one or more test modules.
+
+    :args: One or more modules to test.
+    :keyword verbosity: Test result verbosity, default is 0.
+    :return: Test results.
+    """
+
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+
+    for module in list(args):
+        suite.addTests(loader.loadTestsFromModule(module))
+
+    runner = unittest.TextTestRunner(verbosity=kwargs.get("verbosity", 0))
+    result = runner.run(suite)
+
+    return result
+
+
+if __name__ == "__main__":
+    modules = [
+        test_action_request,
+        test_session_registry
+    ]
+
+    run_tests(*modules)
@@ -0,0 +1,2 @@
+from .test_action_request import TestActionRequestHandler
+from .test_session_registry import TestSessionRegistry
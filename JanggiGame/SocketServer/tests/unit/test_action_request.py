@@ -0,0 +1,72 @@
+import unittest
+from types import SimpleNamespace
+
+from action_request import ActionRequestHandler
+from messages import Message, MessageAction, MessageData, MoveCompleted
+from sessions import SessionRegistry
+
+
+class TestActionRequestHandler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = SimpleNamespace(sessions=SessionRegistry())
+
+    def respond(self, action: MessageAction, data: MessageData = None, game_id: str = "") -> Message:
+        message = Message(action, data if data is not None else MessageData(), game_id)
+        return ActionRequestHandler(message, self.server).create_response()
+
+    def test_new_game_creates_session(self) -> None:
+        # -------------------- Act -------------------- #
+        response = self.respond(MessageAction.NEW_GAME)
+
+        # -------------------- Assert -------------------- #
+        self.assertIs(MessageAction.GAME_STARTED, response.Action)
+        self.assertIn(response.GameId, self.server.sessions)
+        self.assertEqual(32, len(response.Data.Pieces))
+
+    def test_routes_to_game_of_message(self) -> None:
+        # -------------------- Arrange -------------------- #
+        first = self.respond(MessageAction.NEW_GAME).GameId
+        second = self.respond(MessageAction.NEW_GAME).GameId
+
+        # -------------------- Act -------------------- #
+        moved = self.respond(MessageAction.MOVE_COMPLETED, MoveCompleted(Source=[0, 3], Destination=[0, 4]), first)
+        first_status = self.respond(MessageAction.GET_GAME_STATUS, game_id=first)
+        second_status = self.respond(MessageAction.GET_GAME_STATUS, game_id=second)
+
+        # -------------------- Assert -------------------- #
+        self.assertIs(MessageAction.MOVE_CONFIRMED, moved.Action)
+        self.assertEqual(first, moved.GameId)
+        self.assertEqual("RED", first_status.Data.PlayerTurn)
+        self.assertEqual("BLUE", second_status.Data.PlayerTurn)
+        self.assertEqual(second, second_status.GameId)
+
+    def test_end_game_removes_session(self) -> None:
+        # -------------------- Arrange -------------------- #
+        game_id = self.respond(MessageAction.NEW_GAME).GameId
+
+        # -------------------- Act -------------------- #
+        response = self.respond(MessageAction.END_GAME, game_id=game_id)
+
+        # -------------------- Assert -------------------- #
+        self.assertIs(MessageAction.GAME_OVER, response.Action)
+        self.assertNotIn(game_id, self.server.sessions)
+
+    def test_unknown_game(self) -> None:
+        # -------------------- Arrange -------------------- #
+        self.respond(MessageAction.NEW_GAME)
+
+        for game_id in ("", "unknown"):
+            for action in (MessageAction.GET_GAME_STATUS, MessageAction.END_GAME):
+                with self.subTest(game_id=game_id, action=action):
+                    # -------------------- Act -------------------- #
+                    response = self.respond(action, game_id=game_id)
+
+                    # -------------------- Assert -------------------- #
+                    self.assertIs(MessageAction.UNKNOWN_GAME, response.Action)
+                    self.assertEqual(game_id, response.GameId)
+
+        self.assertEqual(1, len(self.server.sessions))
+
+
+if __name__ == "__main__":
+    unittest.main()
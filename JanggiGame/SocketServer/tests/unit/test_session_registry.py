@@ -0,0 +1,90 @@
+import time
+import unittest
+
+from sessions import SessionRegistry
+
+
+class TestSessionRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = SessionRegistry(timeout=60)
+
+    def test_create(self) -> None:
+        # -------------------- Act -------------------- #
+        first = self.registry.create()
+        second = self.registry.create()
+
+        # -------------------- Assert -------------------- #
+        self.assertNotEqual(first.game_id, second.game_id)
+        self.assertIsNot(first.game, second.game)
+        self.assertEqual(2, len(self.registry))
+        self.assertIn(first.game_id, self.registry)
+
+    def test_get(self) -> None:
+        # -------------------- Arrange -------------------- #
+        session = self.registry.create()
+        session.last_active = 0.0
+
+        # -------------------- Act -------------------- #
+        found = self.registry.get(session.game_id)
+
+        # -------------------- Assert -------------------- #
+        self.assertIs(session, found)
+        self.assertGreater(session.last_active, 0.0)
+        self.assertIsNone(self.registry.get("unknown"))
+        self.assertIsNone(self.registry.get(""))
+        self.assertIsNone(self.registry.get(None))
+
+    def test_remove(self) -> None:
+        # -------------------- Arrange -------------------- #
+        session = self.registry.create()
+
+        # -------------------- Act -------------------- #
+        removed = self.registry.remove(session.game_id)
+
+        # -------------------- Assert -------------------- #
+        self.assertIs(session, removed)
+        self.assertIsNone(self.registry.remove(session.game_id))
+        self.assertIsNone(self.registry.get(session.game_id))
+        self.assertEqual(0, len(self.registry))
+
+    def test_expire_idle_sessions(self) -> None:
+        # -------------------- Arrange -------------------- #
+        idle = self.registry.create()
+        active = self.registry.create()
+        idle.last_active = active.last_active = time.monotonic() - 120
+
+        # Activity moves a session to the back of the expiry order.
+        self.registry.get(active.game_id)
+
+        # -------------------- Act -------------------- #
+        expired = self.registry.expire()
+
+        # -------------------- Assert -------------------- #
+        self.assertEqual(1, expired)
+        self.assertNotIn(idle.game_id, self.registry)
+        self.assertIn(active.game_id, self.registry)
+
+    def test_create_expires_idle_sessions(self) -> None:
+        # -------------------- Arrange -------------------- #
+        idle = self.registry.create()
+        idle.last_active -= 120
+
+        # -------------------- Act -------------------- #
+        self.registry.create()
+
+        # -------------------- Assert -------------------- #
+        self.assertNotIn(idle.game_id, self.registry)
+        self.assertEqual(1, len(self.registry))
+
+    def test_no_timeout(self) -> None:
+        # -------------------- Arrange -------------------- #
+        registry = SessionRegistry(timeout=None)
+        registry.create().last_active -= 10 ** 6
+
+        # -------------------- Act/Assert -------------------- #
+        self.assertEqual(0, registry.expire())
+        self.assertEqual(1, len(registry))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,5 +20,6 @@ setup(
     classifiers=classifiers,
     keywords='janggi',
     packages=find_packages(),
-    install_requires=['']
+    install_requires=[''],
+    extras_require={'batch': ['numpy']}
 )